@@ -1,26 +1,21 @@
 import streamlit as st
 import pandas as pd
-import io
 from datetime import datetime
-from cryptography.fernet import Fernet
 import base64
 import json
-import statistics
 import time
-import sys
-import importlib.util
 import traceback
-from category_mapper import render_category_mapper
+from app_resources import once, load_module
+from job_runner import get_job_runner, QUEUED, FINISHED, FAILED
+from multi_site import MultiSiteScraper
+from exporter import EXPORT_FORMATS, RESULT_NUMBER_FORMATS, available_formats, export_bytes, rounded_values
+from recovery_stats import RecoveryStats
 
 
-# Force clear cache and rerun
-st.cache_data.clear()
-st.cache_resource.clear()
-
 # --- Dependency Handling ---
 # Attempt to import the user's custom scraper class. If it fails, show the actual error.
 try:
-    from scraper import AuctionScraper
+    from scraper import AuctionScraper, warm_browsers
     SCRAPER_AVAILABLE = True
 except ImportError as e:
     SCRAPER_AVAILABLE = False
@@ -28,12 +23,12 @@ except ImportError as e:
     st.code(traceback.format_exc())
     
     class AuctionScraper:
-        def __init__(self, gemini_api_keys=None, ui_placeholders=None):
+        def __init__(self, gemini_api_keys=None, ui_placeholders=None, **kwargs):
             self._is_running = False
             self.ui_placeholders = ui_placeholders
             st.toast("Mock Scraper Initialized - scraper.py import failed.")
 
-        def run(self, site_name, url, start, end):
+        def run(self, site_name, url, start, end, resume=False):
             self._is_running = True
             st.toast(f"Mock scraping started for {site_name}...")
             if self.ui_placeholders:
@@ -46,10 +41,10 @@ except ImportError as e:
                     self.ui_placeholders['metrics']['lots'].metric("Lots Scraped", i * 2)
                     self.ui_placeholders['progress'].progress(i)
                     time.sleep(0.02)
-            return [
-                {'Title': 'Sample Item 1 (from Mock Scraper)', 'Current Bid': '$50', 'Retail Price': '$200', 'Recovery': '25.00%'},
-                {'Title': 'Sample Item 2 (from Mock Scraper)', 'Current Bid': '$120', 'Retail Price': '$150', 'Recovery': '80.00%'}
-            ]
+            return pd.DataFrame([
+                {'Title': 'Sample Item 1 (from Mock Scraper)', 'Sold Price': 50.0, 'Retail Price': 200.0, 'Recovery': 25.0},
+                {'Title': 'Sample Item 2 (from Mock Scraper)', 'Sold Price': 120.0, 'Retail Price': 150.0, 'Recovery': 80.0}
+            ])
 
         def stop(self):
             self._is_running = False
@@ -60,45 +55,58 @@ except Exception as e:
     st.code(traceback.format_exc())
     
     class AuctionScraper:
-        def __init__(self, gemini_api_keys=None, ui_placeholders=None):
+        def __init__(self, gemini_api_keys=None, ui_placeholders=None, **kwargs):
             self._is_running = False
             self.ui_placeholders = ui_placeholders
 
-        def run(self, site_name, url, start, end):
+        def run(self, site_name, url, start, end, resume=False):
             return []
 
         def stop(self):
             self._is_running = False
 
-# Attempt to import functions from amazon.py. If it fails, define placeholders.
-try:
-    spec = importlib.util.spec_from_file_location("amazon_module", "amazon.py")
-    amazon_module = importlib.util.module_from_spec(spec)
-    sys.modules["amazon_module"] = amazon_module
-    spec.loader.exec_module(amazon_module)
-    from amazon_module import get_logo_base64, render_upload_tab, render_amazon_grid_tab, render_excel_grid_tab
-    AMAZON_AVAILABLE = True
-except Exception as e:
-    st.error(f"Error loading amazon.py: {type(e).__name__}: {str(e)}")
-    st.code(traceback.format_exc())
-    st.warning("`amazon.py` not found. Using placeholder functions for demonstration.")
-    
-    def get_logo_base64():
-        """Returns a base64 encoded string for a placeholder logo."""
-        return "iVBORw0KGgoAAAANSUhEUgAAAQoAAAApCAYAAAD77MRbAAAAAXNSR0IArs4c6QAAAARnQU1BAACxjwv8YQUAAAAJcEhZcwAADsMAAA7DAcdvqGQAAAHPSURBVHhe7dJBDQAgDAAxAbTj/ycqaKEtKEvcdDkHAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADcsPTZfH/eAwbBGAwAYDAAgMEAAAYDAAAMBgAAgMEAAAYDAAAMBgAAgMEAAAYDAAAMBgAAgMEAAAYDAAAMBgAAgMEAAAYDAAAMBgAAgMEAAAYDAAAMBgAAgMEAAAYDAAAMBgAAgMEAAAYDAAAMBgAAgMEAAAYDAAAMBgAAgMEAAAYDAAAMBgAAgMEAAAYDAAAMBgCAwQAAAAwGAACAwQAAAAwGAACAwQAAAAwGAACAwQAAAAwGAACAwQAAAAwGAACAwQAAAAwGAACAwQAAAAwGAACAwQAAAAwGAAAYDAAAMBgAAgMEAAAYDAAAMBgAAgMEAAAYDAAAMBgAAgMEAAAYDAAAMBgAAgMEAAAYDAAAMBgAAgMEAAAYDAAAMBgAAgMEAgMEAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAGBbfgAByAB2q0Bv/AAAAABJRU5ErkJggg=="
+if SCRAPER_AVAILABLE:
+    # Keep a Chrome launched in the background so the next browser scrape starts warm
+    warm_browsers()
+
+# amazon.py (and the Supabase client it uses) is only loaded when the Amazon view is opened; see amazon_tabs()
+AMAZON_AVAILABLE = True
+
+PLACEHOLDER_LOGO = "iVBORw0KGgoAAAANSUhEUgAAAQoAAAApCAYAAAD77MRbAAAAAXNSR0IArs4c6QAAAARnQU1BAACxjwv8YQUAAAAJcEhZcwAADsMAAA7DAcdvqGQAAAHPSURBVHhe7dJBDQAgDAAxAbTj/ycqaKEtKEvcdDkHAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADcsPTZfH/eAwbBGAwAYDAAgMEAAAYDAAAMBgAAgMEAAAYDAAAMBgAAgMEAAAYDAAAMBgAAgMEAAAYDAAAMBgAAgMEAAAYDAAAMBgAAgMEAAAYDAAAMBgAAgMEAAAYDAAAMBgAAgMEAAAYDAAAMBgAAgMEAAAYDAAAMBgAAgMEAAAYDAAAMBgAAgMEAAAYDAAAMBgCAwQAAAAwGAACAwQAAAAwGAACAwQAAAAwGAACAwQAAAAwGAACAwQAAAAwGAACAwQAAAAwGAACAwQAAAAwGAACAwQAAAAwGAAAYDAAAMBgAAgMEAAAYDAAAMBgAAgMEAAAYDAAAMBgAAgMEAAAYDAAAMBgAAgMEAAAYDAAAMBgAAgMEAAAYDAAAMBgAAgMEAgMEAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAGBbfgAByAB2q0Bv/AAAAABJRU5ErkJggg=="
 
-    def render_upload_tab():
-        st.info("This is the placeholder for the CSV upload functionality.")
-        st.file_uploader("Upload your Amazon CSV here", type=['csv'])
+def get_logo_base64():
+    """Base64 of logo.png for the inline <img> tags, read once per process"""
+    def read_logo():
+        try:
+            with open("logo.png", "rb") as img_file:
+                return base64.b64encode(img_file.read()).decode()
+        except FileNotFoundError:
+            return PLACEHOLDER_LOGO
+    return once("logo_base64", read_logo)
 
-    def render_amazon_grid_tab():
-        st.info("This is the placeholder for the Amazon Image Grid viewer.")
-        st.write("Grid of images from Amazon would be displayed here.")
+def placeholder_upload_tab():
+    st.info("This is the placeholder for the CSV upload functionality.")
+    st.file_uploader("Upload your Amazon CSV here", type=['csv'])
 
-    def render_excel_grid_tab():
-        st.warning("This tab is for Excel files with direct image URLs. Please use the Amazon Grid tab for Amazon products.")
-        st.write("Grid of images from an Excel file would be displayed here.")
-    AMAZON_AVAILABLE = True
+def placeholder_amazon_grid_tab():
+    st.info("This is the placeholder for the Amazon Image Grid viewer.")
+    st.write("Grid of images from Amazon would be displayed here.")
+
+def placeholder_excel_grid_tab():
+    st.warning("This tab is for Excel files with direct image URLs. Please use the Amazon Grid tab for Amazon products.")
+    st.write("Grid of images from an Excel file would be displayed here.")
+
+def amazon_tabs():
+    """amazon.py's three tab renderers (loaded on first use, then reused), or placeholders if it fails to load"""
+    try:
+        amazon_module = load_module("amazon_module", "amazon.py")
+        amazon_module.init_session_state()
+        return amazon_module.render_upload_tab, amazon_module.render_amazon_grid_tab, amazon_module.render_excel_grid_tab
+    except Exception as e:
+        st.error(f"Error loading amazon.py: {type(e).__name__}: {str(e)}")
+        st.code(traceback.format_exc())
+        st.warning("`amazon.py` not found. Using placeholder functions for demonstration.")
+        return placeholder_upload_tab, placeholder_amazon_grid_tab, placeholder_excel_grid_tab
 
 # --- Main Application Code ---
 
@@ -108,17 +116,19 @@ ENCRYPTED_API_KEYS = 'Z0FBQUFBQm96S1RfLUdmTHc1MWgyOHpwRTRKSnNuZEhzQnY5YjJYZnFoYW
 
 def decrypt_gemini_keys():
     """Decrypt the Gemini API keys at runtime"""
-    try:
-        fernet = Fernet(ENCRYPTION_KEY)
-        encrypted_keys = base64.b64decode(ENCRYPTED_API_KEYS.encode())
-        decrypted_json = fernet.decrypt(encrypted_keys).decode()
-        return json.loads(decrypted_json)
-    except Exception as e:
-        st.error(f"Failed to decrypt API keys: {str(e)}")
-        return []
+    from cryptography.fernet import Fernet
+
+    fernet = Fernet(ENCRYPTION_KEY)
+    encrypted_keys = base64.b64decode(ENCRYPTED_API_KEYS.encode())
+    decrypted_json = fernet.decrypt(encrypted_keys).decode()
+    return json.loads(decrypted_json)
 
-# Decrypt API keys at startup
-GEMINI_API_KEYS = decrypt_gemini_keys()
+# Decrypted on the first run only; every later rerun reuses the same list
+try:
+    GEMINI_API_KEYS = once("gemini_api_keys", decrypt_gemini_keys)
+except Exception as e:
+    st.error(f"Failed to decrypt API keys: {str(e)}")
+    GEMINI_API_KEYS = []
 
 # Page Configuration
 st.set_page_config(
@@ -651,12 +661,13 @@ if 'authenticated' not in st.session_state:
     st.session_state.authenticated = False
 if 'current_view' not in st.session_state:
     st.session_state.current_view = 'home'
-if 'is_scraping' not in st.session_state:
-    st.session_state.is_scraping = False
 if 'results_df' not in st.session_state:
     st.session_state.results_df = pd.DataFrame()
-if 'scraper_instance' not in st.session_state:
-    st.session_state.scraper_instance = None
+# site name -> ID of the background scrape job this session is watching (see job_runner.py)
+if 'scrape_jobs' not in st.session_state:
+    st.session_state.scrape_jobs = {}
+if 'collected_jobs' not in st.session_state:
+    st.session_state.collected_jobs = set()
 if 'sidebar_visible' not in st.session_state:
     st.session_state.sidebar_visible = True
 
@@ -721,46 +732,97 @@ def create_page_header(title, subtitle, icon=""):
     </div>
     """, unsafe_allow_html=True)
 
-def to_excel(df: pd.DataFrame, site_name: str):
-    output = io.BytesIO()
-    with pd.ExcelWriter(output, engine='openpyxl') as writer:
-        df.to_excel(writer, index=False, sheet_name='Auction Data')
-        if not df.empty and 'Recovery' in df.columns:
-            percentages = [float(str(r).replace('%', '')) for r in df['Recovery'] if str(r).replace('%', '').replace('.', '', 1).isdigit()]
-            if percentages:
-                summary_data = [
-                    ['Total Items', len(df)],
-                    ['Average Recovery', f"{statistics.mean(percentages):.2f}%"],
-                    ['Highest Recovery', f"{max(percentages):.2f}%"],
-                    ['Lowest Recovery', f"{min(percentages):.2f}%"],
-                    ['Export Date', datetime.now().strftime("%Y-%m-%d %H:%M:%S")],
-                    ['Site', site_name]
-                ]
-                summary_df = pd.DataFrame(summary_data, columns=['Metric', 'Value'])
-                summary_df.to_excel(writer, index=False, sheet_name='Summary')
-    return output.getvalue()
-
-def stop_scraping():
-    if st.session_state.scraper_instance:
-        st.session_state.scraper_instance.stop()
-    st.session_state.is_scraping = False
-    st.session_state.scraper_instance = None
+# Results keep prices and recovery as numbers; these only decide how they are shown
+RESULT_COLUMN_CONFIG = {
+    'Sold Price': st.column_config.NumberColumn(format="dollar"),
+    'Retail Price': st.column_config.NumberColumn(format="dollar"),
+    'Recovery': st.column_config.NumberColumn(format="%.1f%%"),
+    'Average Recovery': st.column_config.NumberColumn(format="%.1f%%"),
+    **{column: st.column_config.NumberColumn(format="%.1f%%") for column in ('Std Dev', 'Min', 'P10', 'P50', 'P90', 'Max')},
+}
+
+def show_results_table(placeholder, df):
+    placeholder.dataframe(df, column_config=RESULT_COLUMN_CONFIG, use_container_width=True)
+
+def results_summary(df, site_name, stats):
+    overall = stats.overall
+    if not overall.count:
+        return None
+    summary_data = [
+        ['Total Items', len(df)],
+        ['Average Recovery', f"{overall.mean:.2f}%"],
+        ['Median Recovery', f"{overall.quantile(0.5):.2f}%"],
+        ['P10 / P90 Recovery', f"{overall.quantile(0.1):.2f}% / {overall.quantile(0.9):.2f}%"],
+        ['Recovery Std Dev', f"{overall.std:.2f}%"],
+        ['Highest Recovery', f"{overall.max:.2f}%"],
+        ['Lowest Recovery', f"{overall.min:.2f}%"],
+        ['Export Date', datetime.now().strftime("%Y-%m-%d %H:%M:%S")],
+        ['Site', site_name]
+    ]
+    return pd.DataFrame(summary_data, columns=['Metric', 'Value'])
+
+def export_results(df: pd.DataFrame, site_name: str, fmt="xlsx", stats=None):
+    """
+    Results file in the given exporter format. Excel also gets a Summary sheet
+    and a per-site / per-category breakdown, taken from the scraper's running
+    RecoveryStats when there are any (only tables without them are rescanned).
+    """
+    df = rounded_values(df)
+    if fmt != "xlsx":
+        return export_bytes(df, fmt)
+    stats = stats if stats is not None else RecoveryStats.from_frame(df)
+    summary_df = results_summary(df, site_name, stats)
+    extra_sheets = None
+    if summary_df is not None:
+        breakdown = stats.summary_frame().round(2)
+        extra_sheets = {'Summary': summary_df, 'Recovery Breakdown': breakdown}
+    return export_bytes(
+        df, "xlsx", sheet_name='Auction Data', number_formats=RESULT_NUMBER_FORMATS, extra_sheets=extra_sheets
+    )
+
+def attached_job(site_name):
+    job_id = st.session_state.scrape_jobs.get(site_name)
+    return get_job_runner().get(job_id) if job_id else None
+
+def attach_job(site_name, job_id):
+    st.session_state.scrape_jobs[site_name] = job_id
+    st.session_state.collected_jobs.discard(job_id)
+    st.query_params["job"] = job_id
+
+def is_scraping(site_name):
+    job = attached_job(site_name)
+    return job is not None and job.running
+
+def stop_scraping(site_name):
+    job = attached_job(site_name)
+    if job:
+        job.stop()
 
 def display_results(site_name):
     if not st.session_state.results_df.empty:
         st.markdown("---")
         st.markdown(f'<h3 style="color: var(--text-color-dark);">📊 {site_name} Scraping Results</h3>', unsafe_allow_html=True)
-        st.dataframe(st.session_state.results_df, use_container_width=True)
-        excel_data = to_excel(st.session_state.results_df, site_name)
+        show_results_table(st, st.session_state.results_df)
+        fmt = st.selectbox(
+            "Export format", available_formats(), format_func=lambda f: EXPORT_FORMATS[f][0], key=f'export_format_{site_name}'
+        )
+        label, extension, mime, _ = EXPORT_FORMATS[fmt]
+        # Reruns reuse the last export of the same table instead of writing it again
+        export_key = (site_name, fmt, id(st.session_state.results_df), len(st.session_state.results_df))
+        if st.session_state.get('export_cache', (None,))[0] != export_key:
+            st.session_state.export_cache = (export_key, export_results(
+                st.session_state.results_df, site_name, fmt, stats=st.session_state.get('results_stats')
+            ))
         st.download_button(
-            label=f"Download Results as Excel",
-            data=excel_data,
-            file_name= f"{site_name.replace('.', '')}_data_{datetime.now().strftime('%Y%m%d')}.xlsx",
-            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+            label=f"Download Results as {label}",
+            data=st.session_state.export_cache[1],
+            file_name= f"{site_name.replace('.', '')}_data_{datetime.now().strftime('%Y%m%d')}.{extension}",
+            mime=mime,
             use_container_width=True
         )
 
-def create_scraper_ui(site_name, placeholder_url, is_ai=False, special_note=None):
+def create_scraper_ui(site_name, placeholder_url, is_ai=False, special_note=None, parallel_browsers=False, page_cache=False,
+                      data_feed=False):
     if is_ai:
         create_page_header(f"{site_name} AI-Powered Auction Scraper", "Uses Google Gemini AI to find retail prices from product images", icon="🤖")
     else:
@@ -775,52 +837,199 @@ def create_scraper_ui(site_name, placeholder_url, is_ai=False, special_note=None
         start_page = col1.number_input("📄 Start Page", min_value=1, value=1, step=1, key=f'start_{site_name}')
         end_page = col2.number_input("📚 End Page (0 for no limit)", min_value=0, value=0, step=1, key=f'end_{site_name}')
         
+        browser_pool_size = 1
+        if parallel_browsers:
+            browser_pool_size = st.number_input(
+                "🌐 Parallel Browsers", min_value=1, max_value=4, value=1, step=1, key=f'browsers_{site_name}',
+                help="Load several listing pages at once, one Chrome per page"
+            )
+
+        use_http_cache = False
+        if page_cache:
+            use_http_cache = st.checkbox(
+                "♻️ Reuse cached pages", value=False, key=f'cache_{site_name}',
+                help="Serve pages fetched by earlier runs from a local disk cache (revalidated once they expire)"
+            )
+
+        network_capture = False
+        if data_feed:
+            network_capture = st.checkbox(
+                "📡 Read the site's data feed", value=False, key=f'feed_{site_name}',
+                help="Take lots from the JSON the site's pages load instead of parsing the rendered page (falls back to the page if the feed cannot be read)"
+            )
+
+        resume = st.checkbox(
+            "⏯️ Resume interrupted run", value=False, key=f'resume_{site_name}',
+            help="Continue this URL from its last checkpoint (with the lots already scraped) instead of the start page"
+        )
+
         if is_ai:
             st.info("ℹ️ AI-powered price detection is enabled with built-in Gemini API keys.")
         
         submitted = st.form_submit_button(
-            f"🚀 Start {site_name} Scraping", use_container_width=True, disabled=st.session_state.is_scraping
+            f"🚀 Start {site_name} Scraping", use_container_width=True, disabled=is_scraping(site_name)
         )
-    return submitted, url, start_page, end_page
+    return submitted, url, start_page, end_page, browser_pool_size, use_http_cache, network_capture, resume
+
+AI_SITES = ['HiBid', 'BiddingKings', 'BidLlama']
+MULTI_SITE_NAME = "Multi-Site"
 
-def run_scraper(site_name, url, start_page, end_page, requires_ai=True):
+def run_scraper(site_name, url, start_page, end_page, requires_ai=True, browser_pool_size=1, use_http_cache=False,
+                network_capture=False, resume=False):
+    """Start the scrape as a background job and attach this session to it"""
     if not url:
         st.error("Please enter a valid URL.")
         return
     
-    st.session_state.is_scraping = True
+    scraper_api_keys = GEMINI_API_KEYS if requires_ai else []
+
+    def make_scraper(ui_placeholders):
+        return AuctionScraper(
+            gemini_api_keys=scraper_api_keys, ui_placeholders=ui_placeholders,
+            browser_pool_size=browser_pool_size, use_http_cache=use_http_cache, network_capture=network_capture
+        )
+
+    job = get_job_runner().submit(site_name, url, start_page, end_page, make_scraper, resume=resume)
+    attach_job(site_name, job.id)
     st.session_state.results_df = pd.DataFrame()
+    st.session_state.results_stats = None
+    st.rerun()
 
+def render_job(job, requires_ai):
+    """Draw a job's progress widgets from the newest event of each placeholder"""
     status_placeholder = st.empty()
     progress_placeholder = st.empty()
-    metric_cols = st.columns(3)
-    pages_metric, lots_metric, recovery_metric = metric_cols[0].empty(), metric_cols[1].empty(), metric_cols[2].empty()
+    metric_cols = st.columns(4 if requires_ai else 3)
+    placeholders = {
+        'status': status_placeholder, 'progress': progress_placeholder,
+        'metrics.pages': metric_cols[0].empty(), 'metrics.lots': metric_cols[1].empty(),
+        'metrics.recovery': metric_cols[2].empty()
+    }
+    if requires_ai:
+        placeholders['metrics.cache'] = metric_cols[3].empty()
     dataframe_placeholder = st.empty()
+    placeholders['dataframe'] = dataframe_placeholder
 
-    pages_metric.metric("Pages Scraped", 0)
-    lots_metric.metric("Lots Scraped", 0)
-    recovery_metric.metric("Average Recovery", "0%")
+    placeholders['metrics.pages'].metric("Pages Scraped", 0)
+    placeholders['metrics.lots'].metric("Lots Scraped", 0)
+    placeholders['metrics.recovery'].metric("Average Recovery", "0%")
+    if requires_ai:
+        placeholders['metrics.cache'].metric("AI Cache Hits", "0/0")
     progress_placeholder.progress(0)
+    if job.status == QUEUED:
+        status_placeholder.info(f"Job {job.id} is queued - it starts when a running scrape finishes.")
+
+    for key, (method, args, kwargs) in job.poll().items():
+        if key == 'dataframe' and method == 'dataframe':
+            show_results_table(dataframe_placeholder, args[0])
+        elif key in placeholders:
+            getattr(placeholders[key], method)(*args, **kwargs)
+
+    if job.status == FINISHED:
+        status_placeholder.success(f"Scraping complete! Found {job.lots} items.")
+    elif job.status == FAILED:
+        status_placeholder.error(f"An error occurred during scraping: {job.error.splitlines()[0]}")
+        st.code(job.error)
+    elif not job.running:
+        status_placeholder.warning(f"Scraping stopped. Kept {job.lots} items.")
+
+    site_summary = getattr(getattr(job.scraper, 'results', None), 'site_summary', None)
+    if site_summary:
+        st.dataframe(site_summary(), column_config=RESULT_COLUMN_CONFIG, hide_index=True, use_container_width=True)
+
+@st.fragment(run_every=1.0)
+def show_running_job(site_name, requires_ai):
+    job = attached_job(site_name)
+    if job is None:
+        return
+    render_job(job, requires_ai)
+    if job.running:
+        st.button("🛑 Stop Scraping", on_click=stop_scraping, args=(site_name,), key=f'stop_{job.id}', use_container_width=True)
+    else:
+        # Rerun the whole page so the results and download button appear
+        st.rerun()
+
+def show_scrape_job(site_name, requires_ai):
+    """Progress of the job this session is attached to for site_name (polled while it runs)"""
+    job_id = st.query_params.get("job")
+    if site_name not in st.session_state.scrape_jobs and job_id:
+        job = get_job_runner().get(job_id)
+        if job and job.site_name == site_name:
+            attach_job(site_name, job_id)
+
+    job = attached_job(site_name)
+    if job is None:
+        return
+    if job.running:
+        show_running_job(site_name, requires_ai)
+        return
     
-    ui_placeholders = {
-        'status': status_placeholder, 'progress': progress_placeholder, 'dataframe': dataframe_placeholder,
-        'metrics': {'pages': pages_metric, 'lots': lots_metric, 'recovery': recovery_metric}
-    }
+    render_job(job, requires_ai)
+    if job.id not in st.session_state.collected_jobs:
+        st.session_state.collected_jobs.add(job.id)
+        st.session_state.results_df = pd.DataFrame(job.results) if job.results is not None else pd.DataFrame()
+        st.session_state.results_stats = getattr(getattr(job.scraper, 'results', None), 'stats', None)
+
+def show_job_list(site_name):
+    """Every background job for this site in this deployment, with a way to reattach"""
+    jobs = get_job_runner().jobs(site_name)
+    if not jobs:
+        return
+    attached = st.session_state.scrape_jobs.get(site_name)
+    with st.expander(f"🗂️ Background jobs ({sum(job.running for job in jobs)} running)"):
+        for job in jobs:
+            col1, col2 = st.columns([4, 1])
+            started = datetime.fromtimestamp(job.created_at).strftime('%H:%M:%S')
+            col1.markdown(f"`{job.id}` **{job.status}** - {job.lots} lots - started {started}  \n{job.description}")
+            if job.id != attached and col2.button("Attach", key=f'attach_{job.id}', use_container_width=True):
+                attach_job(site_name, job.id)
+                st.rerun()
+
+def show_multi_site_scraper(site_names):
+    """Several sites in one background job, merged into one site-tagged table"""
+    create_page_header("Multi-Site Scraper", "Scrape several auction sites at once into one combined, site-tagged report", icon="🧩")
     
-    scraper_api_keys = GEMINI_API_KEYS if requires_ai else []
-    st.session_state.scraper_instance = AuctionScraper(gemini_api_keys=scraper_api_keys, ui_placeholders=ui_placeholders)
+    sites = st.multiselect(
+        "🌐 Sites", options=site_names, default=['Nellis', 'BidFTA', 'A-Stock', '702Auctions'], key='multi_sites'
+    )
+    with st.form(key='multi_site_form'):
+        urls = {site: st.text_input(f"🔗 {site} URL", placeholder=f"Enter {site} auction URL...", key=f'multi_url_{site}')
+                for site in sites}
+        col1, col2 = st.columns(2)
+        start_page = col1.number_input("📄 Start Page", min_value=1, value=1, step=1, key='multi_start')
+        end_page = col2.number_input("📚 End Page (0 for no limit)", min_value=0, value=0, step=1, key='multi_end')
+        use_http_cache = st.checkbox("♻️ Reuse cached pages", value=False, key='multi_cache',
+                                     help="Serve pages fetched by earlier runs from a local disk cache")
+        resume = st.checkbox("⏯️ Resume interrupted run", value=False, key='multi_resume',
+                             help="Each site continues from its own last checkpoint")
+        submitted = st.form_submit_button(
+            "🚀 Start Multi-Site Scraping", use_container_width=True, disabled=is_scraping(MULTI_SITE_NAME)
+        )
     
-    try:
-        results = st.session_state.scraper_instance.run(site_name, url, start_page, end_page)
-        st.session_state.results_df = pd.DataFrame(results) if results else pd.DataFrame()
-        if st.session_state.scraper_instance._is_running:
-            status_placeholder.success(f"Scraping complete! Found {len(results)} items.")
-    except Exception as e:
-        status_placeholder.error(f"An error occurred during scraping: {str(e)}")
-        st.code(traceback.format_exc())
+    if submitted:
+        targets = [(site, urls[site]) for site in sites if urls[site]]
+        if not targets:
+            st.error("Please enter a URL for at least one site.")
+        else:
+            def make_site_scraper(site, ui_placeholders, results):
+                return AuctionScraper(
+                    gemini_api_keys=GEMINI_API_KEYS if site in AI_SITES else [], ui_placeholders=ui_placeholders,
+                    use_http_cache=use_http_cache, results=results
+                )
+
+            job = get_job_runner().submit(
+                MULTI_SITE_NAME, targets, start_page, end_page,
+                lambda ui_placeholders: MultiSiteScraper(make_site_scraper, ui_placeholders), resume=resume
+            )
+            attach_job(MULTI_SITE_NAME, job.id)
+            st.session_state.results_df = pd.DataFrame()
+            st.session_state.results_stats = None
+            st.rerun()
     
-    st.session_state.is_scraping = False
-    st.rerun()
+    job = attached_job(MULTI_SITE_NAME)
+    show_scrape_job(MULTI_SITE_NAME, job is not None and any(site in AI_SITES for site, _ in job.url))
+    show_job_list(MULTI_SITE_NAME)
+    display_results(MULTI_SITE_NAME)
 
 def show_welcome():
     # Main Header Card
@@ -881,6 +1090,7 @@ def show_amazon_environment():
     
     create_page_header("Amazon Product Image Viewer", "Upload and manage product image catalogs with advanced grid visualization", icon="📦")
     
+    render_upload_tab, render_amazon_grid_tab, render_excel_grid_tab = amazon_tabs()
     tab1, tab2, tab3 = st.tabs(["📤 Upload CSV", "📦 Amazon Grid Images", "📋 Excel Grid Images"])
     with tab1:
         render_upload_tab()
@@ -939,6 +1149,7 @@ else:
         if st.button("🌄 Vista Scraper", key="vista_btn", use_container_width=True): st.session_state.current_view = 'vista'; st.rerun()
         if st.button("💎 BidSoflo Scraper", key="bidsoflo_btn", use_container_width=True): st.session_state.current_view = 'bidsoflo'; st.rerun()
         if st.button("🛒 BidAuctionDepot Scraper", key="bidauctiondepot_btn", use_container_width=True): st.session_state.current_view = 'bidauctiondepot'; st.rerun()
+        if st.button("🧩 Multi-Site Scraper", key="multi_site_btn", use_container_width=True): st.session_state.current_view = 'multi_site'; st.rerun()
             
         st.markdown('<hr style="margin: 2rem 0; border-color: var(--sidebar-border);">', unsafe_allow_html=True)
         if st.button("🚪 Logout", key="logout_btn", use_container_width=True): st.session_state.authenticated = False; st.session_state.current_view = 'home'; st.rerun()
@@ -957,24 +1168,33 @@ else:
     elif view == 'amazon': 
         show_amazon_environment()
     elif view == 'category_mapper':
+        # Imported here so the OpenAI SDK only loads once someone opens the mapper
+        from category_mapper import render_category_mapper
         create_page_header("Category Mapper", "AI-powered product categorization using GPT", icon="🏷️")
         render_category_mapper()
+    elif view == 'multi_site':
+        show_multi_site_scraper(list(view_name_map.values()))
 
     elif view in view_name_map:
         site_name = view_name_map[view]
-        is_ai = view in ['hibid', 'biddingkings', 'bidllama']
+        is_ai = site_name in AI_SITES
         placeholder = f"Enter {site_name} auction URL..."
         
         special_note = None
         if view in ['702auctions', 'vista']:
             special_note = "Pages start from 0 internally. Use 'Start Page' input."
         
-        submitted, url, start, end = create_scraper_ui(site_name, placeholder, is_ai=is_ai, special_note=special_note)
+        submitted, url, start, end, browsers, use_cache, use_feed, resume = create_scraper_ui(
+            site_name, placeholder, is_ai=is_ai, special_note=special_note,
+            parallel_browsers=view in ['hibid', 'vista'],
+            page_cache=view in ['nellis', 'bidfta', 'astock', '702auctions'],
+            data_feed=view in ['hibid']
+        )
         
         if submitted: 
-            run_scraper(site_name, url, start, end, requires_ai=is_ai)
-        
-        if st.session_state.is_scraping:
-            st.button("🛑 Stop Scraping", on_click=stop_scraping, use_container_width=True)
+            run_scraper(site_name, url, start, end, requires_ai=is_ai, browser_pool_size=browsers,
+                        use_http_cache=use_cache, network_capture=use_feed, resume=resume)
         
+        show_scrape_job(site_name, is_ai)
+        show_job_list(site_name)
         display_results(site_name)
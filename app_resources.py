@@ -0,0 +1,87 @@
+"""
+App Resources Module
+Slow setup the Streamlit app does once per process and reuses on every rerun.
+
+Streamlit runs app.py from the top on every interaction, but imported
+modules stay loaded between runs. once() keeps a value built by the first
+run that asks for it (exec'ing amazon.py, decrypting the Gemini keys,
+reading the logo) in this module, so every later rerun, from any session,
+gets the same object back. Site SDKs (Selenium, google-genai, OpenAI,
+Supabase) are imported by the code that uses them, so a view that is never
+opened never loads them. rerun_benchmark.py measures app.py run times.
+
+API clients (Gemini, OpenAI, the Zyte HTTP session) are shared per key
+through shared_client(), from Streamlit runs and worker threads alike; the
+Supabase client is an st.cache_resource. Reads of shared data are
+st.cache_data functions that take the dataset's data_version() as an
+argument: code that writes the data calls invalidate(), the next read gets
+a new key and goes to the source, and nothing else ever clears a cache.
+DATA_CACHE_TTL bounds how stale a read can get when another process
+writes.
+"""
+
+import os
+import sys
+import threading
+import importlib.util
+
+from rate_limiter import credential_key
+
+# Seconds a cached read of shared data is kept even without an invalidate() (for writes by other processes)
+DATA_CACHE_TTL = int(os.getenv("DATA_CACHE_TTL", "300"))
+
+_resources = {}
+# name -> lock held only while that one value is being built
+_build_locks = {}
+_lock = threading.Lock()
+_versions = {}
+_versions_lock = threading.Lock()
+
+
+def once(name, build):
+    """build() the first time name is asked for, the same object after that (failures are not kept)"""
+    with _lock:
+        build_lock = _build_locks.setdefault(name, threading.Lock())
+    # Only callers of the same name wait for a build; other names (and a build() that
+    # calls once() for something else) go ahead
+    with build_lock:
+        if name not in _resources:
+            _resources[name] = build()
+        return _resources[name]
+
+
+def load_module(name, path):
+    """Import the file at path as module name on first use; later calls return the loaded module"""
+    def load():
+        spec = importlib.util.spec_from_file_location(name, path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            sys.modules.pop(name, None)
+            raise
+        return module
+    return once(f"module:{name}", load)
+
+
+def shared_client(service, api_key, build):
+    """The process-wide client for one service credential, made with build() on first use"""
+    name = ("client", credential_key(service, api_key))
+    # Worker threads look their client up on every lane / call; once built that takes no lock at all
+    client = _resources.get(name)
+    if client is None:
+        client = once(name, build)
+    return client
+
+
+def data_version(dataset):
+    """Current version of a shared dataset, to pass as an argument to the st.cache_data functions that read it"""
+    with _versions_lock:
+        return _versions.get(dataset, 0)
+
+
+def invalidate(dataset):
+    """Call after writing to a dataset: cached reads keyed with an older version are not used again"""
+    with _versions_lock:
+        _versions[dataset] = _versions.get(dataset, 0) + 1
@@ -0,0 +1,96 @@
+"""
+Blocking Benchmark
+Page-load time and bytes transferred for a site's listing pages with resource blocking off and on.
+
+    python blocking_benchmark.py --site HiBid --url "https://hibid.com/catalog/..." [--pages 3] [--settle 2]
+
+Each mode gets its own fresh headless Chrome with the browser cache
+disabled. Load time is from driver.get() until the adapter's ready
+selector is stable (the same wait the scraper uses). Bytes are the encoded
+sizes of every response from the DevTools Network events, counted after a
+short settle period so late requests are included; "blocked" counts
+requests Chrome refused because of the blocking rules.
+"""
+
+import sys
+import time
+import argparse
+
+from browser_pool import launch_chrome, quit_chrome
+from network_capture import network_events
+from page_ready import wait_until_ready
+from resource_blocking import DEFAULT_BLOCKED_RESOURCES, RESOURCE_URL_PATTERNS
+from site_adapters import SITE_ADAPTERS, with_scheme
+
+
+def listing_urls(adapter, pages):
+    if adapter.pagination == "numbered":
+        return [(page, adapter.page_url(page)) for page in range(1, pages + 1) if adapter.page_url(page)]
+    # next-link and custom sites: only the first page has a URL of its own
+    return [(1, with_scheme(adapter.first_url()))]
+
+
+def measure_page(driver, adapter, url, settle):
+    list(network_events(driver))
+    start = time.perf_counter()
+    driver.get(url)
+    if adapter.ready_selector:
+        wait_until_ready(driver, adapter.name, adapter.ready_selector, max_timeout=adapter.ready_timeout)
+    elapsed = time.perf_counter() - start
+    time.sleep(settle)
+
+    requests = blocked = transferred = 0
+    for method, params in network_events(driver):
+        if method == 'Network.requestWillBeSent':
+            requests += 1
+        elif method == 'Network.loadingFinished':
+            transferred += params.get('encodedDataLength', 0)
+        elif method == 'Network.loadingFailed' and params.get('blockedReason'):
+            blocked += 1
+    return elapsed, requests, blocked, transferred
+
+
+def run_mode(adapter, urls, blocking, settle):
+    driver = launch_chrome(timeout=60, capture_network=True, blocking=blocking)
+    if driver is None:
+        raise RuntimeError("No free Chrome slot")
+    try:
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setCacheDisabled', {'cacheDisabled': True})
+        return [(page, measure_page(driver, adapter, url, settle)) for page, url in urls]
+    finally:
+        quit_chrome(driver)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure resource blocking on a browser site")
+    parser.add_argument("--site", required=True, choices=[name for name, cls in SITE_ADAPTERS.items() if cls.uses_browser])
+    parser.add_argument("--url", required=True, help="listing URL as entered in the app")
+    parser.add_argument("--pages", type=int, default=2, help="numbered listing pages to load per mode")
+    parser.add_argument("--settle", type=float, default=2.0, help="seconds to keep counting traffic after the page is ready")
+    parser.add_argument("--block", nargs="+", choices=sorted(RESOURCE_URL_PATTERNS),
+                        help="categories to block (default: the site's own blocked_resources)")
+    args = parser.parse_args()
+
+    adapter = SITE_ADAPTERS[args.site](args.url)
+    categories = tuple(args.block or adapter.blocked_resources or DEFAULT_BLOCKED_RESOURCES)
+    urls = listing_urls(adapter, args.pages)
+    print(f"{args.site}: {len(urls)} pages, blocking {', '.join(categories + tuple(adapter.blocked_urls))}\n")
+    print(f"{'mode':<6} {'page':>5} {'seconds':>9} {'requests':>9} {'blocked':>8} {'MB':>8}")
+
+    totals = {}
+    for mode, blocking in (("off", None), ("on", (categories, tuple(adapter.blocked_urls)))):
+        results = run_mode(adapter, urls, blocking, args.settle)
+        for page, (elapsed, requests, blocked, transferred) in results:
+            print(f"{mode:<6} {page:>5} {elapsed:>9.2f} {requests:>9} {blocked:>8} {transferred / 1e6:>8.2f}")
+            sys.stdout.flush()
+        totals[mode] = (sum(r[0] for _, r in results), sum(r[3] for _, r in results))
+
+    (time_off, bytes_off), (time_on, bytes_on) = totals["off"], totals["on"]
+    print(f"\nBlocking on: {time_on:.1f}s vs {time_off:.1f}s load time, "
+          f"{bytes_on / 1e6:.2f} MB vs {bytes_off / 1e6:.2f} MB transferred"
+          + (f" ({100 * (1 - bytes_on / bytes_off):.0f}% less)" if bytes_off else ""))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,446 @@
+"""
+Browser Pool Module
+Parallel page loading for the Selenium scrapers.
+
+Every Chrome started by the app goes through launch_chrome(), which counts
+against a process-wide cap (MAX_CHROME_PROCESSES) so concurrent scrapes
+cannot spawn an unbounded number of browsers. Scrapes lease their browsers
+from the process-wide DriverPool, which keeps a few launched drivers warm
+between runs and replaces a driver once it has loaded DRIVER_MAX_PAGES
+pages or grown past its memory limit. BrowserPool drives several leased
+browsers at once, giving each one its own page number, for sites whose
+listing URLs take a page parameter (HiBid apage=, Vista ?page=).
+"""
+
+import os
+import time
+import queue
+import atexit
+import threading
+import traceback
+import concurrent.futures
+from collections import deque
+
+from network_capture import enable_performance_log
+from resource_blocking import apply_blocking, chrome_prefs
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+MAX_CHROME_PROCESSES = int(os.getenv("MAX_CHROME_PROCESSES", "4"))
+PAGE_LOAD_TIMEOUT = 60
+
+# Idle drivers kept launched between runs (and pre-launched by DriverPool.warm_up)
+WARM_DRIVERS = int(os.getenv("WARM_CHROME_DRIVERS", "1"))
+# A leased driver is replaced after this many page loads...
+DRIVER_MAX_PAGES = int(os.getenv("CHROME_MAX_PAGES", "300"))
+# ...or once Chrome's processes use this much memory (with psutil; otherwise the page's JS heap limit applies)
+DRIVER_MAX_MEMORY_MB = int(os.getenv("CHROME_MAX_MEMORY_MB", "1500"))
+DRIVER_MAX_HEAP_MB = int(os.getenv("CHROME_MAX_HEAP_MB", "400"))
+# Memory is sampled every this many page loads
+MEMORY_CHECK_PAGES = 10
+# A waiting lease re-checks at least this often (slots can also be freed outside the pool)
+LEASE_POLL_SECONDS = 1.0
+
+_chrome_slots = threading.BoundedSemaphore(MAX_CHROME_PROCESSES)
+_chrome_drivers = set()
+_chrome_lock = threading.Lock()
+# undetected_chromedriver patches its driver binary on launch; concurrent launches race on that file
+_launch_lock = threading.Lock()
+
+
+def launch_chrome(timeout=None, capture_network=False, blocking=None):
+    """
+    Start a headless undetected Chrome counted against MAX_CHROME_PROCESSES.
+    Returns None if no slot frees up within timeout (None = wait forever).
+    capture_network keeps DevTools Network events for network_capture;
+    blocking is a resource_blocking rule set (resources the pages never load).
+    """
+    if not _chrome_slots.acquire(timeout=timeout):
+        return None
+    try:
+        import undetected_chromedriver as uc
+
+        options = uc.ChromeOptions()
+        options.add_argument('--headless=new')
+        options.add_argument('--no-sandbox')
+        options.add_argument('--disable-dev-shm-usage')
+        options.add_argument('--disable-blink-features=AutomationControlled')
+        if capture_network:
+            enable_performance_log(options)
+        prefs = chrome_prefs(blocking)
+        if prefs:
+            options.add_experimental_option('prefs', prefs)
+
+        with _launch_lock:
+            driver = uc.Chrome(options=options, version_main=None)
+        driver.set_page_load_timeout(PAGE_LOAD_TIMEOUT)
+        if blocking:
+            try:
+                print(f"Blocking {apply_blocking(driver, blocking)} resource URL patterns")
+            except Exception as e:
+                print(f"Could not set up resource blocking: {e}")
+    except Exception:
+        _chrome_slots.release()
+        raise
+    with _chrome_lock:
+        _chrome_drivers.add(id(driver))
+    return driver
+
+
+def quit_chrome(driver):
+    """Quit a driver from launch_chrome and free its slot (safe to call more than once)"""
+    if driver is None:
+        return
+    with _chrome_lock:
+        owned = id(driver) in _chrome_drivers
+        _chrome_drivers.discard(id(driver))
+    try:
+        driver.quit()
+    finally:
+        if owned:
+            _chrome_slots.release()
+
+
+class DriverPool:
+    """
+    Process-wide pool of launched Chrome drivers.
+
+    lease() hands out an idle driver launched with the same options when
+    there is one (health-checked, blocking rules re-applied), otherwise a
+    new one; release() resets a healthy driver to a blank page without
+    cookies and keeps it idle for the next run (up to warm_drivers),
+    quitting the rest. Idle drivers hold Chrome slots, so a launch that
+    finds no free slot quits idle ones first; when there is nothing to
+    quit, lease() waits for release() / discard() and looks again.
+    """
+
+    def __init__(self, warm_drivers=WARM_DRIVERS, max_pages=DRIVER_MAX_PAGES):
+        self.warm_drivers = max(0, warm_drivers)
+        self.max_pages = max_pages
+        self._idle = deque()
+        self._leased = {}
+        self._lock = threading.Lock()
+        # Notified (and _generation bumped) whenever a driver goes idle or a slot is freed
+        self._changed = threading.Condition(self._lock)
+        self._generation = 0
+        self._warming = False
+
+    @staticmethod
+    def launch_key(capture_network, blocking):
+        """Options fixed when Chrome starts; drivers are only reused for the same ones"""
+        return bool(capture_network), bool(chrome_prefs(blocking))
+
+    def lease(self, timeout=None, capture_network=False, blocking=None):
+        """A ready driver for these options, or None if no Chrome slot frees up within timeout"""
+        key = self.launch_key(capture_network, blocking)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._lock:
+                generation = self._generation
+            driver = self._take_idle(key, capture_network, blocking)
+            if driver is None:
+                driver = launch_chrome(timeout=0, capture_network=capture_network, blocking=blocking)
+                while driver is None and self._evict_idle():
+                    driver = launch_chrome(timeout=0, capture_network=capture_network, blocking=blocking)
+            if driver is not None:
+                self._track(driver, capture_network, blocking)
+                return driver
+
+            # Every slot is leased out: wait for one to come back idle or be freed, then look again
+            with self._changed:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return None
+                if self._generation == generation:
+                    self._changed.wait(LEASE_POLL_SECONDS if remaining is None else min(remaining, LEASE_POLL_SECONDS))
+
+    def _take_idle(self, key, capture_network, blocking):
+        """A healthy idle driver launched with key, set up for this lease, or None"""
+        while True:
+            with self._lock:
+                driver = next((d for k, d in self._idle if k == key), None)
+                if driver is not None:
+                    self._idle.remove((key, driver))
+            if driver is None:
+                return None
+            if self._prepare(driver, capture_network, blocking):
+                print("Reusing a warm browser")
+                return driver
+            quit_chrome(driver)
+            self._notify()
+
+    def release(self, driver):
+        """Give a leased driver back: kept warm if healthy and not due for recycling, otherwise quit"""
+        if driver is None:
+            return
+        with self._lock:
+            info = self._leased.pop(id(driver), None)
+            room = len(self._idle) < self.warm_drivers
+        if info and room and not self._due(driver, info['pages'], check_memory=True) and self._reset(driver):
+            with self._lock:
+                self._idle.append((self.launch_key(*info['options']), driver))
+            print(f"Browser kept warm for the next run ({len(self._idle)} idle)")
+        else:
+            quit_chrome(driver)
+        self._notify()
+
+    def discard(self, driver):
+        """Quit a leased driver without keeping it (a stopped scrape interrupts its browser this way)"""
+        with self._lock:
+            self._leased.pop(id(driver), None)
+        try:
+            quit_chrome(driver)
+        finally:
+            self._notify()
+
+    def next_page(self, driver):
+        """
+        Count a page load on a leased driver and return the driver to load it
+        with: the same one, or a replacement once it has loaded max_pages
+        pages or outgrown its memory limit (recycled between pages, so a long
+        scrape does not keep slowing down on one bloated Chrome).
+        """
+        with self._lock:
+            info = self._leased.get(id(driver))
+            if info is None:
+                return driver
+            pages = info['pages']
+        if self._due(driver, pages, check_memory=pages and pages % MEMORY_CHECK_PAGES == 0):
+            print(f"Recycling browser after {pages} pages")
+            capture_network, blocking = info['options']
+            self.discard(driver)
+            driver = self.lease(timeout=PAGE_LOAD_TIMEOUT, capture_network=capture_network, blocking=blocking)
+            if driver is None:
+                raise RuntimeError("No Chrome slot freed up to replace a recycled browser")
+        with self._lock:
+            # Gone if a Stop discarded the driver meanwhile; the scrape finds out on its next call
+            info = self._leased.get(id(driver))
+            if info is not None:
+                info['pages'] += 1
+        return driver
+
+    def warm_up(self, capture_network=False, blocking=None):
+        """Pre-launch idle drivers up to warm_drivers on a background thread (no-op while one is running)"""
+        with self._lock:
+            if self._warming or len(self._idle) >= self.warm_drivers:
+                return
+            self._warming = True
+
+        def warm():
+            key = self.launch_key(capture_network, blocking)
+            try:
+                while True:
+                    with self._lock:
+                        if len(self._idle) >= self.warm_drivers:
+                            return
+                    driver = launch_chrome(timeout=0, capture_network=capture_network, blocking=blocking)
+                    if driver is None:
+                        return
+                    with self._lock:
+                        self._idle.append((key, driver))
+                    self._notify()
+                    print(f"Pre-launched a browser ({len(self._idle)} idle)")
+            except Exception as e:
+                print(f"Could not pre-launch browsers: {e}")
+            finally:
+                with self._lock:
+                    self._warming = False
+
+        threading.Thread(target=warm, name="browser-warmup", daemon=True).start()
+
+    def close(self):
+        with self._lock:
+            idle = [driver for _, driver in self._idle]
+            self._idle.clear()
+        for driver in idle:
+            try:
+                quit_chrome(driver)
+            except Exception as e:
+                print(f"Error closing idle browser: {e}")
+
+    def _notify(self):
+        with self._changed:
+            self._generation += 1
+            self._changed.notify_all()
+
+    def _track(self, driver, capture_network, blocking):
+        with self._lock:
+            self._leased[id(driver)] = {'pages': 0, 'options': (capture_network, blocking)}
+
+    def _evict_idle(self):
+        with self._lock:
+            if not self._idle:
+                return False
+            _, driver = self._idle.popleft()
+        print("Closing an idle browser to free a Chrome slot")
+        quit_chrome(driver)
+        return True
+
+    def _due(self, driver, pages, check_memory):
+        if pages >= self.max_pages:
+            return True
+        if not check_memory:
+            return False
+        memory_mb, limit_mb = memory_usage_mb(driver)
+        if memory_mb > limit_mb:
+            print(f"Browser is using {memory_mb:.0f} MB (limit {limit_mb} MB)")
+            return True
+        return False
+
+    @staticmethod
+    def _prepare(driver, capture_network, blocking):
+        """Health check an idle driver and set it up for a lease"""
+        try:
+            driver.execute_script("return 1;")
+            apply_blocking(driver, blocking)
+            if capture_network:
+                driver.get_log('performance')
+            return True
+        except Exception as e:
+            print(f"Idle browser failed its health check: {e}")
+            return False
+
+    @staticmethod
+    def _reset(driver):
+        """Back to one blank tab without cookies (cache kept; that is what makes the next run warm)"""
+        try:
+            handles = driver.window_handles
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(handles[0])
+            driver.get("about:blank")
+            driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
+            return True
+        except Exception as e:
+            print(f"Could not reset browser, closing it: {e}")
+            return False
+
+
+def memory_usage_mb(driver):
+    """(MB in use, limit in MB): all Chrome processes with psutil, else the page's JS heap"""
+    try:
+        if PSUTIL_AVAILABLE and getattr(driver, 'browser_pid', None):
+            browser = psutil.Process(driver.browser_pid)
+            rss = sum(process.memory_info().rss for process in [browser] + browser.children(recursive=True))
+            return rss / 1e6, DRIVER_MAX_MEMORY_MB
+        heap = driver.execute_script("return performance.memory ? performance.memory.usedJSHeapSize : 0;")
+        return (heap or 0) / 1e6, DRIVER_MAX_HEAP_MB
+    except Exception:
+        return 0, DRIVER_MAX_MEMORY_MB
+
+
+_driver_pool = None
+_driver_pool_lock = threading.Lock()
+
+
+def get_driver_pool():
+    """The DriverPool shared by every scrape of this process"""
+    global _driver_pool
+    with _driver_pool_lock:
+        if _driver_pool is None:
+            _driver_pool = DriverPool()
+            atexit.register(_driver_pool.close)
+        return _driver_pool
+
+
+class BrowserPool:
+    """
+    A fixed set of drivers that load pages in parallel.
+
+    Extra drivers are leased from the DriverPool only while Chrome slots
+    are free, so the pool may end up smaller than requested. Each page load
+    goes through DriverPool.next_page(), so a driver may be swapped for a
+    fresh one between pages; drivers[0] is the caller's own (possibly
+    replaced) driver.
+    """
+
+    def __init__(self, size, drivers=None, capture_network=False, blocking=None):
+        self.drivers = list(drivers or [])
+        self._borrowed = len(self.drivers)
+        while len(self.drivers) < size:
+            try:
+                driver = get_driver_pool().lease(timeout=0, capture_network=capture_network, blocking=blocking)
+            except Exception as e:
+                print(f"Could not start extra browser: {e}")
+                traceback.print_exc()
+                break
+            if driver is None:
+                print(f"Chrome process cap ({MAX_CHROME_PROCESSES}) reached - pool running with {len(self.drivers)} browsers")
+                break
+            self.drivers.append(driver)
+        print(f"Browser pool ready with {len(self.drivers)} browsers")
+
+        self._idle = queue.Queue()
+        for index in range(len(self.drivers)):
+            self._idle.put(index)
+        self.executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max(1, len(self.drivers)), thread_name_prefix="browser-pool"
+        )
+
+    def __len__(self):
+        return len(self.drivers)
+
+    def _run(self, load_page, page):
+        index = self._idle.get()
+        try:
+            self.drivers[index] = get_driver_pool().next_page(self.drivers[index])
+            return load_page(self.drivers[index], page)
+        finally:
+            self._idle.put(index)
+
+    def map_ordered(self, load_page, pages):
+        """
+        Yield (page, result_or_exception) in page order while every browser
+        works on one of the next pages. load_page(driver, page) runs on a pool
+        thread and must not touch Streamlit.
+        """
+        pending = deque()
+        pages = iter(pages)
+        exhausted = False
+        try:
+            while True:
+                while not exhausted and len(pending) < len(self.drivers):
+                    try:
+                        page = next(pages)
+                    except StopIteration:
+                        exhausted = True
+                        break
+                    pending.append((page, self.executor.submit(self._run, load_page, page)))
+
+                if not pending:
+                    return
+
+                page, future = pending.popleft()
+                try:
+                    result = future.result()
+                except Exception as e:
+                    result = e
+                yield page, result
+        finally:
+            for _, future in pending:
+                future.cancel()
+
+    def close(self):
+        """Return the leased extra drivers; one still busy with a cancelled page load is quit instead"""
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        idle = set()
+        while True:
+            try:
+                idle.add(self._idle.get_nowait())
+            except queue.Empty:
+                break
+        pool = get_driver_pool()
+        for index in range(self._borrowed, len(self.drivers)):
+            try:
+                if index in idle:
+                    pool.release(self.drivers[index])
+                else:
+                    pool.discard(self.drivers[index])
+            except Exception as e:
+                print(f"Error closing pooled browser: {e}")
+        del self.drivers[self._borrowed:]
@@ -12,10 +12,13 @@ import openai
 import os
 from dotenv import load_dotenv
 import time
-import io
 import glob
 import concurrent.futures
 
+from rate_limiter import get_limiter, credential_key, is_rate_limit_error
+from exporter import export_bytes
+from app_resources import shared_client
+
 load_dotenv()
 
 # Generic phrase used to fill blank titles. Rows with this title are skipped
@@ -55,17 +58,27 @@ CATEGORY_MAPPING = {
 
 # Initialize OpenAI API
 OPENAI_API_KEY = st.secrets.get("OPENAI_API_KEY", os.getenv("OPENAI_API_KEY"))
-if OPENAI_API_KEY:
-    openai.api_key = OPENAI_API_KEY
+
+OPENAI_REQUESTS_PER_MINUTE = int(os.getenv("OPENAI_REQUESTS_PER_MINUTE", "500"))
+
+
+def _openai_client():
+    """Process-wide OpenAI client for the configured key (one connection pool for every worker and run)"""
+    return shared_client("openai", OPENAI_API_KEY, lambda: openai.OpenAI(api_key=OPENAI_API_KEY))
+
+
+def _openai_limiter():
+    """Process-wide token bucket for the configured OpenAI key, shared by all worker threads"""
+    return get_limiter(credential_key("openai", OPENAI_API_KEY), OPENAI_REQUESTS_PER_MINUTE)
 
 
 def get_category_from_gpt(title, model="gpt-5-nano", max_retries=3):
     """
     Use GPT to analyze a product title and return its matching category code.
 
-    Safe to call from worker threads: it never touches Streamlit. Includes a
-    small retry with backoff so concurrent calls survive transient/rate-limit
-    errors.
+    Safe to call from worker threads: it never touches Streamlit. Calls draw
+    from the shared OpenAI token bucket; 429s block that bucket for the
+    server's retry-after window, other errors get a small retry with backoff.
     Returns (category_code, None) on success or (None, error_message) on failure.
     """
     if not OPENAI_API_KEY:
@@ -88,10 +101,13 @@ Instructions:
 
 Category Code:"""
 
+    limiter = _openai_limiter()
+    client = _openai_client()
     last_error = None
     for attempt in range(max_retries):
         try:
-            response = openai.chat.completions.create(
+            limiter.acquire()
+            response = client.chat.completions.create(
                 model=model,
                 messages=[
                     {"role": "system", "content": "You are a product categorization expert. Return only numeric category codes."},
@@ -99,6 +115,7 @@ Category Code:"""
                 ]
             )
 
+            limiter.record_success()
             category_code = response.choices[0].message.content.strip()
 
             try:
@@ -112,8 +129,10 @@ Category Code:"""
 
         except Exception as e:
             last_error = e
-            # Back off and retry on transient/rate-limit errors
-            if attempt < max_retries - 1:
+            if is_rate_limit_error(e):
+                # Shared bucket holds every worker until the retry-after window passes
+                limiter.backoff(e)
+            elif attempt < max_retries - 1:
                 time.sleep(1.5 * (attempt + 1))
 
     return None, f"API Error: {str(last_error)}"
@@ -160,12 +179,8 @@ def make_output_filename(input_name):
 
 
 def df_to_excel_bytes(df):
-    """Write a DataFrame to .xlsx bytes (in memory)."""
-    output = io.BytesIO()
-    with pd.ExcelWriter(output, engine='openpyxl') as writer:
-        df.to_excel(writer, index=False, sheet_name='Products')
-    output.seek(0)
-    return output.getvalue()
+    """Write a DataFrame to .xlsx bytes (streamed, see exporter.py)."""
+    return export_bytes(df, "xlsx", sheet_name='Products')
 
 
 def _render_file_metrics(ui, state):
@@ -303,6 +318,13 @@ def process_files_concurrently(jobs, model="gpt-5-nano", max_workers=5):
     return results
 
 
+@st.cache_data(max_entries=10, show_spinner=False)
+def read_upload(file_id, _upload):
+    """An uploaded manifest parsed once per upload (file_id is new for every upload), not on every rerun"""
+    _upload.seek(0)
+    return pd.read_excel(_upload)
+
+
 def render_category_mapper():
     """Render the Category Mapper interface"""
 
@@ -402,12 +424,11 @@ def render_category_mapper():
         uploaded_files = None
 
     if uploaded_files:
-        # Read each file once this run (used for the preview AND for processing)
+        # Parsed once per upload (cached across reruns); used for the preview AND for processing
         file_data = []
         for uf in uploaded_files:
             try:
-                uf.seek(0)
-                df = pd.read_excel(uf)
+                df = read_upload(uf.file_id, uf)
                 error = None if 'Title' in df.columns else "Missing required 'Title' column"
             except Exception as e:
                 df, error = None, f"Could not read file: {str(e)}"
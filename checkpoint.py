@@ -0,0 +1,92 @@
+"""
+Checkpoint Module
+Crash-safe progress files so a long crawl can resume where it stopped.
+
+A checkpoint belongs to one (site, URL) pair and lives in its own
+directory: rows.jsonl holds every scraped lot, appended a batch at a time,
+and cursor.json says how far the crawl got (last finished page, the URL of
+the next page for next-link sites, the last lot seen) and how many bytes
+of rows.jsonl belong to it. The cursor is replaced atomically after the
+rows are flushed, so a crash mid-write never leaves a cursor pointing past
+the saved rows; anything appended after the last cursor is dropped on load.
+"""
+
+import os
+import json
+import time
+import shutil
+import hashlib
+
+DEFAULT_CHECKPOINT_DIR = os.getenv("CHECKPOINT_DIR", os.path.join(".cache", "checkpoints"))
+
+# Minimum seconds between periodic checkpoints of a running crawl
+CHECKPOINT_INTERVAL = float(os.getenv("CHECKPOINT_INTERVAL", "30"))
+
+
+def checkpoint_key(site, url):
+    digest = hashlib.sha1(url.strip().encode("utf-8")).hexdigest()[:16]
+    safe_site = "".join(c if c.isalnum() else "_" for c in site)
+    return f"{safe_site}_{digest}"
+
+
+class CrawlCheckpoint:
+    """Append-only lot rows plus an atomically replaced cursor for one site/URL"""
+
+    def __init__(self, site, url, directory=DEFAULT_CHECKPOINT_DIR):
+        self.site = site
+        self.url = url
+        self.path = os.path.join(directory, checkpoint_key(site, url))
+        self._rows_path = os.path.join(self.path, "rows.jsonl")
+        self._cursor_path = os.path.join(self.path, "cursor.json")
+        self.rows_saved = 0
+        self._rows_bytes = 0
+
+    def exists(self):
+        return os.path.exists(self._cursor_path)
+
+    def load(self):
+        """(cursor, rows) from the last complete checkpoint, or None"""
+        if not self.exists():
+            return None
+        with open(self._cursor_path, encoding="utf-8") as f:
+            cursor = json.load(f)
+
+        rows = []
+        rows_bytes = cursor.get("rows_bytes", 0)
+        if rows_bytes:
+            with open(self._rows_path, "rb") as f:
+                data = f.read(rows_bytes)
+            rows = [tuple(json.loads(line)) for line in data.splitlines() if line]
+            # Rows appended after this cursor was written are not part of it
+            with open(self._rows_path, "r+b") as f:
+                f.truncate(rows_bytes)
+
+        self.rows_saved = len(rows)
+        self._rows_bytes = rows_bytes
+        return cursor, rows
+
+    def save(self, cursor, new_rows):
+        """Append new_rows, then publish cursor (with the row totals) in one atomic rename"""
+        os.makedirs(self.path, exist_ok=True)
+        if new_rows:
+            with open(self._rows_path, "ab") as f:
+                for row in new_rows:
+                    f.write(json.dumps(list(row), ensure_ascii=False).encode("utf-8") + b"\n")
+                f.flush()
+                os.fsync(f.fileno())
+                self._rows_bytes = f.tell()
+            self.rows_saved += len(new_rows)
+
+        cursor = dict(cursor, site=self.site, url=self.url, rows=self.rows_saved,
+                      rows_bytes=self._rows_bytes, saved_at=time.time())
+        tmp_path = self._cursor_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(cursor, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self._cursor_path)
+
+    def clear(self):
+        shutil.rmtree(self.path, ignore_errors=True)
+        self.rows_saved = 0
+        self._rows_bytes = 0
@@ -0,0 +1,89 @@
+"""
+Export Benchmark
+Time and peak memory of each results export path on a synthetic table.
+
+    python export_benchmark.py [--rows 100000] [--formats xlsx-inmemory xlsx csv.gz parquet]
+
+"xlsx-inmemory" is the previous path (pd.ExcelWriter + openpyxl, whole
+workbook held in memory, number formats applied cell by cell); the other
+formats go through exporter.export_bytes(). Peak memory is measured with
+tracemalloc, so it counts Python allocations only and every run is slower
+than it would be without it.
+"""
+
+import io
+import sys
+import time
+import argparse
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from exporter import RESULT_NUMBER_FORMATS, available_formats, export_bytes, rounded_values
+from results_store import ResultsStore
+
+SITES = ["Nellis", "BidFTA", "A-Stock", "702Auctions"]
+CATEGORIES = ["Electronics", "Home", "Tools", "Toys", None]
+
+
+def synthetic_results(rows, seed=0):
+    """A scrape-results frame of `rows` lots with realistic column types"""
+    rng = np.random.default_rng(seed)
+    retail = np.round(rng.uniform(5, 2000, rows), 2)
+    sold = np.round(retail * rng.uniform(0.05, 1.2, rows), 2)
+    store = ResultsStore()
+    for i in range(rows):
+        store.append(
+            f"https://example.com/lot/{i}", f"Synthetic lot {i} - {CATEGORIES[i % 4]} item with a longer title",
+            sold[i], retail[i], round(sold[i] / retail[i] * 100, 2), CATEGORIES[i % 5], site=SITES[i % 4]
+        )
+    return store.to_frame()
+
+
+def xlsx_in_memory(df):
+    output = io.BytesIO()
+    with pd.ExcelWriter(output, engine='openpyxl') as writer:
+        df.to_excel(writer, index=False, sheet_name='Auction Data')
+        sheet = writer.sheets['Auction Data']
+        for col_idx, column in enumerate(df.columns, 1):
+            number_format = RESULT_NUMBER_FORMATS.get(column)
+            if number_format:
+                for (cell,) in sheet.iter_rows(min_row=2, min_col=col_idx, max_col=col_idx):
+                    cell.number_format = number_format
+    return output.getvalue()
+
+
+def run_export(df, fmt):
+    if fmt == "xlsx-inmemory":
+        return xlsx_in_memory(df)
+    if fmt == "xlsx":
+        return export_bytes(df, "xlsx", sheet_name='Auction Data', number_formats=RESULT_NUMBER_FORMATS)
+    return export_bytes(df, fmt)
+
+
+def main():
+    formats = ["xlsx-inmemory"] + available_formats()
+    parser = argparse.ArgumentParser(description="Benchmark results export formats")
+    parser.add_argument("--rows", type=int, default=100_000, help="rows in the synthetic table")
+    parser.add_argument("--formats", nargs="+", default=formats, choices=formats)
+    args = parser.parse_args()
+
+    print(f"Building {args.rows:,} synthetic rows...")
+    df = rounded_values(synthetic_results(args.rows))
+    print(f"Table in memory: {df.memory_usage(deep=True).sum() / 1e6:.1f} MB\n")
+    print(f"{'format':<16} {'seconds':>9} {'rows/s':>10} {'file MB':>9} {'peak MB':>9}")
+
+    for fmt in args.formats:
+        tracemalloc.start()
+        start = time.perf_counter()
+        data = run_export(df, fmt)
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"{fmt:<16} {elapsed:>9.2f} {args.rows / elapsed:>10,.0f} {len(data) / 1e6:>9.2f} {peak / 1e6:>9.1f}")
+        sys.stdout.flush()
+
+
+if __name__ == "__main__":
+    main()
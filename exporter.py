@@ -0,0 +1,132 @@
+"""
+Exporter Module
+Streaming export of result tables to .xlsx, .csv.gz and Parquet.
+
+Rows are written a chunk at a time: openpyxl's write-only workbook streams
+each sheet to a temporary file instead of keeping a cell object per value,
+CSV goes through gzip chunk by chunk, and Parquet is written one row group
+per chunk. Output is spooled to a temporary file that only moves to disk
+once it gets large, so writing takes flat memory however many rows are
+exported. export_bytes() then reads the finished file back as one bytes
+object, because st.download_button keeps its data in memory whatever it is
+given; the file's size (compressed for all three formats) is still held
+once per download. See export_benchmark.py for numbers against the
+in-memory pd.ExcelWriter path.
+"""
+
+import io
+import gzip
+import tempfile
+
+import pandas as pd
+
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# Rows converted and written per step
+EXPORT_CHUNK_ROWS = 10_000
+
+# Exports smaller than this stay in memory; bigger ones spill to a temp file
+SPOOL_MAX_BYTES = 32 * 1024 * 1024
+
+XLSX_MIME = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+# Money / percentage columns of the scrape results and their Excel number formats
+RESULT_NUMBER_FORMATS = {
+    'Sold Price': '"$"#,##0.00',
+    'Retail Price': '"$"#,##0.00',
+    'Recovery': '0.0"%"',
+}
+
+
+def rounded_values(df, columns=RESULT_NUMBER_FORMATS):
+    """float32 result columns widened and rounded to cents, so files hold 1234.56 rather than 1234.56005859375"""
+    return df.assign(**{
+        column: pd.to_numeric(df[column], errors='coerce').astype('float64').round(2)
+        for column in columns if column in df.columns
+    })
+
+
+def _chunks(df, chunk_rows):
+    for start in range(0, len(df), chunk_rows):
+        yield df.iloc[start:start + chunk_rows]
+
+
+def _python_values(series):
+    """Column as a list of plain Python values with None for missing ones"""
+    return series.astype(object).where(series.notna(), None).tolist()
+
+
+def _write_sheet(workbook, name, df, number_formats, chunk_rows):
+    sheet = workbook.create_sheet(title=name)
+    sheet.append([str(column) for column in df.columns])
+    formats = [number_formats.get(column) for column in df.columns]
+    for chunk in _chunks(df, chunk_rows):
+        columns = [_python_values(chunk[column]) for column in chunk.columns]
+        for row in zip(*columns):
+            cells = []
+            for value, number_format in zip(row, formats):
+                if number_format and value is not None:
+                    cell = WriteOnlyCell(sheet, value)
+                    cell.number_format = number_format
+                    cells.append(cell)
+                else:
+                    cells.append(value)
+            sheet.append(cells)
+
+
+def write_xlsx(df, fileobj, sheet_name="Sheet1", number_formats=None, extra_sheets=None, chunk_rows=EXPORT_CHUNK_ROWS):
+    """Stream df (and any {name: DataFrame} extra_sheets after it) into a write-only workbook"""
+    workbook = Workbook(write_only=True)
+    _write_sheet(workbook, sheet_name, df, number_formats or {}, chunk_rows)
+    for name, sheet_df in (extra_sheets or {}).items():
+        _write_sheet(workbook, name, sheet_df, {}, chunk_rows)
+    workbook.save(fileobj)
+
+
+def write_csv_gz(df, fileobj, chunk_rows=EXPORT_CHUNK_ROWS):
+    with gzip.GzipFile(fileobj=fileobj, mode="wb", compresslevel=6) as gz:
+        text = io.TextIOWrapper(gz, encoding="utf-8", newline="")
+        for i, chunk in enumerate(_chunks(df, chunk_rows)):
+            chunk.to_csv(text, index=False, header=(i == 0))
+        if not len(df):
+            df.to_csv(text, index=False)
+        text.flush()
+        text.detach()
+
+
+def write_parquet(df, fileobj, chunk_rows=EXPORT_CHUNK_ROWS):
+    if not PYARROW_AVAILABLE:
+        raise RuntimeError("Parquet export needs pyarrow (pip install pyarrow)")
+    schema = pa.Schema.from_pandas(df, preserve_index=False)
+    with pq.ParquetWriter(fileobj, schema, compression="snappy") as writer:
+        for chunk in _chunks(df, chunk_rows):
+            writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+
+
+# format -> (label, file extension, mime type, writer(df, fileobj, **options))
+EXPORT_FORMATS = {
+    "xlsx": ("Excel (.xlsx)", "xlsx", XLSX_MIME, write_xlsx),
+    "csv.gz": ("Compressed CSV (.csv.gz)", "csv.gz", "application/gzip", write_csv_gz),
+    "parquet": ("Parquet (.parquet)", "parquet", "application/vnd.apache.parquet", write_parquet),
+}
+
+
+def available_formats():
+    return [fmt for fmt in EXPORT_FORMATS if fmt != "parquet" or PYARROW_AVAILABLE]
+
+
+def export_bytes(df, fmt="xlsx", **options):
+    """Run one exporter into a spooled temp file and return the whole finished file as bytes (for download buttons)"""
+    write = EXPORT_FORMATS[fmt][3]
+    with tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES) as spool:
+        write(df, spool, **options)
+        spool.seek(0)
+        return spool.read()
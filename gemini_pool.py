@@ -0,0 +1,222 @@
+"""
+Gemini Pool Module
+Parallel retail-price lookups across every configured Gemini API key.
+
+Each key gets its own lane (client, worker thread and rate budget). Lanes
+pull lots from one shared queue, so AI throughput grows with the number of
+keys instead of being capped by a single key's quota. A lot that fails on
+one lane is retried on the lanes that have not tried it yet. When a
+PriceCache is given, lanes answer from it before spending a model call.
+Lot images are downloaded and shrunk by an ImagePrefetcher as soon as a lot
+is queued, so lanes do not wait on image I/O.
+
+Worker threads never touch Streamlit; results come back through futures.
+"""
+
+import re
+import queue
+import threading
+import traceback
+import concurrent.futures
+
+from rate_limiter import get_limiter, credential_key, is_rate_limit_error
+from app_resources import shared_client
+from price_cache import make_cache_key
+from image_prefetch import ImagePrefetcher
+
+GEMINI_MODEL = "gemini-2.5-flash"
+REQUESTS_PER_MINUTE = 10
+
+PRICE_PATTERN = re.compile(r'([\d,]+\.?\d*)\s*,\s*(https?://\S+)')
+
+
+def build_price_prompt(product_name):
+    return f"""
+                **Task**: Find the retail price and a direct product link for the item in the image, described as '{product_name}'.
+                **Output Format**: You MUST reply ONLY in the format: `PRICE, URL`. Example: `199.99, https://www.amazon.com/product`.
+                **Rules**:
+                1. If you cannot find the exact item, find the CLOSEST SIMILAR item from a major retailer (Amazon, Walmart, etc.). NEVER return "NONE" or "Not Found".
+                2. The price must be a number only (e.g., `123.45`). No currency symbols.
+                3. The URL must be a direct retail link, not an auction site.
+                Your entire response must be just the price and the link, separated by a comma.
+                """
+
+
+def parse_price_response(response_text):
+    """Return 'PRICE, URL' from a model reply, or None if the reply is not in that format"""
+    match = PRICE_PATTERN.search(response_text)
+    if not match:
+        return None
+    price = match.group(1).replace(',', '')
+    return f"{price}, {match.group(2)}"
+
+
+class PriceJob:
+    def __init__(self, product_name, image_url):
+        self.product_name = product_name
+        self.image_url = image_url
+        self.tried_lanes = set()
+        self.future = concurrent.futures.Future()
+
+
+class GeminiLane:
+    """One API key with its own client and its own rate budget"""
+
+    def __init__(self, index, api_key, requests_per_minute=REQUESTS_PER_MINUTE):
+        self.index = index
+        # Shared per key across every pool in the process, so quota state survives key rotation and reruns
+        self.limiter = get_limiter(credential_key("gemini", api_key), requests_per_minute)
+        # One client per key for the whole process; the SDK only loads for scrapes that ask the model for prices
+        self.client = shared_client("gemini", api_key, lambda: self._client(api_key))
+
+    @staticmethod
+    def _client(api_key):
+        from google import genai
+
+        return genai.Client(api_key=api_key)
+
+    def generate(self, contents, stop_event):
+        if not self.limiter.acquire(stop_event=stop_event):
+            raise RuntimeError("Price lookup stopped")
+        return self.client.models.generate_content(model=GEMINI_MODEL, contents=contents)
+
+    def lookup(self, product_name, image, stop_event, cache=None):
+        """Return 'PRICE, URL' for one lot given its PrefetchedImage, or raise on any failure"""
+        cache_key = make_cache_key(product_name, image.content_hash) if cache else None
+        if cache_key:
+            cached = cache.get(cache_key)
+            if cached:
+                print(f"[Gemini lane {self.index + 1}] Cache hit: {cached}")
+                return cached
+
+        contents = [
+            {
+                "role": "user",
+                "parts": [
+                    {"text": build_price_prompt(product_name)},
+                    {"inline_data": {"mime_type": image.mime_type, "data": image.data}}
+                ]
+            }
+        ]
+
+        try:
+            response = self.generate(contents, stop_event)
+        except Exception as e:
+            if not is_rate_limit_error(e):
+                raise
+            self.limiter.backoff(e)
+            response = self.generate(contents, stop_event)
+        self.limiter.record_success()
+
+        response_text = response.text.strip()
+        print(f"[Gemini lane {self.index + 1}] AI Response: {response_text}")
+        result = parse_price_response(response_text)
+        if not result:
+            raise ValueError("Invalid AI response format")
+        if cache_key:
+            cache.put(cache_key, result)
+        return result
+
+
+class GeminiPricePool:
+    """
+    Worker pool with one lane per Gemini API key.
+
+    submit() returns a concurrent.futures.Future resolving to 'PRICE, URL' or
+    None when every lane failed for that lot. At most max_pending lots are
+    queued or in flight at once; submit() blocks (up to timeout) beyond that.
+    """
+
+    def __init__(self, api_keys, headers, requests_per_minute=REQUESTS_PER_MINUTE, max_pending=None, cache=None):
+        self.cache = cache
+        self.images = ImagePrefetcher(headers)
+        self.lanes = []
+        for index, api_key in enumerate(api_keys):
+            try:
+                self.lanes.append(GeminiLane(index, api_key, requests_per_minute))
+            except Exception as e:
+                print(f"Failed to set up Gemini lane {index + 1}: {e}")
+
+        self.jobs = queue.Queue()
+        self.stop_event = threading.Event()
+        self.exhausted = False
+        self._slots = threading.BoundedSemaphore(max_pending or max(2, 2 * len(self.lanes)))
+        self._threads = []
+        for lane in self.lanes:
+            thread = threading.Thread(target=self._lane_worker, args=(lane,), name=f"gemini-lane-{lane.index + 1}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def __len__(self):
+        return len(self.lanes)
+
+    def submit(self, product_name, image_url, timeout=None):
+        """Queue a lot for pricing. Returns a Future, or None if no slot freed up within timeout"""
+        if self.stop_event.is_set() or not self.lanes:
+            future = concurrent.futures.Future()
+            future.set_result(None)
+            return future
+        if not self._slots.acquire(timeout=timeout):
+            return None
+        job = PriceJob(product_name, image_url)
+        job.future.add_done_callback(lambda _: self._slots.release())
+        self.images.prefetch(image_url)
+        self.jobs.put(job)
+        return job.future
+
+    @staticmethod
+    def _resolve(job, result):
+        try:
+            job.future.set_result(result)
+        except concurrent.futures.InvalidStateError:
+            pass  # cancelled by close()
+
+    def _lane_worker(self, lane):
+        while not self.stop_event.is_set():
+            try:
+                job = self.jobs.get(timeout=0.5)
+            except queue.Empty:
+                continue
+
+            if job.future.cancelled():
+                continue
+
+            if lane.index in job.tried_lanes:
+                # Another lane still has to try this lot; hand it back
+                self.jobs.put(job)
+                self.stop_event.wait(0.1)
+                continue
+
+            try:
+                image = self.images.get(job.image_url)
+            except Exception as e:
+                # A dead image URL fails the same way on every lane; it says nothing about the keys
+                print(f"[Gemini lane {lane.index + 1}] Could not load image for {job.product_name[:50]}: {e}")
+                self._resolve(job, None)
+                continue
+
+            job.tried_lanes.add(lane.index)
+            print(f"\n[Gemini lane {lane.index + 1}] Getting retail price for: {job.product_name[:50]}...")
+            try:
+                self._resolve(job, lane.lookup(job.product_name, image, self.stop_event, self.cache))
+            except Exception as e:
+                print(f"[Gemini lane {lane.index + 1}] Error getting price: {e}")
+                traceback.print_exc()
+                if len(job.tried_lanes) < len(self.lanes) and not self.stop_event.is_set():
+                    self.jobs.put(job)
+                else:
+                    print("All Gemini API keys failed for this lot")
+                    self.exhausted = True
+                    self._resolve(job, None)
+
+    def close(self):
+        self.stop_event.set()
+        while True:
+            try:
+                job = self.jobs.get_nowait()
+            except queue.Empty:
+                break
+            job.future.cancel()
+        for thread in self._threads:
+            thread.join(timeout=1)
+        self.images.close()
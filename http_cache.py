@@ -0,0 +1,137 @@
+"""
+HTTP Cache Module
+Opt-in on-disk cache of listing and detail pages for the request-based scrapers.
+
+Response bodies are stored zlib-compressed in a SQLite file, keyed by URL,
+together with their ETag / Last-Modified validators. A fresh entry (younger
+than the site's TTL) is served without touching the network; a stale one
+is revalidated with If-None-Match / If-Modified-Since, and a 304 answer
+reuses the stored body. The file is trimmed back to max_bytes of
+compressed bodies by least recent use.
+"""
+
+import os
+import time
+import zlib
+import sqlite3
+import threading
+
+DEFAULT_HTTP_CACHE_PATH = os.getenv("HTTP_CACHE_PATH", os.path.join(".cache", "http_pages.sqlite3"))
+DEFAULT_MAX_BYTES = int(os.getenv("HTTP_CACHE_MAX_MB", "256")) * 1024 * 1024
+
+HOUR = 3600
+DAY = 24 * HOUR
+
+
+def header(headers, name):
+    """Case-insensitive header lookup that also works on plain dicts"""
+    name = name.lower()
+    for key, value in (headers or {}).items():
+        if key.lower() == name:
+            return value
+    return None
+
+
+class CachedPage:
+    def __init__(self, url, content, encoding, etag, last_modified, fetched_at):
+        self.url = url
+        self.content = content
+        self.encoding = encoding
+        self.etag = etag
+        self.last_modified = last_modified
+        self.fetched_at = fetched_at
+
+    @property
+    def age(self):
+        return time.time() - self.fetched_at
+
+    def validators(self):
+        """Conditional request headers for revalidating this entry"""
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+class HttpCache:
+    """Thread-safe URL -> compressed body cache with validators, hit counters and a byte cap"""
+
+    def __init__(self, path=DEFAULT_HTTP_CACHE_PATH, max_bytes=DEFAULT_MAX_BYTES):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS http_pages ("
+            "url TEXT PRIMARY KEY, body BLOB NOT NULL, size INTEGER NOT NULL, encoding TEXT, "
+            "etag TEXT, last_modified TEXT, fetched_at REAL NOT NULL, last_used REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_http_pages_last_used ON http_pages(last_used)")
+        self._conn.commit()
+        # Running total of stored body sizes, so a write never has to re-sum the table
+        self._total_bytes = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM http_pages").fetchone()[0]
+
+    def get(self, url):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body, encoding, etag, last_modified, fetched_at FROM http_pages WHERE url = ?", (url,)
+            ).fetchone()
+            if not row:
+                return None
+            self._conn.execute("UPDATE http_pages SET last_used = ? WHERE url = ?", (time.time(), url))
+            self._conn.commit()
+        body, encoding, etag, last_modified, fetched_at = row
+        return CachedPage(url, zlib.decompress(body), encoding, etag, last_modified, fetched_at)
+
+    def put(self, url, content, encoding=None, headers=None):
+        body = zlib.compress(content, 6)
+        now = time.time()
+        with self._lock:
+            previous = self._conn.execute("SELECT size FROM http_pages WHERE url = ?", (url,)).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO http_pages "
+                "(url, body, size, encoding, etag, last_modified, fetched_at, last_used) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (url, body, len(body), encoding, header(headers, 'ETag'), header(headers, 'Last-Modified'), now, now)
+            )
+            self._total_bytes += len(body) - (previous[0] if previous else 0)
+            self._evict()
+            self._conn.commit()
+
+    def refresh(self, url, headers=None):
+        """A 304 confirmed the stored body: restart its TTL and keep any new validators"""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "UPDATE http_pages SET fetched_at = ?, last_used = ?, "
+                "etag = COALESCE(?, etag), last_modified = COALESCE(?, last_modified) WHERE url = ?",
+                (now, now, header(headers, 'ETag'), header(headers, 'Last-Modified'), url)
+            )
+            self._conn.commit()
+
+    def _evict(self):
+        if self._total_bytes <= self.max_bytes:
+            return
+        doomed = []
+        for url, size in self._conn.execute("SELECT url, size FROM http_pages ORDER BY last_used ASC"):
+            if self._total_bytes <= self.max_bytes:
+                break
+            doomed.append((url,))
+            self._total_bytes -= size
+        self._conn.executemany("DELETE FROM http_pages WHERE url = ?", doomed)
+
+    def summary(self):
+        return f"{self.hits} fresh hits, {self.revalidated} revalidated (304), {self.misses} fetched"
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
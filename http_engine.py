@@ -0,0 +1,223 @@
+"""
+HTTP Engine Module
+Shared asyncio fetch engine for the request-based scrapers.
+
+One aiohttp session (connection pooling + keep-alive) runs on its own event
+loop in a background thread, so the synchronous scraper code can hand it URLs
+and get back futures. A per-host cap keeps the number of in-flight requests
+to any single site bounded. An optional per-host token bucket (shared
+process-wide through rate_limiter) adds politeness on top of that and backs
+off when a host answers 429. MAX_TOTAL_SOCKETS caps open requests across
+every engine in the process, so concurrent site scrapes share one socket
+budget. With an HttpCache attached, plain GETs are
+served from disk while fresh and revalidated with ETag/Last-Modified once
+stale.
+"""
+
+import os
+import asyncio
+import threading
+import concurrent.futures
+from collections import deque
+from urllib.parse import urlsplit
+
+import aiohttp
+from multidict import CIMultiDict
+
+from rate_limiter import get_limiter, retry_after_from
+
+DEFAULT_MAX_PER_HOST = 8
+DEFAULT_TOTAL_LIMIT = 64
+DEFAULT_TIMEOUT = 30
+
+# Open requests allowed across all engines in this process (multi-site runs share it)
+MAX_TOTAL_SOCKETS = int(os.getenv("MAX_TOTAL_SOCKETS", "64"))
+SOCKET_SLOT_POLL = 0.01
+_socket_slots = threading.BoundedSemaphore(MAX_TOTAL_SOCKETS)
+
+
+async def _acquire_socket_slot():
+    # The semaphore is shared with other engines' event loops, so poll instead of blocking this one
+    while not _socket_slots.acquire(blocking=False):
+        await asyncio.sleep(SOCKET_SLOT_POLL)
+
+
+class FetchResponse:
+    """Minimal response object with the attributes the scrapers read from requests.Response"""
+
+    def __init__(self, url, status_code, content, headers, encoding=None):
+        self.url = url
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers
+        self.encoding = encoding or 'utf-8'
+
+    @property
+    def text(self):
+        return self.content.decode(self.encoding, errors='replace')
+
+
+class AsyncFetchEngine:
+    """
+    Pooled keep-alive HTTP client running on a private event loop.
+
+    submit() is safe to call from any thread and returns a
+    concurrent.futures.Future resolving to a FetchResponse.
+    """
+
+    def __init__(self, headers=None, max_per_host=DEFAULT_MAX_PER_HOST,
+                 total_limit=DEFAULT_TOTAL_LIMIT, timeout=DEFAULT_TIMEOUT, host_rate_per_minute=None,
+                 cache=None, cache_ttl=None):
+        self.headers = dict(headers or {})
+        # cache_ttl(url) -> seconds a cached copy stays fresh, or None to bypass the cache
+        self.cache = cache
+        self.cache_ttl = cache_ttl
+        self.host_rate_per_minute = host_rate_per_minute
+        self.max_per_host = max(1, int(max_per_host))
+        self.total_limit = max(self.max_per_host, int(total_limit))
+        self.timeout = timeout
+
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run_loop, name="http-engine", daemon=True)
+        self._thread.start()
+        self._session = self._call(self._open_session())
+        self._closed = False
+
+    def _run_loop(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def _call(self, coro):
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result()
+
+    async def _open_session(self):
+        connector = aiohttp.TCPConnector(
+            limit=self.total_limit,
+            limit_per_host=self.max_per_host,
+            keepalive_timeout=60,
+            ttl_dns_cache=300,
+        )
+        return aiohttp.ClientSession(
+            connector=connector,
+            headers=self.headers,
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+        )
+
+    def host_limiter(self, url):
+        if not self.host_rate_per_minute:
+            return None
+        return get_limiter(f"host:{urlsplit(url).netloc}", self.host_rate_per_minute)
+
+    def _cache_ttl(self, url, headers):
+        # Requests with their own headers (e.g. browser cookies) may be personalised; never cache them
+        if not self.cache or not self.cache_ttl or headers:
+            return None
+        return self.cache_ttl(url)
+
+    async def _fetch(self, url, headers=None):
+        ttl = self._cache_ttl(url, headers)
+        # SQLite reads and writes run on the default executor so they never stall the shared event loop
+        loop = asyncio.get_running_loop()
+        cached = await loop.run_in_executor(None, self.cache.get, url) if ttl is not None else None
+        if cached and cached.age <= ttl:
+            self.cache.hits += 1
+            return FetchResponse(url, 200, cached.content, {'X-Cache': 'HIT'}, cached.encoding)
+
+        request_headers = cached.validators() if cached else headers
+        limiter = self.host_limiter(url)
+        if limiter:
+            await limiter.acquire_async()
+        await _acquire_socket_slot()
+        try:
+            async with self._session.get(url, headers=request_headers, allow_redirects=True) as resp:
+                body = await resp.read()
+                if limiter:
+                    if resp.status == 429:
+                        limiter.backoff(retry_after=retry_after_from(resp))
+                    else:
+                        limiter.record_success()
+                # Copy, keeping lookups case-insensitive (HTTP/2 and most CDNs send lowercase names)
+                response_headers = CIMultiDict(resp.headers)
+        finally:
+            _socket_slots.release()
+
+        if cached and resp.status == 304:
+            self.cache.revalidated += 1
+            await loop.run_in_executor(None, self.cache.refresh, url, response_headers)
+            return FetchResponse(url, 200, cached.content, {'X-Cache': 'REVALIDATED'}, cached.encoding)
+        if ttl is not None and resp.status == 200:
+            self.cache.misses += 1
+            await loop.run_in_executor(None, self.cache.put, url, body, resp.charset, response_headers)
+        return FetchResponse(str(resp.url), resp.status, body, response_headers, resp.charset)
+
+    def submit(self, url, headers=None):
+        """Schedule a GET and return a concurrent.futures.Future"""
+        if self._closed:
+            raise RuntimeError("HTTP engine is closed")
+        return asyncio.run_coroutine_threadsafe(self._fetch(url, headers), self.loop)
+
+    def get(self, url, headers=None):
+        """Blocking GET through the shared session"""
+        return self.submit(url, headers).result()
+
+    def fetch_many(self, urls, headers=None):
+        """
+        Fetch all URLs concurrently (bounded by the per-host cap).
+        Returns results in input order; failed fetches are returned as the
+        exception instance, like asyncio.gather(return_exceptions=True).
+        """
+        futures = [self.submit(url, headers) for url in urls]
+        results = []
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception as e:
+                results.append(e)
+        return results
+
+    def iter_ordered(self, urls, window=None, headers=None):
+        """
+        Yield (url, response_or_exception) in input order while keeping up to
+        `window` requests in flight ahead of the consumer. `urls` may be an
+        unbounded generator; closing the iterator cancels pending requests.
+        """
+        window = window or self.max_per_host
+        pending = deque()
+        urls = iter(urls)
+        exhausted = False
+        try:
+            while True:
+                while not exhausted and len(pending) < window:
+                    try:
+                        url = next(urls)
+                    except StopIteration:
+                        exhausted = True
+                        break
+                    pending.append((url, self.submit(url, headers)))
+
+                if not pending:
+                    return
+
+                url, future = pending.popleft()
+                try:
+                    yield url, future.result()
+                except concurrent.futures.CancelledError:
+                    return
+                except Exception as e:
+                    yield url, e
+        finally:
+            for _, future in pending:
+                future.cancel()
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            self._call(self._session.close())
+        except Exception as e:
+            print(f"Error closing HTTP session: {e}")
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join(timeout=5)
+        if not self._thread.is_alive():
+            self.loop.close()
@@ -0,0 +1,136 @@
+"""
+Image Prefetch Module
+Downloads lot images ahead of the Gemini lanes and shrinks them for upload.
+
+Images are fetched in parallel over one pooled requests.Session as soon as
+a lot is queued, downscaled to MAX_IMAGE_SIDE and re-encoded as JPEG, and
+kept in a size-bounded LRU cache. By the time a lane picks the lot up the
+bytes are usually ready, and a retry on another key reuses them instead of
+downloading again.
+"""
+
+import io
+import hashlib
+import threading
+import concurrent.futures
+from collections import OrderedDict
+
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    from PIL import Image
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
+# Gemini tiles images at 768x768, anything larger is only extra upload
+MAX_IMAGE_SIDE = 768
+JPEG_QUALITY = 85
+PREFETCH_WORKERS = 8
+MAX_CACHE_BYTES = 64 * 1024 * 1024
+DOWNLOAD_TIMEOUT = 15
+
+
+def sniff_mime_type(data):
+    if data.startswith(b'\xff\xd8'):
+        return "image/jpeg"
+    if data.startswith(b'\x89PNG'):
+        return "image/png"
+    if data[:4] == b'RIFF' and data[8:12] == b'WEBP':
+        return "image/webp"
+    if data[:6] in (b'GIF87a', b'GIF89a'):
+        return "image/gif"
+    return "image/jpeg"
+
+
+def shrink_image(data):
+    """Return (bytes, mime_type) downscaled to MAX_IMAGE_SIDE, or the original if that is smaller"""
+    if not PIL_AVAILABLE:
+        return data, sniff_mime_type(data)
+    try:
+        with Image.open(io.BytesIO(data)) as img:
+            img.thumbnail((MAX_IMAGE_SIDE, MAX_IMAGE_SIDE))
+            if img.mode not in ("RGB", "L"):
+                img = img.convert("RGB")
+            output = io.BytesIO()
+            img.save(output, format="JPEG", quality=JPEG_QUALITY, optimize=True)
+        shrunk = output.getvalue()
+        if len(shrunk) < len(data):
+            return shrunk, "image/jpeg"
+    except Exception as e:
+        print(f"Could not re-encode image, sending original: {e}")
+    return data, sniff_mime_type(data)
+
+
+class PrefetchedImage:
+    def __init__(self, data, mime_type, content_hash, original_size):
+        self.data = data
+        self.mime_type = mime_type
+        self.content_hash = content_hash
+        self.original_size = original_size
+
+
+class ImagePrefetcher:
+    """Parallel image downloader with a bounded LRU cache of processed images"""
+
+    def __init__(self, headers, max_workers=PREFETCH_WORKERS, max_cache_bytes=MAX_CACHE_BYTES):
+        self.session = requests.Session()
+        self.session.headers.update(headers or {})
+        adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="image-prefetch")
+        self.max_cache_bytes = max_cache_bytes
+        self._cache = OrderedDict()
+        self._cache_bytes = 0
+        self._in_flight = {}
+        self._lock = threading.Lock()
+
+    def prefetch(self, url):
+        """Start downloading url in the background (no-op if cached or already in flight)"""
+        with self._lock:
+            if url in self._cache:
+                self._cache.move_to_end(url)
+                future = concurrent.futures.Future()
+                future.set_result(self._cache[url])
+                return future
+            future = self._in_flight.get(url)
+            if future is None:
+                future = self.executor.submit(self._download, url)
+                self._in_flight[url] = future
+            return future
+
+    def get(self, url, timeout=None):
+        """Processed image for url, downloading it now if it was never prefetched"""
+        return self.prefetch(url).result(timeout=timeout)
+
+    def _download(self, url):
+        try:
+            response = self.session.get(url, timeout=DOWNLOAD_TIMEOUT)
+            if response.status_code != 200:
+                raise ValueError(f"Failed to download image: HTTP {response.status_code}")
+            raw = response.content
+            data, mime_type = shrink_image(raw)
+            image = PrefetchedImage(data, mime_type, hashlib.sha256(raw).hexdigest(), len(raw))
+            print(f"Image ready: {len(raw)} -> {len(data)} bytes ({mime_type})")
+            self._remember(url, image)
+            return image
+        finally:
+            with self._lock:
+                self._in_flight.pop(url, None)
+
+    def _remember(self, url, image):
+        with self._lock:
+            previous = self._cache.pop(url, None)
+            if previous:
+                self._cache_bytes -= len(previous.data)
+            self._cache[url] = image
+            self._cache_bytes += len(image.data)
+            while self._cache_bytes > self.max_cache_bytes and len(self._cache) > 1:
+                _, evicted = self._cache.popitem(last=False)
+                self._cache_bytes -= len(evicted.data)
+
+    def close(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        self.session.close()
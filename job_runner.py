@@ -0,0 +1,212 @@
+"""
+Job Runner Module
+Runs scrapes on background threads so the Streamlit script never blocks on them.
+
+A ScrapeJob owns one scraper instance and runs it on a worker thread of the
+process-wide JobRunner (at most MAX_CONCURRENT_JOBS at once; later ones wait
+as "queued"). The scraper is handed placeholder stand-ins instead of real
+Streamlit elements: every status / progress / metric / table call becomes an
+event on the job's queue, and the page polls the job, replaying the newest
+call for each placeholder into its own widgets. Jobs live in the process,
+not the browser session, so a rerun or a reopened tab can reattach to a
+running job by its ID.
+"""
+
+import os
+import time
+import uuid
+import queue
+import threading
+import traceback
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+MAX_CONCURRENT_JOBS = int(os.getenv("SCRAPER_MAX_JOBS", "4"))
+
+# Progress events buffered per job between polls; the oldest are dropped when nobody is watching
+JOB_EVENT_QUEUE_SIZE = 1000
+
+# Status messages kept per job for the activity log
+JOB_LOG_SIZE = 50
+
+# Finished jobs stay reattachable this long
+JOB_RETENTION_SECONDS = 6 * 3600
+
+QUEUED, RUNNING, FINISHED, STOPPED, FAILED = "queued", "running", "finished", "stopped", "failed"
+
+
+class JobPlaceholder:
+    """Stand-in for a Streamlit placeholder: any method call is queued as an event for the page"""
+
+    def __init__(self, job, key):
+        self._job = job
+        self._key = key
+
+    def __getattr__(self, method):
+        def call(*args, **kwargs):
+            self._job.emit(self._key, method, args, kwargs)
+        return call
+
+
+class ScrapeJob:
+    def __init__(self, site_name, url, start_page, end_page, make_scraper, resume=False):
+        self.id = uuid.uuid4().hex[:8]
+        self.site_name = site_name
+        self.url = url
+        self.start_page = start_page
+        self.end_page = end_page
+        self.resume = resume
+        self.make_scraper = make_scraper
+        self.status = QUEUED
+        self.scraper = None
+        self.results = None
+        self.error = None
+        self.created_at = time.time()
+        self.finished_at = None
+
+        self._events = queue.Queue(maxsize=JOB_EVENT_QUEUE_SIZE)
+        self._state = {}
+        self._log = deque(maxlen=JOB_LOG_SIZE)
+        self._state_lock = threading.Lock()
+        self._stop_requested = False
+        self.future = None
+
+    @property
+    def running(self):
+        return self.status in (QUEUED, RUNNING)
+
+    @property
+    def lots(self):
+        if self.results is not None:
+            return len(self.results)
+        results = getattr(self.scraper, 'results', None)
+        return len(results) if results is not None else 0
+
+    @property
+    def description(self):
+        """The URL, or "Site: URL, ..." for a multi-site job whose url is a list of (site, url) targets"""
+        if isinstance(self.url, (list, tuple)):
+            return ", ".join(f"{site}: {url}" for site, url in self.url)
+        return self.url
+
+    def ui_placeholders(self, metrics=("pages", "lots", "recovery", "cache")):
+        """The ui_placeholders dict AuctionScraper expects, backed by this job's event queue"""
+        return {
+            'status': JobPlaceholder(self, 'status'),
+            'progress': JobPlaceholder(self, 'progress'),
+            'dataframe': JobPlaceholder(self, 'dataframe'),
+            'metrics': {name: JobPlaceholder(self, f'metrics.{name}') for name in metrics}
+        }
+
+    def emit(self, key, method, args, kwargs):
+        event = (key, method, args, kwargs)
+        while True:
+            try:
+                self._events.put_nowait(event)
+                return
+            except queue.Full:
+                try:
+                    self._events.get_nowait()
+                except queue.Empty:
+                    pass
+
+    def poll(self):
+        """Apply queued events; returns {placeholder key: (method, args, kwargs)} with the newest call per key"""
+        with self._state_lock:
+            while True:
+                try:
+                    key, method, args, kwargs = self._events.get_nowait()
+                except queue.Empty:
+                    break
+                self._state[key] = (method, args, kwargs)
+                if key == 'status' and args:
+                    self._log.append((method, str(args[0])))
+            return dict(self._state)
+
+    def log(self):
+        with self._state_lock:
+            return list(self._log)
+
+    def stop(self):
+        self._stop_requested = True
+        if self.future is not None and self.future.cancel():
+            self.status = STOPPED
+            self.finished_at = time.time()
+        elif self.scraper is not None:
+            self.scraper.stop()
+
+    def execute(self):
+        if self._stop_requested:
+            self.status = STOPPED
+            self.finished_at = time.time()
+            return
+        self.status = RUNNING
+        print(f"Job {self.id}: {self.site_name} started")
+        try:
+            self.scraper = self.make_scraper(self.ui_placeholders())
+            if self._stop_requested:
+                self.scraper.stop()
+            self.results = self.scraper.run(self.site_name, self.url, self.start_page, self.end_page, resume=self.resume)
+            self.status = STOPPED if self._stop_requested else FINISHED
+        except Exception as e:
+            print(f"Job {self.id} failed: {e}")
+            traceback.print_exc()
+            self.error = f"{e}\n{traceback.format_exc()}"
+            self.status = FAILED
+        finally:
+            self.finished_at = time.time()
+            print(f"Job {self.id}: {self.site_name} {self.status}")
+
+
+class JobRunner:
+    """Process-wide registry and worker pool for scrape jobs"""
+
+    def __init__(self, max_workers=MAX_CONCURRENT_JOBS):
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="scrape-job")
+        self._jobs = {}
+        self._lock = threading.Lock()
+
+    def submit(self, site_name, url, start_page, end_page, make_scraper, resume=False):
+        """Queue a scrape; make_scraper(ui_placeholders) builds the scraper on the worker thread"""
+        job = ScrapeJob(site_name, url, start_page, end_page, make_scraper, resume=resume)
+        with self._lock:
+            self._prune()
+            self._jobs[job.id] = job
+        job.future = self._executor.submit(job.execute)
+        return job
+
+    def get(self, job_id):
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def jobs(self, site_name=None):
+        """Known jobs, newest first"""
+        with self._lock:
+            self._prune()
+            jobs = [job for job in self._jobs.values() if site_name is None or job.site_name == site_name]
+        return sorted(jobs, key=lambda job: job.created_at, reverse=True)
+
+    def stop(self, job_id):
+        job = self.get(job_id)
+        if job:
+            job.stop()
+        return job
+
+    def _prune(self):
+        cutoff = time.time() - JOB_RETENTION_SECONDS
+        for job_id in [j.id for j in self._jobs.values() if j.finished_at and j.finished_at < cutoff]:
+            del self._jobs[job_id]
+
+
+_runner = None
+_runner_lock = threading.Lock()
+
+
+def get_job_runner():
+    """The JobRunner shared by every session of this process"""
+    global _runner
+    with _runner_lock:
+        if _runner is None:
+            _runner = JobRunner()
+        return _runner
@@ -0,0 +1,163 @@
+"""
+Multi-Site Module
+Scrape several auction sites at once into one merged, site-tagged result stream.
+
+MultiSiteScraper runs one AuctionScraper per (site, URL) target on its own
+thread and has the same run() / stop() / results shape as a single scraper,
+so the job runner treats it like any other job. Each site scraper keeps its
+own results (and checkpoint) and also publishes every lot to a shared
+MergedResults, whose combined lot count, recovery and newest rows are what
+the page shows; status lines are prefixed with the site name.
+
+Sites share the process-wide resource caps: Chrome processes
+(browser_pool.MAX_CHROME_PROCESSES), open HTTP requests
+(http_engine.MAX_TOTAL_SOCKETS) and the Gemini key rate limiters.
+"""
+
+import os
+import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from results_store import MergedResults
+
+MAX_PARALLEL_SITES = int(os.getenv("MAX_PARALLEL_SITES", "4"))
+
+MERGED_TABLE_ROWS = 100
+
+
+class _Forward:
+    """Placeholder stand-in: any method call goes to handler(method, args, kwargs)"""
+
+    def __init__(self, handler):
+        self._handler = handler
+
+    def __getattr__(self, method):
+        def call(*args, **kwargs):
+            self._handler(method, args, kwargs)
+        return call
+
+
+class MultiSiteScraper:
+    def __init__(self, make_scraper, ui_placeholders, max_parallel_sites=MAX_PARALLEL_SITES):
+        # make_scraper(site, ui_placeholders, results) -> AuctionScraper
+        self.make_scraper = make_scraper
+        self.ui = ui_placeholders
+        self.max_parallel_sites = max(1, int(max_parallel_sites))
+        self.results = MergedResults()
+        self.running = True
+        self._is_running = True
+        self._scrapers = {}
+        # site -> pages scraped so far / (AI cache hits, lookups); the shared metrics show their totals
+        self._pages = {}
+        self._cache_hits = {}
+        self._lock = threading.Lock()
+
+    @property
+    def products(self):
+        return self.results.to_frame()
+
+    def stop(self):
+        print("\nSTOP SIGNAL RECEIVED (all sites)")
+        self.running = False
+        self._is_running = False
+        with self._lock:
+            scrapers = list(self._scrapers.values())
+        for scraper in scrapers:
+            scraper.stop()
+
+    def run(self, label, targets, start_page, end_page, resume=False):
+        """Scrape every (site, url) in targets concurrently; returns the merged, site-tagged DataFrame"""
+        sites = ", ".join(site for site, _ in targets)
+        print(f"\n{label}: {len(targets)} sites in parallel ({sites})")
+        self.ui['status'].info(f"Scraping {sites} in parallel...")
+
+        failed = []
+        with ThreadPoolExecutor(max_workers=min(len(targets), self.max_parallel_sites),
+                                thread_name_prefix="site") as pool:
+            futures = {
+                pool.submit(self._run_site, site, url, start_page, end_page, resume): site
+                for site, url in targets
+            }
+            for future in as_completed(futures):
+                site = futures[future]
+                try:
+                    future.result()
+                    print(f"{site} finished")
+                except Exception as e:
+                    print(f"{site} failed: {e}")
+                    traceback.print_exc()
+                    failed.append(site)
+                    self.ui['status'].error(f"[{site}] failed: {e}")
+
+        self.publish()
+        print(self.results.site_summary().to_string(index=False))
+        if self.running:
+            done = f"All sites finished: {len(self.results)} lots"
+            if failed:
+                done += f" ({', '.join(failed)} failed)"
+            self.ui['status'].success(done)
+        return self.products
+
+    def _run_site(self, site, url, start_page, end_page, resume):
+        if not self.running:
+            return []
+        scraper = self.make_scraper(site, self.site_ui(site), self.results.site_store(site))
+        with self._lock:
+            self._scrapers[site] = scraper
+        if not self.running:
+            scraper.stop()
+        return scraper.run(site, url, start_page, end_page, resume=resume)
+
+    def publish(self, table=False):
+        self.ui['metrics']['lots'].metric("Lots Scraped", len(self.results))
+        self.ui['metrics']['recovery'].metric(
+            "Average Recovery", f"{self.results.mean_recovery:.1f}%", help=self.results.recovery_caption()
+        )
+        if table:
+            self.ui['dataframe'].dataframe(self.results.tail_frame(MERGED_TABLE_ROWS), use_container_width=True)
+
+    def site_ui(self, site):
+        """ui_placeholders for one site's scraper, routed into the shared widgets"""
+        def status(method, args, kwargs):
+            if args:
+                args = (f"[{site}] {args[0]}",) + args[1:]
+            getattr(self.ui['status'], method)(*args, **kwargs)
+
+        def pages(method, args, kwargs):
+            # A site scraper reports the number of each page it reaches; count them, not add them up
+            if method == 'metric' and len(args) > 1:
+                with self._lock:
+                    self._pages[site] = self._pages.get(site, 0) + 1
+                    total = sum(self._pages.values())
+                self.ui['metrics']['pages'].metric("Pages Scraped", total)
+
+        def cache_hits(method, args, kwargs):
+            # Each site has its own price cache and reports "hits/lookups"
+            if method == 'metric' and len(args) > 1:
+                try:
+                    hits, lookups = (int(n) for n in str(args[1]).split("/"))
+                except ValueError:
+                    return
+                with self._lock:
+                    self._cache_hits[site] = (hits, lookups)
+                    hits = sum(h for h, _ in self._cache_hits.values())
+                    lookups = sum(n for _, n in self._cache_hits.values())
+                self.ui['metrics']['cache'].metric("AI Cache Hits", f"{hits}/{lookups}")
+
+        def forward(key):
+            return lambda method, args, kwargs: getattr(self.ui[key], method)(*args, **kwargs)
+
+        metrics = {
+            'pages': _Forward(pages),
+            'lots': _Forward(lambda method, args, kwargs: self.publish()),
+            'recovery': _Forward(lambda method, args, kwargs: None),
+        }
+        if 'cache' in self.ui['metrics']:
+            metrics['cache'] = _Forward(cache_hits)
+        return {
+            'status': _Forward(status),
+            'progress': _Forward(forward('progress')),
+            'dataframe': _Forward(lambda method, args, kwargs: self.publish(table=True)),
+            'metrics': metrics,
+        }
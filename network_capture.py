@@ -0,0 +1,208 @@
+"""
+Network Capture Module
+Lots straight from a site's own JSON responses instead of its rendered HTML.
+
+Single-page auction apps render their lots from JSON XHR responses, and
+an adapter that sets api_url_pattern (HiBid) reads those instead. A Chrome
+started with launch_chrome(capture_network=True) logs every DevTools
+Network event to its performance log; NetworkCapture picks out the JSON
+responses whose URL matches the adapter's api_url_pattern and reads their
+bodies with Network.getResponseBody, so the adapter's extract_api_lots()
+works on the parsed JSON and page_source is never serialized or parsed.
+
+Captured responses can be recorded as fixtures (set NETWORK_FIXTURES_DIR)
+and replayed offline against the adapters:
+
+    python network_capture.py fixtures/network/HiBid_page1_*.json [--show 5]
+
+A site only gets an API mapping once a recorded payload for it replays
+cleanly; MAC.bid, BidLlama and BidAuctionDepot stay on the HTML path until
+then.
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import base64
+import argparse
+from datetime import datetime
+
+# Chrome logging preferences that put DevTools Network events in the performance log
+PERFORMANCE_LOGGING_PREFS = {'performance': 'ALL'}
+
+# When set, every captured listing page is also saved here as a replayable fixture
+FIXTURES_DIR = os.getenv("NETWORK_FIXTURES_DIR")
+
+# Captured responses must stop arriving for this long before a page counts as loaded
+QUIET_PERIOD = 0.75
+POLL_INTERVAL = 0.2
+
+
+def enable_performance_log(options):
+    """Turn on the performance log for a ChromeOptions (the driver then keeps Network events)"""
+    options.set_capability('goog:loggingPrefs', PERFORMANCE_LOGGING_PREFS)
+    return options
+
+
+def network_events(driver):
+    """(method, params) of the DevTools Network events logged since the last read (the log empties on read)"""
+    for entry in driver.get_log('performance'):
+        try:
+            message = json.loads(entry['message'])['message']
+        except (KeyError, ValueError):
+            continue
+        if message.get('method', '').startswith('Network.'):
+            yield message['method'], message.get('params', {})
+
+
+class NetworkCapture:
+    """
+    JSON responses seen by one driver whose URL matches url_pattern.
+
+    Each call to drain() returns the (url, parsed body) pairs that finished
+    loading since the previous call. One instance per driver; a driver's
+    performance log is emptied by every read, so two captures on the same
+    driver would steal each other's events.
+    """
+
+    def __init__(self, driver, url_pattern):
+        self.driver = driver
+        self.pattern = re.compile(url_pattern)
+        self._pending = {}
+        self.responses_seen = 0
+
+    def discard(self):
+        """Forget everything logged so far (call right before navigating)"""
+        self.driver.get_log('performance')
+        self._pending.clear()
+
+    def drain(self):
+        captured = []
+        for method, params in network_events(self.driver):
+            if method == 'Network.responseReceived':
+                response = params.get('response', {})
+                if 'json' in response.get('mimeType', '') and self.pattern.search(response.get('url', '')):
+                    self._pending[params['requestId']] = response['url']
+            elif method == 'Network.loadingFinished':
+                url = self._pending.pop(params.get('requestId'), None)
+                if url is not None:
+                    body = self._body(params['requestId'], url)
+                    if body is not None:
+                        captured.append((url, body))
+            elif method == 'Network.loadingFailed':
+                self._pending.pop(params.get('requestId'), None)
+        self.responses_seen += len(captured)
+        return captured
+
+    def wait(self, timeout, quiet_period=QUIET_PERIOD):
+        """
+        Responses from the page load in progress: returns once at least one
+        has arrived and no new one came for quiet_period, or at timeout
+        (possibly empty, in which case the caller falls back to the HTML).
+        """
+        captured = []
+        deadline = time.monotonic() + timeout
+        last_arrival = None
+        while time.monotonic() < deadline:
+            new = self.drain()
+            now = time.monotonic()
+            if new:
+                captured.extend(new)
+                last_arrival = now
+            elif last_arrival is not None and now - last_arrival >= quiet_period:
+                break
+            time.sleep(POLL_INTERVAL)
+        return captured
+
+    def _body(self, request_id, url):
+        try:
+            result = self.driver.execute_cdp_cmd('Network.getResponseBody', {'requestId': request_id})
+            body = result.get('body', '')
+            if result.get('base64Encoded'):
+                body = base64.b64decode(body).decode('utf-8', errors='replace')
+            return json.loads(body)
+        except Exception as e:
+            # Bodies are evicted from Chrome's buffer after a while, and some "json" responses are not
+            print(f"Could not read captured response {url}: {e}")
+            return None
+
+
+def find_records(data, keys):
+    """Every dict nested anywhere in data that has all of keys (lot records inside an API envelope)"""
+    stack = [data]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            if all(key in node for key in keys):
+                yield node
+            else:
+                stack.extend(reversed(list(node.values())))
+        elif isinstance(node, list):
+            stack.extend(reversed(node))
+
+
+def field(record, *paths):
+    """First non-empty value among dotted paths ('lotState.priceRealized') of a record, or None"""
+    for path in paths:
+        value = record
+        for part in path.split('.'):
+            value = value.get(part) if isinstance(value, dict) else None
+            if value is None:
+                break
+        if value not in (None, ''):
+            return value
+    return None
+
+
+# === Fixtures ===
+
+def save_fixture(site, page, responses, directory=None):
+    """Write one page's captured responses to a JSON fixture; returns its path"""
+    directory = directory or FIXTURES_DIR
+    os.makedirs(directory, exist_ok=True)
+    stamp = datetime.now().strftime('%Y%m%d_%H%M%S_%f')
+    path = os.path.join(directory, f"{re.sub(r'[^A-Za-z0-9]+', '', site)}_page{page}_{stamp}.json")
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'site': site, 'page': page,
+                   'responses': [{'url': url, 'body': body} for url, body in responses]}, f)
+    return path
+
+
+def load_fixture(path):
+    """(site, page, [(url, body), ...]) from a fixture written by save_fixture"""
+    with open(path, encoding='utf-8') as f:
+        data = json.load(f)
+    return data['site'], data['page'], [(r['url'], r['body']) for r in data['responses']]
+
+
+def main():
+    from site_adapters import SITE_ADAPTERS
+
+    parser = argparse.ArgumentParser(description="Replay recorded network fixtures through the site adapters")
+    parser.add_argument("fixtures", nargs="+", help="fixture files written with NETWORK_FIXTURES_DIR set")
+    parser.add_argument("--url", default="", help="listing URL the adapter is built with (for relative lot links)")
+    parser.add_argument("--show", type=int, default=3, help="lots printed per fixture")
+    args = parser.parse_args()
+
+    failed = False
+    for path in args.fixtures:
+        site, page, responses = load_fixture(path)
+        cls = SITE_ADAPTERS.get(site)
+        if cls is None or cls.api_url_pattern is None:
+            print(f"{path}: {site} has no network extraction")
+            failed = True
+            continue
+        adapter = cls(args.url)
+        lots = adapter.extract_api_lots(responses, page)
+        usable = [lot for lot in lots if lot]
+        print(f"{path}: {site} page {page} - {len(responses)} responses, {len(usable)}/{len(lots)} usable lots")
+        for lot in usable[:args.show]:
+            print(f"    {lot}")
+        failed = failed or not usable
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
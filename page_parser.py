@@ -0,0 +1,276 @@
+"""
+Page Parser Module
+Shared HTML parsing layer for the scrapers.
+
+parse_html() returns a small Document/Node wrapper with CSS select(),
+select_one(), text and get(), backed by selectolax, BeautifulSoup + lxml
+or BeautifulSoup + html.parser, whichever is fastest and installed (or
+whatever a site is pinned to). make_soup() is for the scrapers that still
+walk BeautifulSoup trees directly: it uses the lxml builder when available
+and, when given a scope, only builds the product containers
+(SoupStrainer) instead of the whole page.
+
+Long Tailwind class strings are matched with exact [class="..."]
+selectors, which mean the same thing as BeautifulSoup's class_="a b c"
+and avoid escaping ':' and '[' in class names.
+"""
+
+import os
+import re
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+try:
+    from selectolax.parser import HTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+
+try:
+    import lxml  # noqa: F401
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+# Fastest first
+BACKENDS = ["selectolax", "lxml", "html.parser"]
+
+# Optional override for every site, e.g. HTML_PARSER_BACKEND=html.parser
+BACKEND_OVERRIDE = os.getenv("HTML_PARSER_BACKEND")
+
+# Sites whose extractors go through parse_html(); None = fastest available
+SITE_BACKENDS = {
+    "Nellis": None,
+    "BidFTA": None,
+}
+
+
+def _has_class(*names):
+    """Strainer-safe class test: while parsing, class is still one unsplit string"""
+    return re.compile(r'(^|\s)(' + '|'.join(re.escape(n) for n in names) + r')(\s|$)')
+
+
+# SoupStrainer arguments limiting make_soup() to the part of a page a scraper reads
+PARSE_SCOPES = {
+    "HiBid": {"name": "app-lot-tile"},
+    "BiddingKings": {"name": "div", "class_": re.compile(r'lot-repeater-index')},
+    "BiddingKings detail": {"name": "span", "class_": _has_class("sold-amount")},
+    "BidLlama": {"name": "div", "class_": "item-row grid"},
+    "Vista": {"name": "section"},
+    "A-Stock": {"name": "section"},
+    "702Auctions": {"name": "section"},
+    "Nellis listing": {"name": ["li", "a"], "class_": _has_class("__list-item-base", "__pagination-link")},
+}
+
+
+def available_backends():
+    return [
+        backend for backend in BACKENDS
+        if (backend != "selectolax" or SELECTOLAX_AVAILABLE) and (backend != "lxml" or LXML_AVAILABLE)
+    ]
+
+
+def resolve_backend(site=None, backend=None):
+    """Backend to use: explicit > env override > site pin > fastest installed"""
+    wanted = backend or BACKEND_OVERRIDE or SITE_BACKENDS.get(site)
+    installed = available_backends()
+    if wanted in installed:
+        return wanted
+    if wanted:
+        print(f"HTML parser backend '{wanted}' not installed, using {installed[0]}")
+    return installed[0]
+
+
+def soup_builder():
+    return "lxml" if LXML_AVAILABLE else "html.parser"
+
+
+def make_soup(html, scope=None):
+    """BeautifulSoup tree (lxml builder when available), restricted to PARSE_SCOPES[scope]"""
+    strainer = SoupStrainer(**PARSE_SCOPES[scope]) if scope else None
+    return BeautifulSoup(html, soup_builder(), parse_only=strainer)
+
+
+class Node:
+    """Backend-neutral element: select(), select_one(), text, get(), classes"""
+
+    __slots__ = ("_node", "_lax")
+
+    def __init__(self, node, lax):
+        self._node = node
+        self._lax = lax
+
+    def select(self, css):
+        if self._lax:
+            return [Node(n, True) for n in self._node.css(css)]
+        return [Node(n, False) for n in self._node.select(css)]
+
+    def select_one(self, css):
+        found = self._node.css_first(css) if self._lax else self._node.select_one(css)
+        return Node(found, self._lax) if found is not None else None
+
+    @property
+    def text(self):
+        if self._lax:
+            return self._node.text(deep=True)
+        return self._node.get_text()
+
+    def get(self, attr, default=None):
+        if self._lax:
+            value = self._node.attributes.get(attr)
+            return default if value is None else value
+        return self._node.get(attr, default)
+
+    @property
+    def classes(self):
+        value = self.get("class") or []
+        return value.split() if isinstance(value, str) else list(value)
+
+
+class Document(Node):
+    """A parsed page; `backend` says which parser built it"""
+
+    __slots__ = ("backend",)
+
+    def __init__(self, html, backend, scope=None):
+        self.backend = backend
+        if backend == "selectolax":
+            super().__init__(HTMLParser(html), True)
+        else:
+            strainer = SoupStrainer(**PARSE_SCOPES[scope]) if scope else None
+            super().__init__(BeautifulSoup(html, backend, parse_only=strainer), False)
+
+
+def parse_html(html, site=None, scope=None, backend=None):
+    """Parse html with the site's backend; scope only narrows the BeautifulSoup backends"""
+    return Document(html, resolve_backend(site, backend), scope)
+
+
+# === Extractors for the request-based sites (pure functions of a Document) ===
+
+NELLIS_SOLD_PRICE = ('p[class="text-gray-900 font-semibold line-clamp-1 text-label-sm xxs:text-title-xs '
+                     'xs:text-label-md sm:text-title-xs md:text-title-sm lg:text-title-md xl:text-title-sm '
+                     'xxl:text-title-xs"]')
+NELLIS_RETAIL_PRICE = 'div[class="flex flex-col text-left"]'
+NELLIS_RETAIL_PRICE_GRID = 'div[class="grid grid-cols-[minmax(0,_0.6fr)_minmax(0,_1fr)] gap-2 text-left"]'
+NELLIS_CATEGORY = ('a[class="flex items-center gap-1 text-secondary focus-within:outline-secondary '
+                   'hover:underline hover:text-secondary-light w-fit"]')
+
+BIDFTA_GRID = 'div[class="grid grid-cols-1 gap-5 md:gap-6 pb-8 xl:pb-16 md:grid-cols-3 2xl:grid-cols-4"]'
+BIDFTA_SOLD_PRICE = 'div[class="flex gap-1 xs:gap-2 items-end text-bidfta-blue-light"]'
+BIDFTA_RETAIL_PRICE = 'div[class="flex gap-1 xs:gap-2 items-end"]'
+
+
+def extract_nellis_listing(doc, page):
+    """(product hrefs, next page href or None) from a Nellis search page"""
+    hrefs = []
+    for item in doc.select("li.__list-item-base"):
+        link_tag = item.select_one("a")
+        if link_tag and link_tag.get("href"):
+            hrefs.append(link_tag.get("href"))
+
+    next_page = None
+    for link in doc.select("a.__pagination-link"):
+        if "__pagination-arrow-rotate-right" in link.classes:
+            next_page = link.get("href")
+            break
+        elif link.text.strip() == str(page + 1):
+            next_page = link.get("href")
+            break
+    return hrefs, next_page
+
+
+def extract_nellis_detail(doc):
+    """Lot fields from a Nellis product page, or None if it has no sold or retail price"""
+    title = doc.select_one("h1")
+    title = title.text if title else "Unknown Title"
+
+    sold_price = None
+    for x in doc.select(NELLIS_SOLD_PRICE):
+        if "$" in x.text:
+            sold_price = x.text
+            break
+    if sold_price is None:
+        return None
+
+    retail_price = None
+    for selector in (NELLIS_RETAIL_PRICE, NELLIS_RETAIL_PRICE_GRID):
+        for x in doc.select(selector):
+            if "Estimated Retail Price" in x.text:
+                retail_price = x.text.replace("Estimated Retail Price", "").strip()
+                break
+        if retail_price is not None:
+            break
+    if retail_price is None:
+        return None
+
+    category = " "
+    category_tag = doc.select_one(NELLIS_CATEGORY)
+    if category_tag:
+        category = category_tag.text.strip()
+
+    return {
+        'title': title,
+        'sold_price_text': sold_price,
+        'retail_price_text': retail_price,
+        'category': category
+    }
+
+
+def extract_bidfta_listing(doc):
+    """Product hrefs from a BidFTA listing page, or None if the product grid is missing"""
+    grid = doc.select_one(BIDFTA_GRID)
+    if not grid:
+        return None
+    hrefs = []
+    for block in grid.select("div.block"):
+        link_tag = block.select_one("a")
+        if link_tag and link_tag.get("href"):
+            hrefs.append(link_tag.get("href"))
+    return hrefs
+
+
+def _bidfta_amount(text, label):
+    amount = re.sub(r"[^\d.]", "", text.replace("\n", "").replace(label, "").strip())
+    if amount.startswith("."):
+        amount = amount[1:]
+    if amount.endswith("."):
+        amount = amount[:-1]
+    return amount
+
+
+def extract_bidfta_detail(doc):
+    """Lot fields from a BidFTA product page, or None if it has no current bid or MSRP"""
+    title_elem = doc.select_one("h2")
+    title = title_elem.text.strip() if title_elem else "Unknown Title"
+
+    sold_price = None
+    for elem in doc.select(BIDFTA_SOLD_PRICE):
+        if "CURRENT BID" in elem.text:
+            sold_price = _bidfta_amount(elem.text, "CURRENT BID")
+            break
+    if sold_price is None:
+        return None
+
+    retail_price = None
+    for elem in doc.select(BIDFTA_RETAIL_PRICE):
+        if "MSRP" in elem.text:
+            retail_price = _bidfta_amount(elem.text, "MSRP")
+            break
+    if retail_price is None:
+        return None
+
+    return {
+        'title': title,
+        'sold_price_text': sold_price,
+        'retail_price_text': retail_price
+    }
+
+
+# Saved-fixture extractors for parser_benchmark.py: kind -> (site, scope, extract(doc))
+FIXTURE_EXTRACTORS = {
+    "nellis_listing": ("Nellis", "Nellis listing", lambda doc: extract_nellis_listing(doc, 1)),
+    "nellis_detail": ("Nellis", None, extract_nellis_detail),
+    "bidfta_listing": ("BidFTA", None, extract_bidfta_listing),
+    "bidfta_detail": ("BidFTA", None, extract_bidfta_detail),
+}
@@ -0,0 +1,135 @@
+"""
+Page Ready Module
+Readiness waits for the Selenium scrapers.
+
+Instead of sleeping a fixed number of seconds after driver.get(), a scraper
+waits until the document has finished loading, its lot selector matches, and
+the number of matches has stopped changing for a short quiet period. Each
+site keeps a timing profile of how long its pages really took to become
+ready; the wait timeout is derived from it (smoothed mean plus four
+deviations, like a TCP retransmit timer), so a missing page is detected
+quickly on a fast site without cutting off a slow one.
+"""
+
+import time
+import threading
+
+DEFAULT_MAX_TIMEOUT = 40
+MIN_TIMEOUT = 10
+# Matches must hold steady this long before the page counts as rendered
+QUIET_PERIOD = 0.5
+POLL_INTERVAL = 0.1
+# Until a site has this many samples the wait uses its full max_timeout
+MIN_SAMPLES = 3
+
+READY_STATE_SCRIPT = "return [document.readyState, document.querySelectorAll(arguments[0]).length];"
+
+
+class TimingProfile:
+    """Smoothed page-ready times for one site (thread-safe)"""
+
+    def __init__(self, site, max_timeout=DEFAULT_MAX_TIMEOUT, min_timeout=MIN_TIMEOUT):
+        self.site = site
+        self.max_timeout = max_timeout
+        self.min_timeout = min(min_timeout, max_timeout)
+        self.samples = 0
+        self.mean = None
+        self.deviation = 0.0
+        self.slowest = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, seconds):
+        with self._lock:
+            self.samples += 1
+            self.slowest = max(self.slowest, seconds)
+            if self.mean is None:
+                self.mean = seconds
+                self.deviation = seconds / 2
+            else:
+                error = seconds - self.mean
+                self.mean += error / 8
+                self.deviation += (abs(error) - self.deviation) / 4
+
+    @property
+    def timeout(self):
+        with self._lock:
+            if self.samples < MIN_SAMPLES:
+                return self.max_timeout
+            return min(self.max_timeout, max(self.min_timeout, self.mean + 4 * self.deviation))
+
+    def summary(self):
+        if self.mean is None:
+            return f"{self.site}: no samples"
+        return (f"{self.site}: {self.samples} pages, ready in ~{self.mean:.1f}s "
+                f"(slowest {self.slowest:.1f}s, timeout {self.timeout:.1f}s)")
+
+
+_profiles = {}
+_profiles_lock = threading.Lock()
+
+
+def get_profile(site, max_timeout=DEFAULT_MAX_TIMEOUT):
+    """Process-wide timing profile for a site (max_timeout applies on first use)"""
+    with _profiles_lock:
+        profile = _profiles.get(site)
+        if profile is None:
+            profile = TimingProfile(site, max_timeout=max_timeout)
+            _profiles[site] = profile
+        return profile
+
+
+def _is_stale(element):
+    try:
+        element.tag_name
+        return False
+    except Exception:
+        return True
+
+
+def wait_until_ready(driver, site, selector, max_timeout=DEFAULT_MAX_TIMEOUT, stale_element=None):
+    """
+    Block until the page is loaded and `selector` matches a stable number of
+    elements. With stale_element, first wait for that element to leave the DOM
+    (for click-driven pagination that keeps the old page around).
+    Returns True when ready, False if nothing matched before the timeout.
+    """
+    profile = get_profile(site, max_timeout)
+    timeout = profile.timeout
+    start = time.monotonic()
+    deadline = start + timeout
+
+    if stale_element is not None:
+        while not _is_stale(stale_element):
+            if time.monotonic() >= deadline:
+                print(f"{site}: previous page still showing after {timeout:.1f}s")
+                return False
+            time.sleep(POLL_INTERVAL)
+
+    last_count = None
+    stable_since = None
+    while True:
+        now = time.monotonic()
+        state, count = driver.execute_script(READY_STATE_SCRIPT, selector)
+
+        if state == "complete" and count:
+            if count != last_count or stable_since is None:
+                stable_since = now
+            elif now - stable_since >= QUIET_PERIOD:
+                elapsed = stable_since - start
+                profile.record(elapsed)
+                print(f"{site}: page ready in {elapsed:.1f}s ({count} matches)")
+                return True
+        else:
+            stable_since = None
+        last_count = count
+
+        if now >= deadline:
+            if count:
+                # Still changing at the deadline, but there is content to parse
+                profile.record(timeout)
+                print(f"{site}: page still changing after {timeout:.1f}s, parsing what is there")
+                return True
+            print(f"{site}: nothing matched {selector!r} within {timeout:.1f}s")
+            return False
+
+        time.sleep(POLL_INTERVAL)
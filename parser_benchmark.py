@@ -0,0 +1,110 @@
+"""
+Parser Benchmark
+Pages/sec for each HTML parser backend on saved pages.
+
+Save a few real pages first. A fixture's file name starts with its kind,
+which picks the extractor (see page_parser.FIXTURE_EXTRACTORS):
+
+    python parser_benchmark.py --save nellis_detail https://www.nellisauction.com/p/...
+    python parser_benchmark.py --save bidfta_listing https://www.bidfta.com/.../1
+
+then run:
+
+    python parser_benchmark.py [--fixtures fixtures] [--repeat 20]
+
+Each backend parses and extracts every fixture `repeat` times; results that
+differ from the first backend are flagged so a faster parser cannot
+silently change what gets scraped.
+"""
+
+import os
+import sys
+import glob
+import time
+import argparse
+
+import requests
+
+from page_parser import FIXTURE_EXTRACTORS, available_backends, parse_html
+
+DEFAULT_FIXTURES_DIR = "fixtures"
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+
+def fixture_kind(path):
+    name = os.path.basename(path)
+    for kind in sorted(FIXTURE_EXTRACTORS, key=len, reverse=True):
+        if name.startswith(kind):
+            return kind
+    return None
+
+
+def save_fixture(fixtures_dir, kind, url):
+    if kind not in FIXTURE_EXTRACTORS:
+        sys.exit(f"Unknown fixture kind '{kind}', expected one of: {', '.join(FIXTURE_EXTRACTORS)}")
+    os.makedirs(fixtures_dir, exist_ok=True)
+    response = requests.get(url, headers={'User-Agent': USER_AGENT}, timeout=30)
+    response.raise_for_status()
+    n = len(glob.glob(os.path.join(fixtures_dir, f"{kind}*.html"))) + 1
+    path = os.path.join(fixtures_dir, f"{kind}_{n}.html")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(response.text)
+    print(f"Saved {len(response.text):,} chars to {path}")
+
+
+def run_benchmark(fixtures_dir, repeat):
+    fixtures = []
+    for path in sorted(glob.glob(os.path.join(fixtures_dir, "*.html"))):
+        kind = fixture_kind(path)
+        if kind is None:
+            print(f"Skipping {path}: name does not start with a known kind")
+            continue
+        with open(path, encoding="utf-8") as f:
+            fixtures.append((path, kind, f.read()))
+
+    if not fixtures:
+        sys.exit(f"No fixtures in {fixtures_dir} - save some with --save KIND URL")
+
+    backends = available_backends()
+    print(f"Backends: {', '.join(backends)}")
+    print(f"{len(fixtures)} fixtures x {repeat} repeats\n")
+    print(f"{'fixture':<32} {'KB':>7} " + " ".join(f"{b:>12}" for b in backends))
+
+    totals = {backend: 0.0 for backend in backends}
+    for path, kind, html in fixtures:
+        site, scope, extract = FIXTURE_EXTRACTORS[kind]
+        cells = []
+        expected = None
+        for backend in backends:
+            start = time.perf_counter()
+            for _ in range(repeat):
+                result = extract(parse_html(html, site, scope, backend=backend))
+            elapsed = time.perf_counter() - start
+            totals[backend] += elapsed
+
+            if expected is None:
+                expected = result
+            mismatch = "" if result == expected else " !"
+            cells.append(f"{repeat / elapsed:>10.1f}/s{mismatch}")
+        print(f"{os.path.basename(path):<32} {len(html) / 1024:>7.0f} " + " ".join(cells))
+
+    pages = len(fixtures) * repeat
+    print(f"\n{'overall':<32} {'':>7} " + " ".join(f"{pages / totals[b]:>10.1f}/s" for b in backends))
+    print("\n'!' = extracted fields differ from the first backend")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark HTML parser backends on saved pages")
+    parser.add_argument("--fixtures", default=DEFAULT_FIXTURES_DIR, help="directory of saved .html pages")
+    parser.add_argument("--repeat", type=int, default=20, help="parses per fixture per backend")
+    parser.add_argument("--save", nargs=2, metavar=("KIND", "URL"), help="download URL as a fixture of KIND")
+    args = parser.parse_args()
+
+    if args.save:
+        save_fixture(args.fixtures, *args.save)
+    else:
+        run_benchmark(args.fixtures, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
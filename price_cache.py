@@ -0,0 +1,115 @@
+"""
+Price Cache Module
+Persistent SQLite cache of AI retail-price lookups.
+
+Entries are keyed by the normalized lot title plus a hash of the original
+image bytes, so re-scraping a catalog (or the same item listed again) reuses the
+earlier answer instead of paying for another Gemini call. Entries expire
+after a TTL. Writes keep a running row count instead of scanning the table;
+only when it passes max_entries are expired rows, then the least recently
+used ones, deleted in one batch down to EVICT_TO_FRACTION of max_entries.
+"""
+
+import os
+import re
+import time
+import sqlite3
+import hashlib
+import threading
+
+DEFAULT_CACHE_PATH = os.getenv("PRICE_CACHE_PATH", os.path.join(".cache", "retail_prices.sqlite3"))
+DEFAULT_TTL_SECONDS = 30 * 24 * 3600
+DEFAULT_MAX_ENTRIES = 50000
+# Share of max_entries left after an eviction, so trimming runs once per batch of new rows
+EVICT_TO_FRACTION = 0.9
+
+
+def normalize_title(title):
+    title = re.sub(r'[^\w\s]', ' ', (title or '').lower())
+    return re.sub(r'\s+', ' ', title).strip()
+
+
+def make_cache_key(title, image_hash):
+    """image_hash is the SHA-256 hex digest of the downloaded (unprocessed) image"""
+    return hashlib.sha256(f"{normalize_title(title)}\0{image_hash}".encode()).hexdigest()
+
+
+class PriceCache:
+    """Thread-safe TTL + LRU cache of 'PRICE, URL' answers with hit/miss counters"""
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, ttl_seconds=DEFAULT_TTL_SECONDS, max_entries=DEFAULT_MAX_ENTRIES):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS retail_prices ("
+            "cache_key TEXT PRIMARY KEY, result TEXT NOT NULL, "
+            "created_at REAL NOT NULL, last_used REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_retail_prices_last_used ON retail_prices(last_used)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_retail_prices_created_at ON retail_prices(created_at)")
+        self._conn.execute("DELETE FROM retail_prices WHERE created_at < ?", (time.time() - ttl_seconds,))
+        self._conn.commit()
+        self._count = self._conn.execute("SELECT COUNT(*) FROM retail_prices").fetchone()[0]
+
+    def get(self, key):
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT result, created_at FROM retail_prices WHERE cache_key = ?", (key,)
+            ).fetchone()
+            if row and now - row[1] <= self.ttl_seconds:
+                self._conn.execute("UPDATE retail_prices SET last_used = ? WHERE cache_key = ?", (now, key))
+                self._conn.commit()
+                self.hits += 1
+                return row[0]
+            if row:
+                self._conn.execute("DELETE FROM retail_prices WHERE cache_key = ?", (key,))
+                self._conn.commit()
+                self._count -= 1
+            self.misses += 1
+            return None
+
+    def put(self, key, result):
+        now = time.time()
+        with self._lock:
+            existing = self._conn.execute("SELECT 1 FROM retail_prices WHERE cache_key = ?", (key,)).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO retail_prices (cache_key, result, created_at, last_used) VALUES (?, ?, ?, ?)",
+                (key, result, now, now)
+            )
+            if not existing:
+                self._count += 1
+            self._evict(now)
+            self._conn.commit()
+
+    def _evict(self, now):
+        if self._count <= self.max_entries:
+            return
+        self._count -= self._conn.execute(
+            "DELETE FROM retail_prices WHERE created_at < ?", (now - self.ttl_seconds,)
+        ).rowcount
+        keep = int(self.max_entries * EVICT_TO_FRACTION)
+        if self._count > keep:
+            self._count -= self._conn.execute(
+                "DELETE FROM retail_prices WHERE cache_key IN "
+                "(SELECT cache_key FROM retail_prices ORDER BY last_used ASC LIMIT ?)",
+                (self._count - keep,)
+            ).rowcount
+
+    @property
+    def lookups(self):
+        return self.hits + self.misses
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
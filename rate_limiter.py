@@ -0,0 +1,176 @@
+"""
+Rate Limiter Module
+Thread-safe token buckets shared by every outbound API / host client.
+
+Use get_limiter(key, ...) to get the single bucket for a credential or host,
+so every caller in the process draws from the same quota. Buckets work from
+plain threads (acquire) and from asyncio code (acquire_async), and back off
+on 429 / RESOURCE_EXHAUSTED responses using the server's retry-after hint
+when one is given.
+"""
+
+import re
+import time
+import asyncio
+import hashlib
+import threading
+from email.utils import parsedate_to_datetime
+
+BASE_BACKOFF_SECONDS = 2.0
+MAX_BACKOFF_SECONDS = 120.0
+
+_RETRY_HINT_PATTERNS = [
+    re.compile(r"retryDelay['\"]?\s*:\s*['\"]?(\d+(?:\.\d+)?)s", re.IGNORECASE),
+    re.compile(r"retry (?:again )?in (\d+(?:\.\d+)?)\s*(ms|s)", re.IGNORECASE),
+]
+
+
+# A bare "429" in a message can be a lot ID, URL or price; only count it next to a status word
+_RATE_LIMIT_TEXT = re.compile(
+    r"(?:status|code|http|error)\W{0,3}(?:code\W{0,3})?\b429\b|too many requests|resource_exhausted|rate limit",
+    re.IGNORECASE,
+)
+
+
+def is_rate_limit_error(error):
+    """True for HTTP 429 / quota errors from requests, aiohttp, OpenAI or google-genai"""
+    for source in (error, getattr(error, 'response', None)):
+        for attr in ('status_code', 'status', 'code'):
+            if getattr(source, attr, None) == 429:
+                return True
+    return bool(_RATE_LIMIT_TEXT.search(str(error)))
+
+
+def retry_after_from(source):
+    """
+    Seconds the server asked us to wait, or None.
+    Accepts a response (Retry-After header), an exception carrying .response,
+    or an error whose message contains a retry delay (google-genai retryDelay).
+    """
+    headers = getattr(source, 'headers', None)
+    if headers is None:
+        headers = getattr(getattr(source, 'response', None), 'headers', None)
+    if headers:
+        try:
+            retry_ms = headers.get('retry-after-ms') or headers.get('Retry-After-Ms')
+            if retry_ms:
+                return float(retry_ms) / 1000
+            retry_after = headers.get('retry-after') or headers.get('Retry-After')
+            if retry_after:
+                try:
+                    return max(0.0, float(retry_after))
+                except ValueError:
+                    return max(0.0, parsedate_to_datetime(retry_after).timestamp() - time.time())
+        except Exception:
+            pass
+
+    text = str(source)
+    for pattern in _RETRY_HINT_PATTERNS:
+        match = pattern.search(text)
+        if match:
+            seconds = float(match.group(1))
+            if len(match.groups()) > 1 and match.group(2) and match.group(2).lower() == 'ms':
+                seconds /= 1000
+            return seconds
+    return None
+
+
+class TokenBucket:
+    """
+    Token bucket refilled at rate_per_minute, holding up to `capacity` tokens.
+
+    backoff() empties the bucket and blocks it until the retry-after hint (or
+    an exponential fallback) has passed; record_success() resets the
+    exponential step.
+    """
+
+    def __init__(self, rate_per_minute, capacity=None, name="limiter", max_backoff=MAX_BACKOFF_SECONDS):
+        self.name = name
+        self.rate_per_minute = rate_per_minute
+        self.rate = rate_per_minute / 60.0
+        self.capacity = float(capacity or max(1, rate_per_minute))
+        self.max_backoff = max_backoff
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self.consecutive_limits = 0
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens=1):
+        """Take tokens if available and return 0, otherwise return the seconds to wait"""
+        with self._lock:
+            now = time.monotonic()
+            if now < self.blocked_until:
+                return self.blocked_until - now
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= tokens:
+                self.tokens -= tokens
+                return 0.0
+            return (tokens - self.tokens) / self.rate
+
+    def acquire(self, tokens=1, stop_event=None, timeout=None):
+        """Block until tokens are taken. Returns False on stop_event or timeout"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            wait = self.reserve(tokens)
+            if wait <= 0:
+                return True
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                wait = min(wait, remaining)
+            if wait > 5:
+                print(f"[{self.name}] Waiting {wait:.0f}s for rate limit...")
+            if stop_event is not None:
+                if stop_event.wait(wait):
+                    return False
+            else:
+                time.sleep(wait)
+
+    async def acquire_async(self, tokens=1):
+        while True:
+            wait = self.reserve(tokens)
+            if wait <= 0:
+                return
+            await asyncio.sleep(wait)
+
+    def backoff(self, error=None, retry_after=None):
+        """Register a 429 and block the bucket. Returns the delay applied in seconds"""
+        if retry_after is None and error is not None:
+            retry_after = retry_after_from(error)
+        with self._lock:
+            self.consecutive_limits += 1
+            if retry_after is None:
+                retry_after = BASE_BACKOFF_SECONDS * 2 ** (self.consecutive_limits - 1)
+            retry_after = min(self.max_backoff, retry_after)
+            now = time.monotonic()
+            self.blocked_until = max(self.blocked_until, now + retry_after)
+            self.tokens = 0.0
+            self.updated = now
+        print(f"[{self.name}] Rate limited - backing off {retry_after:.1f}s")
+        return retry_after
+
+    def record_success(self):
+        with self._lock:
+            self.consecutive_limits = 0
+
+
+_limiters = {}
+_limiters_lock = threading.Lock()
+
+
+def credential_key(prefix, secret):
+    """Stable limiter key for a credential that never contains the secret itself"""
+    return f"{prefix}:{hashlib.sha256((secret or '').encode()).hexdigest()[:12]}"
+
+
+def get_limiter(key, rate_per_minute, capacity=None):
+    """Return the process-wide TokenBucket for key, creating it on first use"""
+    with _limiters_lock:
+        limiter = _limiters.get(key)
+        if limiter is None:
+            limiter = TokenBucket(rate_per_minute, capacity, name=key)
+            _limiters[key] = limiter
+        return limiter
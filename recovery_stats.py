@@ -0,0 +1,202 @@
+"""
+Recovery Stats Module
+Incremental recovery statistics for the live metrics and the export summary.
+
+RunningStats keeps count, mean and variance (Welford's update), min and
+max, plus p10/p50/p90 estimated with the P² algorithm (Jain & Chlamtac),
+which tracks a quantile with five markers instead of storing the values
+(the first EXACT_VALUES are kept as-is, so small groups get exact answers).
+RecoveryStats holds one RunningStats overall and one per site and per
+category, updated in O(1) as each lot is added, so nothing ever rescans
+the results to answer "average / median recovery".
+"""
+
+import math
+
+import pandas as pd
+
+QUANTILES = (0.1, 0.5, 0.9)
+
+# Values held exactly before a quantile switches to its five P² markers
+EXACT_VALUES = 64
+
+
+class P2Quantile:
+    """Streaming estimate of one quantile in constant memory (P² algorithm)"""
+
+    __slots__ = ("p", "_initial", "_heights", "_positions", "_desired", "_increments")
+
+    def __init__(self, p):
+        self.p = p
+        self._initial = []
+        self._heights = None
+        self._positions = None
+        self._desired = None
+        self._increments = None
+
+    def add(self, x):
+        if self._heights is None:
+            self._initial.append(x)
+            if len(self._initial) == EXACT_VALUES:
+                self._start_markers()
+            return
+
+        q, n = self._heights, self._positions
+        if x < q[0]:
+            q[0] = x
+            k = 0
+        elif x >= q[4]:
+            q[4] = x
+            k = 3
+        else:
+            k = 0
+            while x >= q[k + 1]:
+                k += 1
+
+        for i in range(k + 1, 5):
+            n[i] += 1
+        for i in range(5):
+            self._desired[i] += self._increments[i]
+
+        for i in (1, 2, 3):
+            d = self._desired[i] - n[i]
+            if (d >= 1 and n[i + 1] - n[i] > 1) or (d <= -1 and n[i - 1] - n[i] < -1):
+                d = 1 if d > 0 else -1
+                height = self._parabolic(i, d)
+                if not q[i - 1] < height < q[i + 1]:
+                    height = q[i] + d * (q[i + d] - q[i]) / (n[i + d] - n[i])
+                q[i] = height
+                n[i] += d
+
+    def _start_markers(self):
+        """Seed the five markers at the min, p/2, p, (1+p)/2 and max order statistics of the exact values"""
+        p = self.p
+        values = sorted(self._initial)
+        last = len(values) - 1
+        self._desired = [0, last * p / 2, last * p, last * (1 + p) / 2, last]
+        self._positions = [round(d) for d in self._desired]
+        self._heights = [values[i] for i in self._positions]
+        self._increments = [0, p / 2, p, (1 + p) / 2, 1]
+        self._initial = None
+
+    def _parabolic(self, i, d):
+        q, n = self._heights, self._positions
+        return q[i] + d / (n[i + 1] - n[i - 1]) * (
+            (n[i] - n[i - 1] + d) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+            + (n[i + 1] - n[i] - d) * (q[i] - q[i - 1]) / (n[i] - n[i - 1])
+        )
+
+    @property
+    def value(self):
+        if self._heights is not None:
+            return self._heights[2]
+        if not self._initial:
+            return None
+        # Still exact: linear interpolation between order statistics
+        values = sorted(self._initial)
+        rank = self.p * (len(values) - 1)
+        low = int(rank)
+        high = min(low + 1, len(values) - 1)
+        return values[low] + (values[high] - values[low]) * (rank - low)
+
+
+class RunningStats:
+    """Welford mean / variance, min / max and P² quantiles of one stream of values"""
+
+    __slots__ = ("count", "mean", "_m2", "min", "max", "_quantiles")
+
+    def __init__(self, quantiles=QUANTILES):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min = None
+        self.max = None
+        self._quantiles = {q: P2Quantile(q) for q in quantiles}
+
+    def add(self, x):
+        x = float(x)
+        self.count += 1
+        delta = x - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (x - self.mean)
+        if self.min is None or x < self.min:
+            self.min = x
+        if self.max is None or x > self.max:
+            self.max = x
+        for sketch in self._quantiles.values():
+            sketch.add(x)
+
+    @property
+    def variance(self):
+        """Sample variance (0 until there are two values)"""
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def std(self):
+        return math.sqrt(self.variance)
+
+    def quantile(self, q):
+        return self._quantiles[q].value
+
+    def as_dict(self):
+        row = {"Lots": self.count, "Average Recovery": self.mean if self.count else None,
+               "Std Dev": self.std if self.count else None, "Min": self.min}
+        for q in self._quantiles:
+            row[f"P{round(q * 100)}"] = self.quantile(q)
+        row["Max"] = self.max
+        return row
+
+
+def quantile_caption(stats):
+    """'Median 52.3% · P10 40.1% · P90 71.0%' for a metric tooltip, or None before the first lot"""
+    if not stats.count:
+        return None
+    return f"Median {stats.quantile(0.5):.1f}% · P10 {stats.quantile(0.1):.1f}% · P90 {stats.quantile(0.9):.1f}% ({stats.count} lots)"
+
+
+class RecoveryStats:
+    """RunningStats of recovery % overall, per site and per category"""
+
+    def __init__(self):
+        self.overall = RunningStats()
+        self.by_site = {}
+        self.by_category = {}
+
+    def track_site(self, site):
+        """Make site show up in summaries even before it has lots"""
+        return self.by_site.setdefault(site, RunningStats())
+
+    def add(self, recovery, site=None, category=None):
+        self.overall.add(recovery)
+        if site:
+            self.track_site(site).add(recovery)
+        if category:
+            self.by_category.setdefault(category, RunningStats()).add(recovery)
+
+    def __len__(self):
+        return self.overall.count
+
+    @property
+    def mean(self):
+        return self.overall.mean if self.overall.count else 0
+
+    def summary_frame(self):
+        """One row per site, per category and overall: lots, mean, std, min, p10/p50/p90, max"""
+        rows = []
+        for group, stats_by_key in (("Site", self.by_site), ("Category", self.by_category)):
+            for key, stats in stats_by_key.items():
+                rows.append(dict(Group=group, Name=key, **stats.as_dict()))
+        rows.append(dict(Group="All", Name="All lots", **self.overall.as_dict()))
+        return pd.DataFrame(rows)
+
+    @classmethod
+    def from_frame(cls, df):
+        """Stats for an existing results table (for tables that were not built through a ResultsStore)"""
+        stats = cls()
+        recovery = pd.to_numeric(df['Recovery'], errors='coerce') if 'Recovery' in df.columns else pd.Series(dtype=float)
+        sites = df['Site'] if 'Site' in df.columns else [None] * len(df)
+        categories = df['Category'] if 'Category' in df.columns else [None] * len(df)
+        for value, site, category in zip(recovery, sites, categories):
+            if not pd.isna(value):
+                stats.add(value, site if not pd.isna(site) else None, category if not pd.isna(category) else None)
+        return stats
@@ -0,0 +1,73 @@
+"""
+Rerun Benchmark
+Script-run latency of app.py per view: the first run in a fresh process and the reruns after it.
+
+    python rerun_benchmark.py [--views home amazon category_mapper hibid] [--reruns 5]
+
+Each view is measured in its own Python process with Streamlit's AppTest
+harness, logged in and already on that view, so the first run pays for
+every import and one-time setup the view triggers (what a user waits for
+after a deploy or restart) and the reruns show the cost of every later
+click. Browsers are not pre-launched (WARM_CHROME_DRIVERS=0) so a
+background Chrome start does not compete with the script being timed.
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import statistics
+import subprocess
+
+DEFAULT_VIEWS = ["home", "amazon", "category_mapper", "hibid"]
+
+
+def measure_view(view, reruns):
+    """[first run seconds, rerun seconds...] for one view, in this process"""
+    from streamlit.testing.v1 import AppTest
+
+    app = AppTest.from_file("app.py", default_timeout=120)
+    app.session_state.authenticated = True
+    app.session_state.current_view = view
+    timings = []
+    for _ in range(reruns + 1):
+        start = time.perf_counter()
+        app.run()
+        timings.append(time.perf_counter() - start)
+    if app.exception:
+        raise RuntimeError(f"{view}: {app.exception[0].message}")
+    return timings
+
+
+def run_child(view, reruns):
+    env = dict(os.environ, WARM_CHROME_DRIVERS="0")
+    result = subprocess.run([sys.executable, __file__, "--child", view, "--reruns", str(reruns)],
+                            capture_output=True, text=True, env=env)
+    lines = result.stdout.strip().splitlines()
+    if result.returncode != 0 or not lines:
+        raise RuntimeError(f"{view} failed:\n{result.stderr[-2000:]}")
+    return json.loads(lines[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time app.py script runs per view")
+    parser.add_argument("--views", nargs="+", default=DEFAULT_VIEWS, help="values of st.session_state.current_view")
+    parser.add_argument("--reruns", type=int, default=5, help="reruns timed after the first run")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+    if args.child:
+        print(json.dumps(measure_view(args.child, args.reruns)))
+        return
+
+    print(f"{'view':<16} {'first run':>10} {'rerun p50':>10} {'rerun max':>10}")
+    for view in args.views:
+        first, *reruns = run_child(view, args.reruns)
+        print(f"{view:<16} {first:>10.3f} {statistics.median(reruns):>10.3f} {max(reruns):>10.3f}")
+        sys.stdout.flush()
+
+
+if __name__ == "__main__":
+    main()
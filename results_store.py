@@ -0,0 +1,181 @@
+"""
+Results Store Module
+Columnar, append-only storage for scraped lots.
+
+Rows go into preallocated numpy arrays that grow a chunk at a time, so
+appending a lot is O(1) and the live table only ever materializes the
+newest rows instead of rebuilding a DataFrame of everything scraped so far.
+Prices and recovery stay numeric (float32) all the way to the DataFrame;
+"$1,234.00" / "45.2%" formatting is left to whatever renders or exports it.
+Recovery statistics (see recovery_stats.py) are updated on every append.
+MergedResults combines several concurrent scrapers into one site-tagged
+stream with per-site and combined recovery figures.
+"""
+
+import threading
+
+import numpy as np
+import pandas as pd
+
+from recovery_stats import RecoveryStats, quantile_caption
+
+CHUNK_SIZE = 1024
+
+# Numeric result columns and their dtype; Site and Category become pandas categoricals
+NUMERIC_COLUMNS = ("Sold Price", "Retail Price", "Recovery")
+VALUE_DTYPE = np.float32
+
+
+class ResultsStore:
+    """Append-only columnar buffer of scraped lots with running aggregates"""
+
+    def __init__(self, chunk_size=CHUNK_SIZE):
+        self.chunk_size = chunk_size
+        self._size = 0
+        self._capacity = 0
+        self._link = np.empty(0, dtype=object)
+        self._title = np.empty(0, dtype=object)
+        self._category = np.empty(0, dtype=object)
+        self._site = np.empty(0, dtype=object)
+        self._sold = np.empty(0, dtype=VALUE_DTYPE)
+        self._retail = np.empty(0, dtype=VALUE_DTYPE)
+        self._recovery = np.empty(0, dtype=VALUE_DTYPE)
+        self._has_category = False
+        self._has_site = False
+        self.stats = RecoveryStats()
+
+    def __len__(self):
+        return self._size
+
+    def _grow(self):
+        self._capacity += self.chunk_size
+        for name in ('_link', '_title', '_category', '_site', '_sold', '_retail', '_recovery'):
+            old = getattr(self, name)
+            new = np.empty(self._capacity, dtype=old.dtype)
+            new[:self._size] = old[:self._size]
+            setattr(self, name, new)
+
+    def append(self, link, title, sold_price, retail_price, recovery, category=None, site=None):
+        if self._size == self._capacity:
+            self._grow()
+        i = self._size
+        self._link[i] = link
+        self._title[i] = title
+        self._category[i] = category or None
+        self._site[i] = site
+        self._sold[i] = sold_price
+        self._retail[i] = retail_price
+        self._recovery[i] = recovery
+        self._size += 1
+        self.stats.add(recovery, site, category)
+        if category:
+            self._has_category = True
+        if site:
+            self._has_site = True
+
+    def extend(self, rows):
+        """Append (link, title, sold, retail, recovery, category) tuples, e.g. from rows()"""
+        for row in rows:
+            self.append(*row)
+
+    def rows(self, start=0):
+        """Raw rows from index start on, as tuples extend() accepts"""
+        return [
+            (self._link[i], self._title[i], float(self._sold[i]), float(self._retail[i]),
+             float(self._recovery[i]), self._category[i])
+            for i in range(start, self._size)
+        ]
+
+    def links(self):
+        return set(self._link[:self._size])
+
+    @property
+    def mean_recovery(self):
+        return self.stats.mean
+
+    def recovery_caption(self):
+        return quantile_caption(self.stats.overall)
+
+    def _frame(self, start, stop):
+        columns = {"Site": pd.Categorical(self._site[start:stop])} if self._has_site else {}
+        columns.update({
+            "Link": self._link[start:stop],
+            "Title": self._title[start:stop],
+            "Sold Price": self._sold[start:stop].copy(),
+            "Retail Price": self._retail[start:stop].copy(),
+            "Recovery": self._recovery[start:stop].copy(),
+        })
+        if self._has_category:
+            columns["Category"] = pd.Categorical(self._category[start:stop])
+        return pd.DataFrame(columns, index=range(start, stop))
+
+    def tail_frame(self, n):
+        """DataFrame of the newest n rows only, indexed by their row number"""
+        return self._frame(max(0, self._size - n), self._size)
+
+    def to_frame(self):
+        """Every row as a typed DataFrame (float32 prices / recovery, categorical Site and Category)"""
+        return self._frame(0, self._size)
+
+
+class SiteResultsStore(ResultsStore):
+    """One scraper's own results; every row is also published to a MergedResults stream"""
+
+    def __init__(self, merged, site, chunk_size=CHUNK_SIZE):
+        super().__init__(chunk_size)
+        self.merged = merged
+        self.site = site
+
+    def append(self, link, title, sold_price, retail_price, recovery, category=None, site=None):
+        super().append(link, title, sold_price, retail_price, recovery, category)
+        self.merged.append(link, title, sold_price, retail_price, recovery, category, site=self.site)
+
+
+class MergedResults:
+    """Thread-safe, site-tagged union of several scrapers' results"""
+
+    def __init__(self):
+        self._store = ResultsStore()
+        self._lock = threading.Lock()
+
+    @property
+    def stats(self):
+        """Recovery stats of every site (read them once the scrapers are done)"""
+        return self._store.stats
+
+    def site_store(self, site):
+        """A ResultsStore for one site's scraper that feeds this stream"""
+        with self._lock:
+            self._store.stats.track_site(site)
+        return SiteResultsStore(self, site)
+
+    def append(self, link, title, sold_price, retail_price, recovery, category=None, site=None):
+        with self._lock:
+            self._store.append(link, title, sold_price, retail_price, recovery, category, site=site)
+
+    def __len__(self):
+        return len(self._store)
+
+    @property
+    def mean_recovery(self):
+        with self._lock:
+            return self._store.mean_recovery
+
+    def recovery_caption(self):
+        with self._lock:
+            return self._store.recovery_caption()
+
+    def site_summary(self):
+        """Per-site recovery stats (lots, mean, spread, quantiles) plus an all-sites row"""
+        with self._lock:
+            summary = self._store.stats.summary_frame()
+        summary = summary[summary["Group"] != "Category"].drop(columns="Group")
+        return summary.rename(columns={"Name": "Site"}).replace({"Site": {"All lots": "All sites"}})
+
+    def tail_frame(self, n):
+        with self._lock:
+            return self._store.tail_frame(n)
+
+    def to_frame(self):
+        with self._lock:
+            return self._store.to_frame()
@@ -0,0 +1,221 @@
+"""
+Resume Check
+Stops a crawl part-way, resumes it from its checkpoint and checks that no lot is lost.
+
+    python resume_check.py [--pages 3] [--lots-per-page 5]
+
+Runs AuctionScraper against a small site served from localhost, once for
+each pagination style (numbered and next-link pages, with lots on the
+listing or on detail pages). Each scenario is stopped after 2 lots (during
+the first page) and again part-way through every later page, then resumed
+from the checkpoint left behind; the resumed run must end with every lot
+exactly once and remove its checkpoint. Needs no browser and no API keys:
+the fake lots carry their own retail price, or in the "AI" scenarios get
+one from a stand-in price pool that answers each lookup after --ai-delay
+seconds, so stops land while lookups are still in flight.
+"""
+
+import os
+import re
+import sys
+import argparse
+import time
+import tempfile
+import threading
+import contextlib
+import concurrent.futures
+from collections import defaultdict
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlsplit, parse_qs
+
+# Checkpoints go to a scratch directory and are written on every finished page
+os.environ["CHECKPOINT_DIR"] = tempfile.mkdtemp(prefix="resume_check_")
+os.environ["CHECKPOINT_INTERVAL"] = "0"
+
+from site_adapters import SITE_ADAPTERS, SiteAdapter  # noqa: E402
+from results_store import ResultsStore  # noqa: E402
+from checkpoint import CrawlCheckpoint  # noqa: E402
+import scraper  # noqa: E402
+
+LOT_LINK = re.compile(r'<a class="lot" href="([^"]+)">([^<]*)</a>')
+NEXT_LINK = re.compile(r'<a class="next" href="([^"]+)">')
+DETAIL = re.compile(r'<h1>([^<]*)</h1><b>\$([\d.]+)</b><i>\$([\d.]+)</i>')
+
+
+class FakeSite(BaseHTTPRequestHandler):
+    """/list?page=N listing pages (empty past the last page) and /p/<lot> detail pages"""
+    pages = 3
+    lots_per_page = 5
+
+    def do_GET(self):
+        parts = urlsplit(self.path)
+        if parts.path == "/list":
+            page = int(parse_qs(parts.query)["page"][0])
+            body = ""
+            if page <= self.pages:
+                first = (page - 1) * self.lots_per_page + 1
+                body = "".join(f'<a class="lot" href="/p/{lot}">Lot {lot}</a>'
+                               for lot in range(first, first + self.lots_per_page))
+                if page < self.pages:
+                    body += f'<a class="next" href="/list?page={page + 1}">'
+        else:
+            lot = parts.path.rsplit("/", 1)[-1]
+            body = f"<h1>Lot {lot}</h1><b>$10</b><i>$40</i>"
+        data = body.encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        try:
+            self.wfile.write(data)
+        except ConnectionError:
+            pass  # a stopped crawl cancels the detail pages it still had in flight
+
+    def log_message(self, *args):
+        pass
+
+
+class FakeAdapter(SiteAdapter):
+    def __init__(self, url):
+        super().__init__(url)
+        self.base_url = url.split("/list", 1)[0]
+
+    def page_url(self, page):
+        return f"{self.base_url}/list?page={page}"
+
+    def extract_lots(self, html, page):
+        if self.detail_pages:
+            return [self.base_url + href for href, _ in LOT_LINK.findall(html)]
+        return [self.priced({'title': title, 'product_url': self.base_url + href, 'sold_price_text': "10"}, "40")
+                for href, title in LOT_LINK.findall(html)]
+
+    def extract_page(self, html, page, current_url):
+        next_link = NEXT_LINK.search(html)
+        return self.extract_lots(html, page), (self.base_url + next_link.group(1) if next_link else None)
+
+    def extract_detail(self, html):
+        match = DETAIL.search(html)
+        if not match:
+            return None
+        return self.priced({'title': match.group(1), 'sold_price_text': match.group(2)}, match.group(3))
+
+    def priced(self, lot, retail_price_text):
+        """The lot with its retail price, or with an image for the price pool to look up"""
+        if self.ai_priced:
+            return dict(lot, image_url=f"{self.base_url}/image.jpg")
+        return dict(lot, retail_price_text=retail_price_text)
+
+
+SCENARIOS = {
+    "numbered listing": dict(pagination="numbered", detail_pages=False, ai_priced=False),
+    "next-link listing": dict(pagination="next_link", detail_pages=False, ai_priced=False),
+    "numbered detail": dict(pagination="numbered", detail_pages=True, ai_priced=False),
+    "next-link detail": dict(pagination="next_link", detail_pages=True, ai_priced=False),
+    "numbered listing AI": dict(pagination="numbered", detail_pages=False, ai_priced=True),
+    "next-link detail AI": dict(pagination="next_link", detail_pages=True, ai_priced=True),
+}
+
+
+class Ignore:
+    """Stands in for every Streamlit placeholder"""
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+
+class SlowPricePool:
+    """Stands in for GeminiPricePool: every lookup answers after `delay` seconds, a few at a time"""
+    exhausted = False
+
+    def __init__(self, delay):
+        self.delay = delay
+        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+
+    def __len__(self):
+        return 1
+
+    def submit(self, product_name, image_url, timeout=None):
+        return self.executor.submit(self.lookup)
+
+    def lookup(self):
+        time.sleep(self.delay)
+        return "40, https://example.com/retail"
+
+    def close(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+class StopAfter(ResultsStore):
+    """Results store that presses stop on its scraper once it holds `limit` lots"""
+
+    def __init__(self, limit):
+        super().__init__()
+        self.limit = limit
+        self.scraper = None
+
+    def append(self, *args, **kwargs):
+        super().append(*args, **kwargs)
+        if self.limit and len(self) >= self.limit and self.scraper:
+            self.scraper.stop()
+
+
+def crawl(site, url, resume, stop_after=None, ai_delay=None):
+    results = StopAfter(stop_after)
+    ui = {'status': Ignore(), 'progress': Ignore(), 'dataframe': Ignore(), 'metrics': defaultdict(Ignore)}
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        auction_scraper = scraper.AuctionScraper([], ui, results=results)
+        if ai_delay is not None:
+            auction_scraper.gemini_pool = SlowPricePool(ai_delay)
+        results.scraper = auction_scraper
+        auction_scraper.run(site, url, 1, 0, resume=resume)
+    return results
+
+
+def check(name, url, stop_after, expected, ai_delay):
+    site = f"ResumeCheck {name}"
+    SITE_ADAPTERS[site] = type("ResumeCheckAdapter", (FakeAdapter,), dict(SCENARIOS[name], name=site))
+    if not SCENARIOS[name]['ai_priced']:
+        ai_delay = None
+    try:
+        first = crawl(site, url, resume=False, stop_after=stop_after, ai_delay=ai_delay)
+        resumed = crawl(site, url, resume=True, ai_delay=ai_delay)
+    finally:
+        del SITE_ADAPTERS[site]
+
+    links = [row[0] for row in resumed.rows()]
+    ok = sorted(set(links)) == sorted(expected) and len(links) == len(expected) and not CrawlCheckpoint(site, url).exists()
+    print(f"{name:<20} stop after {stop_after:>2}: {len(first):>3} lots, resumed {len(set(links)):>3}/{len(expected)}"
+          f"{'' if len(links) == len(set(links)) else ' (duplicates)'}  {'ok' if ok else 'FAILED'}")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Stop and resume crawls of a local fake site")
+    parser.add_argument("--pages", type=int, default=3)
+    parser.add_argument("--lots-per-page", type=int, default=5)
+    parser.add_argument("--ai-delay", type=float, default=0.2, help="seconds each stand-in AI price lookup takes")
+    args = parser.parse_args()
+
+    FakeSite.pages = args.pages
+    FakeSite.lots_per_page = args.lots_per_page
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeSite)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    url = f"{base_url}/list?page=1"
+    expected = [f"{base_url}/p/{lot}" for lot in range(1, args.pages * args.lots_per_page + 1)]
+
+    # 2 lots in: stopped during the first page; then part-way through every later page
+    stops = [2] + [page * args.lots_per_page + 2 for page in range(1, args.pages)]
+    failures = 0
+    try:
+        for name in SCENARIOS:
+            for stop_after in stops:
+                failures += not check(name, url, stop_after, expected, args.ai_delay)
+    finally:
+        server.shutdown()
+    print("all resumed crawls complete" if not failures else f"{failures} resumed crawls lost lots")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,40 +1,59 @@
-import sys
 import os
-import requests
-import re
-from bs4 import BeautifulSoup
 import time
-from datetime import datetime, timedelta
-import statistics
+from datetime import datetime
 import traceback
-import io
-import pandas as pd
-
-# Google Gemini API imports
-from google import genai
-from google.genai import types
+import itertools
+import queue
+import threading
+import importlib.util
+from collections import deque
+
+from http_engine import AsyncFetchEngine, DEFAULT_MAX_PER_HOST
+from results_store import ResultsStore
+from gemini_pool import GeminiPricePool
+from price_cache import PriceCache
+from http_cache import HttpCache
+from checkpoint import CrawlCheckpoint, CHECKPOINT_INTERVAL
+from browser_pool import BrowserPool, get_driver_pool
+from page_ready import wait_until_ready, get_profile
+from site_adapters import SiteAdapter, get_adapter, http_sites
+from network_capture import NetworkCapture, FIXTURES_DIR, save_fixture
+from resource_blocking import blocking_rules
 
 # Check if we're running in Streamlit Cloud (disable Selenium features)
 IS_CLOUD = os.getenv('STREAMLIT_SHARING_MODE') or os.getenv('STREAMLIT_RUNTIME_ENV') == 'cloud'
 
+# Only checks that the packages are installed: browser_pool.launch_chrome imports them when the
+# first browser scrape starts, so HTTP-only runs and app reruns never pay for loading Selenium
 if not IS_CLOUD:
-    try:
-        import undetected_chromedriver as uc
-        from selenium.webdriver.common.by import By
-        from selenium.webdriver.support.ui import WebDriverWait
-        from selenium.webdriver.support import expected_conditions as EC
-        from selenium.common.exceptions import TimeoutException, NoSuchElementException
-        SELENIUM_AVAILABLE = True
-        print("✅ Selenium loaded successfully - browser scrapers enabled")
-    except ImportError as e:
-        SELENIUM_AVAILABLE = False
-        print(f"❌ Selenium not available: {e}")
+    missing = [name for name in ("undetected_chromedriver", "selenium") if importlib.util.find_spec(name) is None]
+    SELENIUM_AVAILABLE = not missing
+    if SELENIUM_AVAILABLE:
+        print("✅ Selenium installed - browser scrapers enabled")
+    else:
+        print(f"❌ Selenium not available: {', '.join(missing)} not installed")
 else:
     SELENIUM_AVAILABLE = False
     print("☁️ Running in cloud mode - browser-based scrapers disabled")
 
+# Max listing events buffered between the pagination producer and the detail workers
+LINK_QUEUE_SIZE = 200
+
+# Seconds to wait for a free Chrome slot before giving up
+BROWSER_SLOT_TIMEOUT = 120
+
+# Live results table: only the newest rows are shown, redrawn at most this often
+LIVE_TABLE_ROWS = 100
+LIVE_TABLE_REFRESH_SECONDS = 1.0
+
+def warm_browsers():
+    """Pre-launch idle Chrome drivers (with the default blocking rules) so the next browser scrape skips startup"""
+    if SELENIUM_AVAILABLE:
+        get_driver_pool().warm_up(blocking=blocking_rules(SiteAdapter))
+
 class AuctionScraper:
-    def __init__(self, gemini_api_keys, ui_placeholders):
+    def __init__(self, gemini_api_keys, ui_placeholders, max_connections_per_host=DEFAULT_MAX_PER_HOST, browser_pool_size=1,
+                 use_http_cache=False, results=None, network_capture=False):
         print("\n" + "="*60)
         print("INITIALIZING AUCTION SCRAPER")
         print("="*60)
@@ -44,19 +63,47 @@ class AuctionScraper:
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
         }
-        self.products = []
-        self.percentages = []
+        # A multi-site run passes a store that also feeds its merged stream
+        self.results = results if results is not None else ResultsStore()
+        self._last_table_refresh = 0.0
         self.ui = ui_placeholders
         self.gemini_api_keys = [key for key in gemini_api_keys if key]
-        self.current_api_key_index = 0
-        self.gemini_client = None
+        self.gemini_pool = None
+        self.price_cache = None
+        self.pending_ai_items = deque()
         
         # Selenium driver (only if available)
         self.driver = None
-        
-        # Rate limiting variables
-        self.request_times = []
-        self.max_requests_per_minute = 10
+        self.browser_pool = None
+        self.browser_pool_size = max(1, int(browser_pool_size))
+        # Read lots from the site's own JSON responses (set per run: only adapters with an api_url_pattern)
+        self.network_capture = network_capture
+        self.capture_network = False
+        # resource_blocking rules of the site being scraped (set per run)
+        self.blocking = None
+
+        # Shared async HTTP engine for the request-based scrapers
+        self.http = None
+        self.http_cache = None
+        self.use_http_cache = use_http_cache
+        # Sites whose detail fields turned out to need the browser (see fill_from_detail_pages)
+        self.detail_over_http = {}
+        self.max_connections_per_host = max_connections_per_host
+
+        # Resumable crawl state (see open_checkpoint). The saved cursor only moves
+        # past a page once every lot from it is in self.results.
+        self.checkpoint = None
+        self.resume_cursor = None
+        self.crawl_error = False
+        # Detail pages that could not be read (fetch error or non-200 answer)
+        self.detail_failures = 0
+        self.next_page_urls = {}
+        self._cursor_base = {}
+        # (AI lookups submitted when the page finished, its cursor) for pages the saved cursor has not passed yet
+        self._page_cursors = deque()
+        self._saved_cursor = None
+        self._last_checkpoint = 0.0
+        self._ai_submitted = 0
         
         print(f"Gemini API Keys Available: {len(self.gemini_api_keys)}")
         print(f"Selenium Available: {SELENIUM_AVAILABLE}")
@@ -67,6 +114,10 @@ class AuctionScraper:
         
         print("="*60 + "\n")
 
+    @property
+    def products(self):
+        return self.results.to_frame()
+
     def stop(self):
         print("\nSTOP SIGNAL RECEIVED")
         self.running = False
@@ -74,7 +125,7 @@ class AuctionScraper:
         if self.driver and SELENIUM_AVAILABLE:
             try:
                 print("Closing browser...")
-                self.driver.quit()
+                get_driver_pool().discard(self.driver)
                 print("Browser closed")
             except Exception as e:
                 print(f"Error closing browser: {e}")
@@ -87,17 +138,33 @@ class AuctionScraper:
                 self.ui['status'].warning("No Gemini API keys found.")
                 return
 
-            api_key = self.gemini_api_keys[self.current_api_key_index]
-            print(f"Using API Key #{self.current_api_key_index + 1}")
-            self.gemini_client = genai.Client(api_key=api_key)
-            print("Gemini AI initialized successfully")
-            self.ui['status'].info(f"AI price lookup enabled with Gemini Client (API Key {self.current_api_key_index + 1})")
+            try:
+                self.price_cache = PriceCache()
+                print(f"Retail price cache: {self.price_cache.path}")
+            except Exception as e:
+                print(f"Price cache unavailable, continuing without it: {e}")
+                self.price_cache = None
+
+            self.gemini_pool = GeminiPricePool(self.gemini_api_keys, self.headers, cache=self.price_cache)
+            if not len(self.gemini_pool):
+                raise RuntimeError("no Gemini API key could be initialized")
+            print(f"Gemini AI initialized with {len(self.gemini_pool)} parallel lanes")
+            self.ui['status'].info(f"AI price lookup enabled with {len(self.gemini_pool)} parallel Gemini lanes (one per API key)")
 
         except Exception as e:
             print(f"Failed to setup Gemini: {e}")
             traceback.print_exc()
             self.ui['status'].error(f"An unexpected error occurred setting up Gemini AI: {e}.")
-            self.gemini_client = None
+            self.close_gemini_pool()
+
+    def close_gemini_pool(self):
+        if self.gemini_pool:
+            self.gemini_pool.close()
+            self.gemini_pool = None
+        if self.price_cache:
+            print(f"Price cache: {self.price_cache.hits} hits, {self.price_cache.misses} misses")
+            self.price_cache.close()
+            self.price_cache = None
 
     def init_driver(self):
         """Initialize undetected Chrome driver - only works locally"""
@@ -109,16 +176,13 @@ class AuctionScraper:
             return False
             
         try:
-            print("Configuring Chrome options...")
-            options = uc.ChromeOptions()
-            options.add_argument('--headless=new')
-            options.add_argument('--no-sandbox')
-            options.add_argument('--disable-dev-shm-usage')
-            options.add_argument('--disable-blink-features=AutomationControlled')
-            
             print("Launching Chrome browser...")
-            self.driver = uc.Chrome(options=options, version_main=None)
-            self.driver.set_page_load_timeout(60)
+            self.driver = get_driver_pool().lease(timeout=BROWSER_SLOT_TIMEOUT, capture_network=self.capture_network,
+                                                  blocking=self.blocking)
+            if self.driver is None:
+                print("No free browser slot")
+                self.ui['status'].error("Too many browsers are already running. Try again when another scrape finishes.")
+                return False
             print("Browser initialized successfully")
             self.ui['status'].info("Browser initialized successfully")
             return True
@@ -128,126 +192,83 @@ class AuctionScraper:
             self.ui['status'].error(f"Failed to initialize browser: {e}")
             return False
 
-    def can_make_request(self):
-        now = datetime.now()
-        self.request_times = [req_time for req_time in self.request_times if now - req_time < timedelta(minutes=1)]
-        return len(self.request_times) < self.max_requests_per_minute
-
-    def wait_for_rate_limit(self):
-        while not self.can_make_request():
-            if self.request_times:
-                oldest_request = min(self.request_times)
-                wait_time = 60 - (datetime.now() - oldest_request).total_seconds()
-                if wait_time > 0:
-                    print(f"Waiting {wait_time:.0f}s for rate limit...")
-                    self.ui['status'].info(f"Rate limit reached. Waiting {wait_time:.0f} seconds...")
-                    time.sleep(max(1, wait_time))
-            else:
-                break
+    def init_browser_pool(self):
+        """Start extra browsers next to self.driver so page-numbered sites load pages in parallel"""
+        print(f"\nStarting browser pool ({self.browser_pool_size} browsers)...")
+        self.browser_pool = BrowserPool(self.browser_pool_size, drivers=[self.driver], capture_network=self.capture_network,
+                                        blocking=self.blocking)
+        self.ui['status'].info(f"Loading pages with {len(self.browser_pool)} browsers in parallel")
+
+    def close_browser_pool(self):
+        if self.browser_pool:
+            # The pool may have recycled our own driver between pages
+            self.driver = self.browser_pool.drivers[0]
+            self.browser_pool.close()
+            self.browser_pool = None
+
+    def page_driver(self):
+        """self.driver for the next page load (swapped for a fresh browser when the pool recycles it)"""
+        self.driver = get_driver_pool().next_page(self.driver)
+        return self.driver
+
+    def iter_browser_pages(self, load_page, pages):
+        """
+        Yield (page, result_or_exception) in order, where result = load_page(driver, page).
+        Uses the browser pool when there is one, otherwise self.driver one page at a time.
+        """
+        if self.browser_pool:
+            yield from self.browser_pool.map_ordered(load_page, pages)
+            return
+        for page in pages:
+            try:
+                yield page, load_page(self.page_driver(), page)
+            except Exception as e:
+                yield page, e
 
-    def record_request(self):
-        self.request_times.append(datetime.now())
+    def init_http_engine(self, adapter=None):
+        """Start the pooled async HTTP engine, with the on-disk page cache when enabled"""
+        print(f"\nStarting HTTP engine ({self.max_connections_per_host} connections per host)...")
+        if self.use_http_cache and adapter is not None:
+            try:
+                self.http_cache = HttpCache()
+                print(f"HTTP page cache: {self.http_cache.path}")
+            except Exception as e:
+                print(f"HTTP page cache unavailable, fetching everything: {e}")
+                self.http_cache = None
+        self.http = AsyncFetchEngine(
+            headers=self.headers, max_per_host=self.max_connections_per_host,
+            cache=self.http_cache, cache_ttl=adapter.cache_ttl if adapter else None
+        )
+        return True
+
+    def close_http_engine(self):
+        if self.http:
+            try:
+                self.http.close()
+                print("HTTP engine closed")
+            except Exception as e:
+                print(f"Error closing HTTP engine: {e}")
+            self.http = None
+        if self.http_cache:
+            print(f"HTTP page cache: {self.http_cache.summary()}")
+            self.http_cache.close()
+            self.http_cache = None
+
+    @staticmethod
+    def page_numbers(first_page, last_page=None):
+        """Page numbers from first_page to last_page inclusive (unbounded when last_page is None)"""
+        if last_page is None:
+            return itertools.count(first_page)
+        return iter(range(first_page, last_page + 1))
 
     def get_retail_price(self, product_name, image_url):
-        print(f"\nGetting retail price for: {product_name[:50]}...")
-        
-        if not self.gemini_client:
+        """Blocking single lookup through the lane pool; returns 'PRICE, URL' or None"""
+        if not self.gemini_pool:
             print("Gemini client not initialized")
             return None
-            
-        for attempt in range(len(self.gemini_api_keys)):
-            try:
-                self.wait_for_rate_limit()
-                
-                print(f"Downloading image from: {image_url[:60]}...")
-                response = requests.get(image_url, headers=self.headers, stream=True, timeout=15)
-                if response.status_code != 200:
-                    print(f"Failed to download image: HTTP {response.status_code}")
-                    return None
-                
-                image_bytes = response.content
-                print(f"Image downloaded: {len(image_bytes)} bytes")
-                
-                prompt_text = f"""
-                **Task**: Find the retail price and a direct product link for the item in the image, described as '{product_name}'.
-                **Output Format**: You MUST reply ONLY in the format: `PRICE, URL`. Example: `199.99, https://www.amazon.com/product`.
-                **Rules**:
-                1. If you cannot find the exact item, find the CLOSEST SIMILAR item from a major retailer (Amazon, Walmart, etc.). NEVER return "NONE" or "Not Found".
-                2. The price must be a number only (e.g., `123.45`). No currency symbols.
-                3. The URL must be a direct retail link, not an auction site.
-                Your entire response must be just the price and the link, separated by a comma.
-                """
-                
-                contents = [
-                    {
-                        "role": "user",
-                        "parts": [
-                            {"text": prompt_text},
-                            {"inline_data": {"mime_type": "image/png", "data": image_bytes}}
-                        ]
-                    }
-                ]
-                
-                self.record_request()
-                
-                print("Sending request to Gemini AI...")
-                response = self.gemini_client.models.generate_content(
-                    model="gemini-2.5-flash",
-                    contents=contents
-                )
-
-                response_text = response.text.strip()
-                print(f"AI Response: {response_text}")
-                
-                match = re.search(r'([\d,]+\.?\d*)\s*,\s*(https?://\S+)', response_text)
-                if match:
-                    price = match.group(1).replace(',', '')
-                    link = match.group(2)
-                    print(f"Price found: ${price}")
-                    return f"{price}, {link}"
-                else:
-                    print(f"AI response format invalid")
-                    raise ValueError("Invalid AI response format")
+        return self.gemini_pool.submit(product_name, image_url).result()
 
-            except Exception as e:
-                error_str = str(e)
-                print(f"Error getting price: {error_str}")
-                
-                if "429" in error_str and "RESOURCE_EXHAUSTED" in error_str:
-                    print("Rate limit hit! Waiting 30 seconds...")
-                    self.ui['status'].warning("Rate limit hit! Waiting 30 seconds before retry...")
-                    time.sleep(30)
-                    
-                    try:
-                        self.record_request()
-                        response = self.gemini_client.models.generate_content(
-                            model="gemini-2.5-flash",
-                            contents=contents
-                        )
-                        response_text = response.text.strip()
-                        match = re.search(r'([\d,]+\.?\d*)\s*,\s*(https?://\S+)', response_text)
-                        if match:
-                            price = match.group(1).replace(',', '')
-                            link = match.group(2)
-                            return f"{price}, {link}"
-                    except Exception as retry_e:
-                        print(f"Retry failed: {retry_e}")
-                        self.ui['status'].warning(f"Retry failed: {retry_e}")
-                
-                traceback.print_exc()
-                
-                self.current_api_key_index = (self.current_api_key_index + 1) % len(self.gemini_api_keys)
-                print(f"Switching to API Key #{self.current_api_key_index + 1}")
-                self.ui['status'].warning(f"Switching to Gemini API Key {self.current_api_key_index + 1} due to error.")
-                self.setup_gemini()
-                self.request_times = []
-        
-        print("All Gemini API keys exhausted")
-        self.ui['status'].error("All Gemini API keys failed. Disabling AI for this session.")
-        self.gemini_client = None
-        return None
-
-    def run(self, site, url, start_page, end_page):
+    def run(self, site, url, start_page, end_page, resume=False):
         print("\n" + "="*60)
         print(f"STARTING SCRAPER: {site}")
         print("="*60)
@@ -256,74 +277,181 @@ class AuctionScraper:
         print(f"Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         print("="*60 + "\n")
         
+        crawl_completed = False
         try:
-            selenium_sites = ["HiBid", "BiddingKings", "BidLlama", "MAC.bid", "Vista", "BidAuctionDepot", "BidSoflo"]
+            adapter = get_adapter(site, url)
+            if adapter is None:
+                print(f"Unknown site: {site}")
+                self.ui['status'].error(f"No scraper is registered for {site}.")
+                return self.products
+
+            start_page = self.open_checkpoint(site, url, start_page, end_page, resume)
             
-            if site in selenium_sites:
+            if adapter.uses_browser:
                 print(f"{site} requires browser automation")
                 
                 if not SELENIUM_AVAILABLE:
                     print(f"Selenium not available for {site}")
                     self.ui['status'].error(f"{site} requires browser automation which is not available in cloud deployment.")
                     self.ui['status'].info("This scraper only works in local deployment. Please use direct price scrapers instead:")
-                    self.ui['status'].info("Nellis, BidFTA, A-Stock, 702Auctions")
-                    return []
+                    self.ui['status'].info(", ".join(http_sites()))
+                    return self.products
+
+                self.capture_network = bool(self.network_capture and adapter.api_url_pattern)
+                if self.capture_network:
+                    print(f"Network capture on: lots come from {site}'s JSON responses")
+                self.blocking = blocking_rules(adapter)
+                if self.blocking:
+                    print(f"Blocking resources: {', '.join(self.blocking[0] + self.blocking[1])}")
                 
                 print(f"Initializing browser for {site}...")
                 if not self.init_driver():
                     print("Browser initialization failed")
-                    return []
+                    return self.products
                 
-                print(f"Browser ready, starting {site} scraper...")
+                if adapter.parallel_pages and self.browser_pool_size > 1:
+                    self.init_browser_pool()
                 
-                if site == "HiBid": 
-                    self.scrape_hibid(url, start_page, end_page)
-                elif site == "BiddingKings": 
-                    self.scrape_biddingkings(url, start_page, end_page)
-                elif site == "BidLlama": 
-                    self.scrape_bidllama(url, start_page, end_page)
-                elif site == "MAC.bid": 
-                    self.scrape_macbid(url, start_page, end_page)
-                elif site == "Vista":
-                    self.scrape_vista(url, start_page, end_page)
-                elif site == "BidSoflo":
-                    self.scrape_bidsoflo(url, start_page, end_page)
-                elif site == "BidAuctionDepot":
-                    self.scrape_bidauctiondepot(url, start_page, end_page)
+                print(f"Browser ready, starting {site} scraper...")
             else:
                 print(f"{site} uses direct HTTP requests (no browser needed)")
-                
-                if site == "Nellis": 
-                    self.scrape_nellis(url, start_page, end_page)
-                elif site == "BidFTA": 
-                    self.scrape_bidfta(url, start_page, end_page)
-                elif site == "A-Stock":
-                    self.scrape_astock(url, start_page, end_page)
-                elif site == "702Auctions":
-                    self.scrape_702auctions(url, start_page, end_page)
+
+            if not adapter.uses_browser or adapter.detail_field:
+                self.init_http_engine(adapter)
+
+            self.crawl(adapter, start_page, end_page)
+
+            if adapter.uses_browser:
+                print(f"Page timing - {get_profile(site).summary()}")
+            self.collect_ai_results(wait=True)
+            crawl_completed = self.running and not self.crawl_error
                     
         except Exception as e:
             print(f"\nCRITICAL ERROR in run(): {e}")
             traceback.print_exc()
             self.ui['status'].error(f"An unexpected error occurred during scraping: {e}")
         finally:
+            self.close_browser_pool()
             if self.driver and SELENIUM_AVAILABLE:
                 try:
-                    print("\nCleaning up browser...")
-                    self.driver.quit()
-                    print("Browser closed")
+                    print("\nReleasing browser...")
+                    get_driver_pool().release(self.driver)
                 except Exception as e:
                     print(f"Error during cleanup: {e}")
+                self.driver = None
+            self.close_http_engine()
+            self.close_gemini_pool()
+            self.close_checkpoint(crawl_completed)
         
         print("\n" + "="*60)
         print(f"SCRAPING COMPLETE: {site}")
-        print(f"Total products scraped: {len(self.products)}")
+        print(f"Total products scraped: {len(self.results)}")
         print(f"Finished at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         print("="*60 + "\n")
         
         return self.products
 
+    # === CHECKPOINTS (resume an interrupted crawl) ===
+
+    def open_checkpoint(self, site, url, start_page, end_page, resume):
+        """Start checkpointing this crawl; with resume, restore the saved lots and return the page to continue from"""
+        self._cursor_base = {'start_page': start_page, 'end_page': end_page}
+        self._last_checkpoint = time.monotonic()
+        try:
+            self.checkpoint = CrawlCheckpoint(site, url)
+            saved = self.checkpoint.load() if resume else None
+            if saved is None:
+                self.checkpoint.clear()
+        except Exception as e:
+            print(f"Checkpoint unavailable, continuing without one: {e}")
+            traceback.print_exc()
+            self.checkpoint = None
+            return start_page
+
+        if saved is None:
+            if resume:
+                print("No checkpoint to resume from")
+                self.ui['status'].info("No checkpoint found for this URL - starting from the first page.")
+            return start_page
+
+        cursor, rows = saved
+        self.results.extend(rows)
+        self.resume_cursor = cursor
+        self._saved_cursor = cursor
+        self._cursor_base = {'start_page': cursor['start_page'], 'end_page': cursor['end_page']}
+        resume_page = cursor['start_page'] if cursor['page'] is None else cursor['page'] + 1
+
+        print(f"Resuming from checkpoint: {len(rows)} lots restored, continuing at page {resume_page}")
+        self.ui['status'].info(f"Resuming from page {resume_page} with {len(rows)} lots from the last checkpoint")
+        self.ui['metrics']['lots'].metric("Lots Scraped", len(self.results))
+        self.publish_recovery()
+        return resume_page
+
+    def checkpoint_page(self, page, last_lot=None):
+        """Mark page as fully crawled; saves a checkpoint at most every CHECKPOINT_INTERVAL seconds"""
+        if not self.checkpoint:
+            return
+        cursor = dict(self._cursor_base, page=page, next_url=self.next_page_urls.get(page), last_lot=last_lot)
+        self._page_cursors.append((self._ai_submitted, cursor))
+
+        if time.monotonic() - self._last_checkpoint < CHECKPOINT_INTERVAL:
+            return
+        # Never waits on AI prices: the saved cursor only covers pages whose lookups are already back
+        self.collect_ai_results()
+        self.save_checkpoint()
+
+    def advance_cursor(self):
+        """Move the saved cursor past every finished page whose AI lookups have all been collected"""
+        if not self.running:
+            return  # stopping cancels the pending lookups; their pages stay unfinished
+        oldest_pending = self.pending_ai_items[0][2] if self.pending_ai_items else None
+        while self._page_cursors and (oldest_pending is None or self._page_cursors[0][0] <= oldest_pending):
+            self._saved_cursor = self._page_cursors.popleft()[1]
+
+    def save_checkpoint(self):
+        if not self.checkpoint:
+            return
+        self.advance_cursor()
+        cursor = self._saved_cursor or dict(self._cursor_base, page=None, next_url=None, last_lot=None)
+        try:
+            self.checkpoint.save(cursor, self.results.rows(self.checkpoint.rows_saved))
+            self._last_checkpoint = time.monotonic()
+            print(f"Checkpoint saved: page {cursor['page']}, {self.checkpoint.rows_saved} lots")
+        except Exception as e:
+            print(f"Error saving checkpoint: {e}")
+
+    def close_checkpoint(self, completed):
+        """Drop the checkpoint of a finished crawl; keep an interrupted one for resuming"""
+        if not self.checkpoint:
+            return
+        if completed:
+            self.checkpoint.clear()
+            print("Crawl finished, checkpoint removed")
+        else:
+            self.save_checkpoint()
+            print(f"Crawl interrupted, checkpoint kept in {self.checkpoint.path}")
+        self.checkpoint = None
+
+    def publish_recovery(self):
+        self.ui['metrics']['recovery'].metric(
+            "Average Recovery", f"{self.results.mean_recovery:.1f}%", help=self.results.recovery_caption()
+        )
+
+    def publish_results(self, item_index, total_items_on_page):
+        """Push running totals to the UI; the table only shows the newest rows and is throttled"""
+        self.ui['metrics']['lots'].metric("Lots Scraped", len(self.results))
+        self.publish_recovery()
+        if self.price_cache and 'cache' in self.ui['metrics']:
+            self.ui['metrics']['cache'].metric("AI Cache Hits", f"{self.price_cache.hits}/{self.price_cache.lookups}")
+        self.ui['progress'].progress(min(1.0, item_index / total_items_on_page), text=f"Page Progress: {item_index}/{total_items_on_page}")
+
+        now = time.monotonic()
+        if now - self._last_table_refresh >= LIVE_TABLE_REFRESH_SECONDS:
+            self._last_table_refresh = now
+            self.ui['dataframe'].dataframe(self.results.tail_frame(LIVE_TABLE_ROWS), use_container_width=True)
+
     def process_item(self, title, product_url, image_url, sold_price_text, item_index, total_items_on_page, category=None):
+        """Queue a lot for AI pricing; it is added to the results once its lane answers"""
         print(f"\nProcessing item {item_index}/{total_items_on_page}")
         print(f"Title: {title[:60]}...")
         
@@ -332,40 +460,72 @@ class AuctionScraper:
             sold_price_float = round(float(sold_price_text.replace("$", "").replace("USD", "").replace(",", "").strip()), 2)
             print(f"Sold Price: ${sold_price_float}")
             
-            ai_result = self.get_retail_price(title, image_url)
+            if not self.gemini_pool:
+                print("Gemini client not initialized")
+                self.ui['status'].warning(f"Skipping '{title[:30]}...' - AI could not find a retail price.")
+                return
+
+            # Backpressure: keep draining finished lots while every lane is busy
+            future = None
+            while self.running and self.gemini_pool and future is None:
+                future = self.gemini_pool.submit(title, image_url, timeout=0.5)
+                self.collect_ai_results()
+            if future is None:
+                return
+
+            item = {
+                'title': title, 'product_url': product_url, 'sold_price': sold_price_float,
+                'item_index': item_index, 'total_items_on_page': total_items_on_page, 'category': category
+            }
+            self.pending_ai_items.append((item, future, self._ai_submitted))
+            self._ai_submitted += 1
+            self.collect_ai_results()
+        except Exception as e:
+            print(f"Error processing item: {e}")
+            traceback.print_exc()
+            self.ui['status'].warning(f"Skipping item '{title[:30]}...' due to error: {e}")
+
+    def collect_ai_results(self, wait=False):
+        """Finish every lot whose price lookup is done (all of them when wait=True)"""
+        still_pending = deque()
+        while self.pending_ai_items:
+            item, future, seq = self.pending_ai_items.popleft()
+            if not self.running:
+                future.cancel()
+                continue
+            if not future.done() and not wait:
+                still_pending.append((item, future, seq))
+                continue
+            try:
+                ai_result = future.result()
+            except Exception as e:
+                print(f"Price lookup failed: {e}")
+                ai_result = None
+            self._finish_ai_item(item, ai_result)
+        self.pending_ai_items = still_pending
+
+        if self.gemini_pool and self.gemini_pool.exhausted:
+            print("All Gemini API keys exhausted")
+            self.ui['status'].error("All Gemini API keys failed. Disabling AI for this session.")
+            self.close_gemini_pool()
+
+    def _finish_ai_item(self, item, ai_result):
+        title = item['title']
+        try:
             if ai_result:
                 price_part, link_part = ai_result.split(',', 1)
                 retail_price_float = round(float(price_part.strip().replace('$', '')), 2)
-                print(f"Retail Price: ${retail_price_float}")
+                print(f"Retail Price for '{title[:40]}': ${retail_price_float}")
                 
                 if retail_price_float > 0:
-                    percentage = round((sold_price_float / retail_price_float) * 100, 2)
+                    percentage = round((item['sold_price'] / retail_price_float) * 100, 2)
                     print(f"Recovery: {percentage:.1f}%")
-                    self.percentages.append(percentage)
-                    
-                    data = {
-                        "Link": product_url, 
-                        "Title": title, 
-                        "Sold Price": f"${sold_price_float:,.2f}",
-                        "Retail Price": f"${retail_price_float:,.2f}",
-                        "Recovery": f"{percentage:.1f}%"
-                    }
                     
-                    if category:
-                        data["Category"] = category
-                    
-                    self.products.append(data)
-                    print(f"Item added to results (Total: {len(self.products)})")
-                    
-                    df = pd.DataFrame(self.products)
-                    self.ui['dataframe'].dataframe(df, use_container_width=True)
-                    
-                    avg_recovery = statistics.mean(self.percentages) if self.percentages else 0
-                    self.ui['metrics']['lots'].metric("Lots Scraped", len(self.products))
-                    self.ui['metrics']['recovery'].metric("Average Recovery", f"{avg_recovery:.1f}%")
-                    self.ui['progress'].progress(item_index / total_items_on_page, text=f"Page Progress: {item_index}/{total_items_on_page}")
+                    self.results.append(item['product_url'], title, item['sold_price'], retail_price_float, percentage, item['category'])
+                    print(f"Item added to results (Total: {len(self.results)})")
+                    self.publish_results(item['item_index'], item['total_items_on_page'])
             else:
-                print(f"Skipping item - AI could not find retail price")
+                print("Skipping item - AI could not find retail price")
                 self.ui['status'].warning(f"Skipping '{title[:30]}...' - AI could not find a retail price.")
         except Exception as e:
             print(f"Error processing item: {e}")
@@ -386,1145 +546,415 @@ class AuctionScraper:
             if retail_price_float > 0:
                 percentage = round((sold_price_float / retail_price_float) * 100, 2)
                 print(f"Recovery: {percentage:.1f}%")
-                self.percentages.append(percentage)
-                
-                data = {
-                    "Link": product_url, 
-                    "Title": title, 
-                    "Sold Price": f"${sold_price_float:,.2f}",
-                    "Retail Price": f"${retail_price_float:,.2f}",
-                    "Recovery": f"{percentage:.1f}%"
-                }
-                
-                if category:
-                    data["Category"] = category
-                
-                self.products.append(data)
-                print(f"Item added (Total: {len(self.products)})")
                 
-                df = pd.DataFrame(self.products)
-                self.ui['dataframe'].dataframe(df, use_container_width=True)
-                
-                avg_recovery = statistics.mean(self.percentages) if self.percentages else 0
-                self.ui['metrics']['lots'].metric("Lots Scraped", len(self.products))
-                self.ui['metrics']['recovery'].metric("Average Recovery", f"{avg_recovery:.1f}%")
-                self.ui['progress'].progress(item_index / total_items_on_page, text=f"Page Progress: {item_index}/{total_items_on_page}")
+                self.results.append(product_url, title, sold_price_float, retail_price_float, percentage, category)
+                print(f"Item added (Total: {len(self.results)})")
+                self.publish_results(item_index, total_items_on_page)
         except Exception as e:
             print(f"Error processing item: {e}")
             traceback.print_exc()
             self.ui['status'].warning(f"Skipping item '{title[:30]}...' due to error: {e}")
 
-    # === SELENIUM-BASED SCRAPERS ===
+    # === CRAWL ENGINE (drives every site adapter) ===
     
-    def scrape_hibid(self, url, start_page, end_page):
-        print(f"\nStarting HiBid scraper")
-        base_url = url.split("/catalog")[0]
-        print(f"Base URL: {base_url}")
-        page = start_page
-        
-        while self.running and (end_page == 0 or page <= end_page):
-            try:
-                print(f"\nNavigating to HiBid Page: {page}")
-                current_url = f"{url}{'&' if '?' in url else '?'}apage={page}"
-                print(f"Full URL: {current_url}")
-                
-                self.ui['status'].info(f"Navigating to HiBid Page: {page}...")
-                self.driver.get(current_url)
-                self.ui['metrics']['pages'].metric("Pages Scraped", page)
-                
-                try:
-                    print("Waiting for products to load...")
-                    WebDriverWait(self.driver, 40).until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, "h2.lot-title"))
-                    )
-                    print("Products loaded")
-                except TimeoutException:
-                    print("Timeout - no products found")
-                    self.ui['status'].success("No more pages found. Scraping complete.")
-                    break
-                
-                time.sleep(2)
-                html = self.driver.page_source
-                soup = BeautifulSoup(html, 'html.parser')
-                
-                products = [p for p in soup.find_all("app-lot-tile") if p.find("strong", class_="lot-price-realized")]
-                print(f"Found {len(products)} products on page {page}")
-                
-                if not products:
-                    print("No products with prices found")
-                    self.ui['status'].success("No more items with prices on this page. Scraping complete.")
-                    break
-
-                for i, p in enumerate(products, 1):
-                    if not self.running: 
-                        print("Stop signal detected")
-                        break
-                    
-                    title_tag = p.find("h2", class_="lot-title")
-                    link_tag = p.find("a")
-                    img_tag = p.find("img", class_="lot-thumbnail img-fluid")
-                    price_tag = p.find("strong", class_="lot-price-realized")
-                    
-                    if all([title_tag, link_tag, img_tag, price_tag]):
-                        self.process_item(
-                            title=title_tag.text.strip(),
-                            product_url=base_url + link_tag.get("href"),
-                            image_url=img_tag['src'],
-                            sold_price_text=price_tag.text,
-                            item_index=i,
-                            total_items_on_page=len(products)
-                        )
-                    time.sleep(0.5)
-                
-                page += 1
-                
-            except Exception as e:
-                print(f"Error on page {page}: {e}")
-                traceback.print_exc()
-                self.ui['status'].error(f"Error on page {page}: {str(e)}")
-                break
-
-    def scrape_biddingkings(self, url, start_page, end_page):
-        print(f"\nStarting BiddingKings scraper")
-        base_url = "https://auctions.biddingkings.com"
-        page = start_page
-        
-        while self.running and (end_page == 0 or page <= end_page):
-            try:
-                current_url = f"{url}?page={page}"
-                print(f"\nNavigating to BiddingKings Page: {page}")
-                print(f"URL: {current_url}")
-                
-                self.ui['status'].info(f"Scraping BiddingKings Page: {page}")
-                self.ui['metrics']['pages'].metric("Pages Scraped", page)
-                
-                self.driver.get(current_url)
-                time.sleep(3)
-                
-                try:
-                    print("Waiting for products...")
-                    WebDriverWait(self.driver, 40).until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, "div[class*='lot-repeater-index']"))
-                    )
-                    print("Products loaded")
-                except TimeoutException:
-                    print("Timeout - no products")
-                    self.ui['status'].success("No more pages found. Scraping complete.")
-                    break
-                
-                html = self.driver.page_source
-                soup = BeautifulSoup(html, 'html.parser')
-                products = soup.find_all("div", class_=re.compile(r'lot-repeater-index'))
-                print(f"Found {len(products)} products")
-                
-                if not products:
-                    print("No products found")
-                    self.ui['status'].success("No more items. Scraping complete.")
-                    break
-                    
-                for i, p in enumerate(products, 1):
-                    if not self.running: break
-                    
-                    link_tag = p.find("a")
-                    img_tag = p.find("img")
-                    
-                    if link_tag and img_tag:
-                        title = link_tag.text.strip()
-                        product_url = base_url + link_tag.get("href")
-                        
-                        print(f"Navigating to product page: {product_url}")
-                        self.driver.get(product_url)
-                        time.sleep(2)
-                        
-                        product_html = self.driver.page_source
-                        product_soup = BeautifulSoup(product_html, 'html.parser')
-                        price_tag = product_soup.find("span", class_="sold-amount")
-                        
-                        if price_tag:
-                            self.process_item(
-                                title=title,
-                                product_url=product_url,
-                                image_url=img_tag.get('ng-src'),
-                                sold_price_text=price_tag.text,
-                                item_index=i,
-                                total_items_on_page=len(products)
-                            )
-                        
-                        print("Going back to listing page")
-                        self.driver.back()
-                        time.sleep(1)
-                    
-                    time.sleep(0.5)
-                
-                page += 1
-                
-            except Exception as e:
-                print(f"Error on page {page}: {e}")
-                traceback.print_exc()
+    def crawl(self, adapter, start_page, end_page):
+        """Scrape one site through its adapter"""
+        print(f"\nStarting {adapter.name} crawl ({adapter.pagination} pages, {'browser' if adapter.uses_browser else 'HTTP'})")
+        seen = self.results.links()
+        if adapter.detail_pages:
+            self.crawl_pipelined(
+                adapter.name,
+                lambda: self._produce_detail_links(adapter, start_page, end_page, seen),
+                lambda link, response, item_index, links_found: self._process_detail_page(adapter, link, response, item_index, links_found)
+            )
+            if self.detail_failures:
+                print(f"{adapter.name}: {self.detail_failures} detail pages failed")
+        else:
+            self.crawl_listing(adapter, start_page, end_page, seen)
+
+    def crawl_listing(self, adapter, start_page, end_page, seen):
+        """Lots come straight from listing pages; stops on an empty page or one that only repeats earlier lots"""
+        # Lots on pages listed by this run: a resumed run re-lists pages whose lots were all restored, which is no reason to stop
+        listed = set()
+        for page, lots in self.iter_listing_pages(adapter, start_page, end_page):
+            if not self.running:
                 break
 
-    def generate_next_bidllama_urls(self, original_url, total_pages=500):
-        if "#" not in original_url: return [original_url]
-        base_url, encoded_fragment = original_url.split("#", 1)
-        padding = "=" * (4 - len(encoded_fragment) % 4)
-        try:
-            import base64
-            decoded = base64.b64decode(encoded_fragment + padding).decode()
-            current_page = int(re.search(r'page=(\d+)', decoded).group(1))
-            urls = []
-            for page_num in range(current_page, current_page + total_pages):
-                new_decoded = re.sub(r'page=\d+', f'page={page_num}', decoded)
-                new_encoded = base64.b64encode(new_decoded.encode()).decode().rstrip("=")
-                urls.append(base_url + "#" + new_encoded)
-            return urls
-        except Exception:
-            return [original_url]
-
-    def scrape_bidllama(self, url, start_page, end_page):
-        print(f"\nStarting BidLlama scraper")
-        base_url = "https://bid.bidllama.com"
-        page = start_page
-        paginated_urls = self.generate_next_bidllama_urls(url)
-        print(f"Generated {len(paginated_urls)} URLs")
-        
-        while self.running and (end_page == 0 or page <= end_page):
-            try:
-                if page - 1 >= len(paginated_urls):
-                    print("Reached end of generated URLs")
-                    self.ui['status'].success("Reached end of generated URLs.")
-                    break
-                    
-                current_url = paginated_urls[page-1]
-                print(f"\nNavigating to BidLlama Page: {page}")
-                print(f"URL: {current_url[:80]}...")
-                
-                self.ui['status'].info(f"Scraping BidLlama Page: {page}")
-                self.ui['metrics']['pages'].metric("Pages Scraped", page)
-                
-                self.driver.get(current_url)
-                time.sleep(5)
-                
-                try:
-                    print("Waiting for products...")
-                    WebDriverWait(self.driver, 40).until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, "p.item-lot-number"))
-                    )
-                    print("Products loaded")
-                except TimeoutException:
-                    print("Timeout - no products")
-                    self.ui['status'].success("No more pages found. Scraping complete.")
-                    break
-                
-                html = self.driver.page_source
-                soup = BeautifulSoup(html, 'html.parser')
-                item_container = soup.find("div", class_="item-row grid")
-                
-                if not item_container:
-                    print("No item container found")
-                    self.ui['status'].success("No item container found on page. Scraping complete.")
-                    break
-                
-                products = item_container.find_all("div", recursive=False)
-                print(f"Found {len(products)} products")
-                
-                if not products:
-                    print("No products found")
-                    self.ui['status'].success("No more items. Scraping complete.")
-                    break
+            self.ui['status'].info(f"Scraping {adapter.name} page {page}...")
 
-                for i, p in enumerate(products, 1):
-                    if not self.running: break
-                    
-                    title_tag = p.find("p", class_="item-title")
-                    img_container = p.find("p", class_="item-image")
-                    price_tag = p.find("p", class_="item-current-bid")
-                    
-                    if title_tag and img_container and price_tag:
-                        link_tag = img_container.find("a")
-                        img_tag = img_container.find("img")
-                        if link_tag and img_tag:
-                            product_url = base_url + link_tag.get("href")
-                            image_url = img_tag.get('src', '')
-                            if not image_url.startswith('http'):
-                                image_url = "https:" + image_url
-                            
-                            self.process_item(
-                                title=title_tag.text.strip(),
-                                product_url=product_url,
-                                image_url=image_url,
-                                sold_price_text=price_tag.text,
-                                item_index=i,
-                                total_items_on_page=len(products)
-                            )
-                    time.sleep(0.5)
-                
-                page += 1
-                
-            except Exception as e:
-                print(f"Error on page {page}: {e}")
-                traceback.print_exc()
+            if isinstance(lots, Exception):
+                print(f"Error on page {page}: {lots}")
+                traceback.print_exception(type(lots), lots, lots.__traceback__)
+                self.ui['status'].error(f"Error on page {page}: {lots}")
+                self.crawl_error = True
                 break
-
-
-
-    def scrape_macbid(self, url, start_page, end_page):
-        print(f"\nStarting MAC.bid scraper")
-        current_url = url
-        if not current_url.startswith("http"):
-            current_url = f"https://{current_url}"
-        
-        print(f"Navigating to: {current_url}")
-        self.driver.get(current_url)
-        base_url = "https://www.mac.bid"
-        
-        prev_product_count = 0
-        page = start_page
-        products_found = []
-        
-        self.ui['metrics']['pages'].metric("Pages Scraped", page)
-        
-        print("Scrolling to load all products...")
-        while self.running:
-            self.ui['status'].info(f"Loading MAC.bid page {page}...")
             
-            html = self.driver.page_source
-            soup = BeautifulSoup(html, 'html.parser')
-            products = soup.find_all("div", class_="d-block w-100 border-bottom")
+            print(f"Found {len(lots)} items on page {page}")
+            if not lots:
+                self.ui['status'].success("No more items found. Scraping complete.")
+                break
             
-            print(f"Current product count: {len(products)}")
             self.ui['metrics']['pages'].metric("Pages Scraped", page)
             
-            if len(products) != prev_product_count:
-                prev_product_count = len(products)
-                self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(1)
-            else:
-                if soup.find("div", class_="spinner-grow") is None:
-                    products_found = products
-                    print(f"All products loaded: {len(products_found)}")
-                    break
-                else:
-                    print("Still loading...")
-                    time.sleep(2)
-        
-        total_products = len(products_found)
-        processed = 0
-        
-        for product in products_found:
-            if not self.running:
-                break
+            usable = [lot for lot in lots if lot]
+            keys = {lot.get('product_url') for lot in usable}
+            repeats_listed = keys <= listed
+            listed.update(keys)
+            if adapter.detail_field and usable:
+                self.ui['status'].info(f"Fetching details for {len(usable)} lots on page {page}...")
+                self.fill_from_detail_pages(adapter, usable)
             
-            try:
-                if product.find("p", class_="badge badge-success") is not None:
-                    title = product.find("p").text.strip()
-                    sold_price = product.find("p", class_="badge badge-success").text.replace("Won for $", "").strip()
-                    retail_price = product.find("p", class_="font-size-sm").text.replace("Retails for $", "").strip()
-                    link_tag = product.find("a")
-                    link = base_url + link_tag["href"] if link_tag and link_tag.get("href") else ""
-                    
-                    self.process_item_no_ai(
-                        title=title,
-                        product_url=link,
-                        sold_price_text=sold_price,
-                        retail_price_text=retail_price,
-                        item_index=processed + 1,
-                        total_items_on_page=total_products
-                    )
-                
-                processed += 1
-                time.sleep(0.1)
-                
-            except Exception as e:
-                print(f"Error processing product {processed+1}: {e}")
-                self.ui['status'].warning(f"Error processing product {processed+1}: {str(e)}")
-                processed += 1
-
-    def scrape_vista(self, url, start_page, end_page):
-        print(f"\nStarting Vista scraper")
-        base_url = url.split("?")[0]
-        vista_base_url = "https://vistaauction.com"
-        page = start_page - 1 if start_page > 0 else 0
-        
-        while self.running and (end_page == 0 or page < end_page):
-            try:
-                current_url = f"{base_url}?page={page}"
-                print(f"\nNavigating to Vista page: {page}")
-                print(f"URL: {current_url}")
-                
-                self.ui['status'].info(f"Fetching Vista Auction page {page}...")
-                self.driver.get(current_url)
-                time.sleep(5)
-                
-                html = self.driver.page_source
-                soup = BeautifulSoup(html, "html.parser")
-                sections = soup.find_all("section")
-                print(f"Found {len(sections)} sections")
-                
-                if not sections:
-                    print("No sections found")
-                    self.ui['status'].success("No more items found on this page. Ending scrape.")
+            new_lots = 0
+            for i, lot in enumerate(lots, 1):
+                if not self.running:
+                    print("Stop signal detected")
                     break
-                
-                self.ui['metrics']['pages'].metric("Pages Scraped", page + 1)
-                
-                for i, section in enumerate(sections, 1):
-                    if not self.running:
-                        break
-                    
-                    try:
-                        title_elem = section.find("h2", class_="title inlinebidding")
-                        if title_elem:
-                            raw_title = title_elem.text.strip()
-                            title = re.sub(r'^Lot \d+\s*-\s*', '', raw_title).strip()
-                        else:
-                            continue
-
-                        linker_elem = section.find("h3", class_="subtitle")
-                        linker = "N/A"
-                        if linker_elem:
-                            link_tag = linker_elem.find("a")
-                            if link_tag:
-                                link_href = link_tag.get("href")
-                                if link_href and not link_href.startswith("http"):
-                                    linker = vista_base_url + link_href
-                                else:
-                                    linker = link_href if link_href else "N/A"
-
-                        sold_price_elem = section.find("span", class_="NumberPart")
-                        if not sold_price_elem:
-                            continue
-                        
-                        sold_price_text = sold_price_elem.text.strip()
-                        sold_price_match = re.search(r'\$?([\d,]+\.?\d*)', sold_price_text)
-                        if sold_price_match:
-                            sold_price_str = sold_price_match.group(1).replace(',', '')
-                            sold_price_float = float(sold_price_str)
-                        else:
-                            continue
-                        
-                        retail_price_elem = section.find("h3", class_="subtitle")
-                        if not retail_price_elem:
-                            continue
-
-                        retail_price_text = retail_price_elem.text.strip()
-                        retail_price_match = re.search(r'\$?([\d,]+\.?\d*)', retail_price_text)
-                        if retail_price_match:
-                            retail_price_str = retail_price_match.group(1).replace(',', '')
-                            retail_price_float = float(retail_price_str)
-                        else:
-                            continue
-                        
-                        self.process_item_no_ai(
-                            title=title,
-                            product_url=linker,
-                            sold_price_text=str(sold_price_float),
-                            retail_price_text=str(retail_price_float),
-                            item_index=i,
-                            total_items_on_page=len(sections)
-                        )
-                        
-                    except Exception as e:
+                if not lot:
+                    continue
+                key = lot.get('product_url')
+                if key and key != "N/A":
+                    if key in seen:
                         continue
-                
-                page += 1
-                
-            except Exception as e:
-                print(f"Error fetching page {page}: {e}")
-                traceback.print_exc()
-                break
+                    seen.add(key)
+                new_lots += 1
+                self.process_lot(adapter, lot, i, len(lots))
 
-    def scrape_bidsoflo(self, url, start_page, end_page):
-        print(f"\nStarting BidSoflo scraper")
-        base_url = "https://bid.bidsoflo.us"
-        current_url = url
-        page = start_page
-        
-        print(f"Navigating to: {current_url}")
-        self.driver.get(current_url)
-        time.sleep(2)
-        
-        while self.running and (end_page == 0 or page <= end_page):
-            try:
-                page_flag = False
-                print(f"\nFetching BidSoflo page {page}")
-                
-                html = self.driver.page_source
-                soup = BeautifulSoup(html, 'html.parser')
-                
-                products = soup.find_all("div", class_="row mr-1")
-                print(f"Found {len(products)} products")
-                
-                tmp_page = soup.find_all("li", class_="page-item")
-                for pa in tmp_page:
-                    if "next" in pa.text.lower():
-                        urlz = pa.find("a", class_="page-link")
-                        if urlz is not None:
-                            urlz = urlz["data-url"].split("page=")[-1]
-                            t_url = current_url.split("=")[-1]
-                            current_url = current_url.replace(t_url, urlz)
-                            page_flag = True
-                            print(f"Next page found: {current_url}")
-                        else:
-                            page_flag = False
-                
-                self.ui['metrics']['pages'].metric("Pages Scraped", page)
-                
-                product_count = 0
-                for i, p in enumerate(products, 1):
-                    if not self.running:
-                        break
-                    
-                    try:
-                        if p.find("div", class_="tooltip-demos") is not None:
-                            tool = p.find("div", class_="tooltip-demos")
-                            tmp = tool.find_all("div", recursive=False)
-                            
-                            title = " "
-                            for xi in tmp:
-                                if "Item Description" in xi.text:
-                                    title = xi.text.replace("Item Description", "").strip()
-                                    break
-                            
-                            if title != " ":
-                                retail_price = " "
-                                for xi in tmp:
-                                    if "Retail Cost:" in xi.text:
-                                        retail_price = xi.text.replace("Retail Cost:", "").replace("$", "").strip()
-                                        break
-                                
-                                if retail_price != " ":
-                                    sold_price = " "
-                                    tmp_price = p.find("div", class_="font-bold text-body")
-                                    if tmp_price is not None:
-                                        if "Final Bid :" in tmp_price.text:
-                                            sold_price = tmp_price.text.replace("Final Bid :", "").replace("$", "").strip()
-                                            
-                                            if sold_price != " ":
-                                                try:
-                                                    sold_price_float = float(sold_price.replace("$", "").replace(",", ""))
-                                                    retail_price_float = float(retail_price.replace("$", "").replace(",", ""))
-                                                except (ValueError, ZeroDivisionError):
-                                                    continue
-                                                
-                                                link_tag = p.find("a")
-                                                link = base_url + link_tag["href"] if link_tag and link_tag.get("href") else "N/A"
-                                                
-                                                self.process_item_no_ai(
-                                                    title=title,
-                                                    product_url=link,
-                                                    sold_price_text=str(sold_price_float),
-                                                    retail_price_text=str(retail_price_float),
-                                                    item_index=product_count + 1,
-                                                    total_items_on_page=len(products)
-                                                )
-                                                
-                                                product_count += 1
-                    
-                    except Exception as e:
-                        print(f"Error processing item {i}: {e}")
-                        continue
-                
-                print(f"Processed {product_count} valid items on page {page}")
-                
-                if page_flag:
-                    print(f"Moving to page {page+1}...")
-                    self.driver.get(current_url)
-                    page += 1
-                    time.sleep(2)
-                else:
-                    print("No more pages")
-                    self.ui['status'].success("No more pages to fetch.")
-                    break
-                
-            except Exception as e:
-                print(f"Error on page {page}: {e}")
-                traceback.print_exc()
+            if self.running:
+                self.checkpoint_page(page, usable[-1].get('product_url') if usable else None)
+
+            if usable and not new_lots and repeats_listed:
+                print("Page only repeats earlier lots, ending")
+                self.ui['status'].success("No more new items. Scraping complete.")
                 break
 
-    def scrape_bidauctiondepot(self, url, start_page, end_page):
-        print(f"\nStarting BidAuctionDepot scraper")
-        base_url = "https://bidauctiondepot.com/productView/"
-        page = start_page
-        lot_id = ""
-        flag = True
-        
-        print(f"Navigating to: {url}")
-        self.driver.get(url)
-        time.sleep(3)
-        
-        while self.running and flag and (end_page == 0 or page <= end_page):
-            try:
-                print(f"\nFetching BidAuctionDepot page {page}")
-                
-                try:
-                    print("Waiting for product cards...")
-                    WebDriverWait(self.driver, 25).until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, 'div[class*="card grid-card a gallery auction"]'))
-                    )
-                    print("Product cards loaded")
-                except TimeoutException:
-                    print("Timeout waiting for products")
-                
-                html = self.driver.page_source
-                soup = BeautifulSoup(html, 'html.parser')
-                
-                products = soup.find_all('div', class_=lambda c: c and "card grid-card a gallery auction" in c)
-                print(f"Found {len(products)} products")
-                
-                if not products:
-                    print("No products found")
-                    self.ui['status'].success("No products found. Scraping complete.")
-                    break
-                
-                self.ui['metrics']['pages'].metric("Pages Scraped", page)
-                
-                for i, p in enumerate(products, 1):
-                    if not self.running:
-                        break
-                    
+    def iter_listing_pages(self, adapter, start_page, end_page):
+        """
+        Yield (page, lots_or_exception) in page order. Numbered pages are
+        fetched ahead (HTTP engine window or browser pool); next-link and
+        custom pagination are inherently one page at a time.
+        """
+        last_page = end_page or None
+
+        if adapter.pagination == "numbered":
+            pages = self.page_numbers(start_page, last_page)
+            if adapter.uses_browser:
+                def load_page(driver, page):
+                    page_url = adapter.page_url(page)
+                    if page_url is None:
+                        return []
+                    if self.capture_network:
+                        return self.load_lots_from_network(driver, adapter, page_url, page)
+                    self.load_in_browser(driver, adapter, page_url, page)
+                    return adapter.read_page(driver, page, page_url)[0]
+                yield from self.iter_browser_pages(load_page, pages)
+            else:
+                pages, url_pages = itertools.tee(pages)
+                page_urls = (adapter.page_url(page) for page in url_pages)
+                for page, (page_url, response) in zip(pages, self.http.iter_ordered(page_urls)):
+                    print(f"\nFetched {adapter.name} page {page}: {page_url}")
                     try:
-                        title_elem = p.find("h5")
-                        if not title_elem:
-                            continue
-                        
-                        title = title_elem.text.strip()
-                        
-                        retail_price_elem = p.select_one("h6.galleryPrice.rtlrPrice")
-                        if not retail_price_elem:
-                            continue
-                        
-                        retail_price_text = retail_price_elem.text.replace("Retail Price:", "").replace("$", "").replace(",", "").strip()
-                        
-                        try:
-                            retail_price_float = float(retail_price_text)
-                        except ValueError:
-                            continue
-                        
-                        sold_price_elem = p.find("span", class_="curBidAmtt")
-                        if not sold_price_elem:
-                            continue
-                        
-                        sold_price_text = sold_price_elem.text.replace("Current Bid:", "").replace("$", "").replace(",", "").strip()
-                        
-                        try:
-                            sold_price_float = float(sold_price_text)
-                        except ValueError:
-                            continue
-                        
-                        link_elem = p.get("id")
-                        if not link_elem:
-                            continue
-                        
-                        link_id = link_elem.replace("lot-", "")
-                        
-                        if lot_id == link_id:
-                            print("Duplicate lot found, ending scrape")
-                            flag = False
-                            break
-                        else:
-                            lot_id = link_id
-                        
-                        link = base_url + link_id
-                        
-                        self.process_item_no_ai(
-                            title=title,
-                            product_url=link,
-                            sold_price_text=str(sold_price_float),
-                            retail_price_text=str(retail_price_float),
-                            item_index=i,
-                            total_items_on_page=len(products)
-                        )
-                        
+                        yield page, adapter.extract_lots(self.response_text(response, page), page)
                     except Exception as e:
-                        print(f"Error processing item {i}: {e}")
-                        continue
-                
-                if not flag:
-                    break
-                
+                        yield page, e
+
+        elif adapter.pagination == "next_link":
+            page = start_page
+            if self.resume_cursor and self.resume_cursor['page'] is not None and self.resume_cursor['next_url']:
+                page_url = self.resume_cursor['next_url']
+            else:
+                # No saved next link to follow: walk from the first page again; restored lots are skipped as seen
+                if self.resume_cursor:
+                    page = self.resume_cursor['start_page']
+                page_url = adapter.first_url()
+            while page_url and self.running and (last_page is None or page <= last_page):
                 try:
-                    print("Looking for next page button...")
-                    next_button = self.driver.find_element(By.CSS_SELECTOR, "a[aria-label='Go to next page']")
-                    if next_button:
-                        print("Clicking next page")
-                        next_button.click()
-                        page += 1
-                        time.sleep(3)
+                    if adapter.uses_browser:
+                        driver = self.page_driver()
+                        self.load_in_browser(driver, adapter, page_url, page)
+                        lots, next_url = adapter.read_page(driver, page, page_url)
                     else:
-                        print("No more pages")
-                        break
-                except NoSuchElementException:
-                    print("Next button not found")
-                    self.ui['status'].success("No more pages to scrape.")
-                    break
+                        print(f"\nFetching {adapter.name} page {page}: {page_url}")
+                        html = self.response_text(self.http.get(page_url), page)
+                        lots, next_url = adapter.extract_page(html, page, page_url)
                 except Exception as e:
-                    print(f"Pagination error: {e}")
-                    break
-                
-            except Exception as e:
-                print(f"Error on page {page}: {e}")
-                traceback.print_exc()
-                break
-
-    # === NON-SELENIUM SCRAPERS (using requests) ===
-    
-    def scrape_nellis(self, url, start_page, end_page):
-        print(f"\nStarting Nellis scraper (requests-based)")
-        base_url = "https://www.nellisauction.com"
-        current_url = url
-        if not current_url.startswith("http"):
-            current_url = f"https://{current_url}"
-        
-        links = []
-        page = start_page
-        
-        while self.running and (end_page == 0 or page <= end_page):
-            try:
-                print(f"\nFetching Nellis page {page}...")
-                print(f"URL: {current_url}")
-                
-                self.ui['status'].info(f"Fetching Nellis page {page}...")
-                req = requests.get(current_url, headers=self.headers)
-                
-                if req.status_code != 200:
-                    print(f"Failed: HTTP {req.status_code}")
-                    self.ui['status'].error(f"Failed to fetch page {page}. Status code: {req.status_code}")
-                    break
-                
-                soup = BeautifulSoup(req.text, "html.parser")
-                products = soup.find_all("li", class_="__list-item-base")
-                print(f"Found {len(products)} product links")
-                
-                if not products:
-                    print("No products found")
-                    break
-                
-                for p in products:
-                    link_tag = p.find("a")
-                    if link_tag and link_tag.get("href"):
-                        product_url = base_url + link_tag.get("href")
-                        links.append(product_url)
-                
-                self.ui['metrics']['pages'].metric("Pages Scraped", page)
-                
-                pagination_links = soup.find_all("a", class_="__pagination-link")
-                next_page = None
-                
-                for link in pagination_links:
-                    if "__pagination-arrow-rotate-right" in link.get("class", []):
-                        next_page = link.get("href")
-                        break
-                    elif link.text.strip() == str(page + 1):
-                        next_page = link.get("href")
-                        break
-                
-                if not next_page:
-                    print("No next page link found")
-                    break
-                
-                current_url = base_url + next_page
+                    yield page, e
+                    return
+                self.next_page_urls[page] = next_url
+                yield page, lots
+                page_url = next_url
                 page += 1
-                time.sleep(0.5)
-                
-            except Exception as e:
-                print(f"Error while fetching page {page}: {e}")
-                traceback.print_exc()
-                break
-        
-        print(f"\nTotal product links collected: {len(links)}")
-        total_products = len(links)
-        processed = 0
         
-        for link in links:
-            if not self.running:
-                break
-            
+        else:
+            page = start_page
+            capture = None
+            if self.capture_network:
+                capture = NetworkCapture(self.driver, adapter.api_url_pattern)
+                capture.discard()
             try:
-                print(f"\nProcessing product {processed+1}/{total_products}")
-                print(f"URL: {link}")
-                
-                req = requests.get(link, headers=self.headers)
-                soup = BeautifulSoup(req.text, "html.parser")
-                title = soup.find("h1")
-                title = title.text if title else "Unknown Title"
-                
-                sold_price = " "
-                sold_price_tmp = soup.find_all("p", class_="text-gray-900 font-semibold line-clamp-1 text-label-sm xxs:text-title-xs xs:text-label-md sm:text-title-xs md:text-title-sm lg:text-title-md xl:text-title-sm xxl:text-title-xs")
-                for x in sold_price_tmp:
-                    if "$" in x.text:
-                        sold_price = x.text
-                        break
-                
-                if sold_price != " ":
-                    retail_price = " "
-                    retail_price_tmp = soup.find_all("div", class_="flex flex-col text-left")
-                    for x in retail_price_tmp:
-                        if "Estimated Retail Price" in x.text:
-                            retail_price = x.text.replace("Estimated Retail Price", "").strip()
-                            break
-                    
-                    if retail_price == " ":
-                        retail_price_tmp = soup.find_all("div", class_="grid grid-cols-[minmax(0,_0.6fr)_minmax(0,_1fr)] gap-2 text-left")
-                        for x in retail_price_tmp:
-                            if "Estimated Retail Price" in x.text:
-                                retail_price = x.text.replace("Estimated Retail Price", "").strip()
-                                break
-                    
-                    if retail_price != " ":
-                        category = " "
-                        category_tmp = soup.find("a", class_="flex items-center gap-1 text-secondary focus-within:outline-secondary hover:underline hover:text-secondary-light w-fit")
-                        if category_tmp:
-                            category = category_tmp.text.strip()
-                        
-                        self.process_item_no_ai(
-                            title=title,
-                            product_url=link,
-                            sold_price_text=sold_price,
-                            retail_price_text=retail_price,
-                            item_index=processed + 1,
-                            total_items_on_page=total_products,
-                            category=category
-                        )
-                
-                processed += 1
-                time.sleep(0.1)
-                
+                for page, read_lots in adapter.load_pages(self.driver, start_page, last_page, lambda: self.running,
+                                                          resume=self.resume_cursor):
+                    # Responses since the previous page are the ones that rendered this one
+                    lots = self.captured_lots(adapter, page, capture.drain()) if capture and self.capture_network else None
+                    yield page, lots or read_lots()
             except Exception as e:
-                print(f"Error processing product {processed+1}: {e}")
-                traceback.print_exc()
-                processed += 1
-
-    def scrape_bidfta(self, url, start_page, end_page):
-        print(f"\nStarting BidFTA scraper (requests-based)")
-        base_url = "https://www.bidfta.com"
-        current_url = url
-        if not current_url.startswith("http"):
-            current_url = f"https://{current_url}"
-        
-        urlz = current_url.split("/")
-        if len(urlz) > 0 and urlz[-1].isdigit():
-            del urlz[-1]
-        current_url = "/".join(urlz)
-        
-        links = []
-        page = start_page
-        
-        while self.running and (end_page == 0 or page <= end_page):
+                yield page, e
+
+    def load_in_browser(self, driver, adapter, page_url, page):
+        """Navigate and wait for the adapter's readiness signal (adapter.read_page() then reads the lots)"""
+        print(f"\nNavigating to {adapter.name} page {page}: {page_url}")
+        driver.get(page_url)
+        if adapter.ready_selector:
+            wait_until_ready(driver, adapter.name, adapter.ready_selector, max_timeout=adapter.ready_timeout)
+
+    def load_lots_from_network(self, driver, adapter, page_url, page):
+        """Navigate and take the lots from the page's captured JSON, falling back to its HTML if none turn up"""
+        capture = NetworkCapture(driver, adapter.api_url_pattern)
+        capture.discard()
+        print(f"\nNavigating to {adapter.name} page {page} (capturing JSON): {page_url}")
+        driver.get(page_url)
+        lots = self.captured_lots(adapter, page, capture.wait(adapter.ready_timeout))
+        if lots:
+            return lots
+        if adapter.ready_selector:
+            wait_until_ready(driver, adapter.name, adapter.ready_selector, max_timeout=adapter.ready_timeout)
+        return adapter.read_page(driver, page, page_url)[0]
+
+    def captured_lots(self, adapter, page, responses):
+        """
+        Lots in one page's captured responses ([] to use the HTML instead).
+        The first page that yields none switches capture off for the rest of
+        the run, so a changed API does not cost a capture timeout per page.
+        """
+        if responses and FIXTURES_DIR:
+            print(f"Saved network fixture: {save_fixture(adapter.name, page, responses)}")
+        lots = []
+        try:
+            lots = adapter.extract_api_lots(responses, page) if responses else []
+        except Exception as e:
+            print(f"Could not read lots from captured responses: {e}")
+            traceback.print_exc()
+        if any(lots):
+            print(f"Page {page}: {len(lots)} lots from {len(responses)} captured responses")
+            return lots
+        if self.capture_network:
+            print(f"No lots in {adapter.name}'s captured responses - reading page HTML from now on")
+            self.ui['status'].warning(f"Could not read {adapter.name}'s data feed, falling back to page HTML.")
+            self.capture_network = False
+        return []
+
+    @staticmethod
+    def response_text(response, page):
+        if isinstance(response, Exception):
+            raise response
+        if response.status_code != 200:
+            print(f"Failed: HTTP {response.status_code}")
+            raise RuntimeError(f"Failed to fetch page {page}. Status code: {response.status_code}")
+        return response.text
+
+    def process_lot(self, adapter, lot, item_index, total_items_on_page):
+        if adapter.detail_field and not lot.get(adapter.detail_field):
+            return
+        if 'retail_price_text' in lot:
+            self.process_item_no_ai(item_index=item_index, total_items_on_page=total_items_on_page, **lot)
+        else:
+            self.process_item(item_index=item_index, total_items_on_page=total_items_on_page, **lot)
+
+    def browser_session_headers(self):
+        """Request headers that carry the browser's cookies and user agent, so plain HTTP sees the same session"""
+        headers = dict(self.headers)
+        try:
+            headers['User-Agent'] = self.driver.execute_script("return navigator.userAgent")
+        except Exception as e:
+            print(f"Could not read browser user agent: {e}")
+        cookies = "; ".join(f"{c['name']}={c['value']}" for c in self.driver.get_cookies())
+        if cookies:
+            headers['Cookie'] = cookies
+        return headers
+
+    def fill_from_detail_pages(self, adapter, lots):
+        """
+        Add adapter.detail_field to each lot from its product page. All pages
+        are fetched as one parallel HTTP batch with the browser's cookies; lots
+        the static HTML does not cover fall back to the browser, without
+        navigating back to the listing.
+        """
+        field = adapter.detail_field
+
+        if self.detail_over_http.get(adapter.name, True):
+            headers = self.browser_session_headers()
+            responses = self.http.fetch_many([lot['product_url'] for lot in lots], headers=headers)
+            fetched = 0
+            for lot, response in zip(lots, responses):
+                if isinstance(response, Exception) or response.status_code != 200:
+                    continue
+                fetched += 1
+                lot.update(adapter.extract_detail(response.text) or {})
+            found = sum(1 for lot in lots if lot.get(field))
+            print(f"HTTP detail batch: {found}/{len(lots)} lots have {field}")
+
+            if fetched and not found:
+                # The field is rendered client-side on this site; stop paying for the HTTP batch
+                print(f"{adapter.name} detail pages need the browser - switching to browser detail mode")
+                self.detail_over_http[adapter.name] = False
+
+        for lot in lots:
+            if lot.get(field) or not self.running:
+                continue
+            print(f"Loading product page in browser: {lot['product_url']}")
             try:
-                print(f"\nFetching BidFTA page {page}...")
-                page_url = f"{current_url}/{page}"
-                print(f"URL: {page_url}")
-                
-                self.ui['status'].info(f"Fetching BidFTA page {page}...")
-                req = requests.get(page_url, headers=self.headers)
-                
-                if req.status_code != 200:
-                    print(f"Failed: HTTP {req.status_code}")
-                    break
-                
-                soup = BeautifulSoup(req.text, "html.parser")
-                div = soup.find("div", class_="grid grid-cols-1 gap-5 md:gap-6 pb-8 xl:pb-16 md:grid-cols-3 2xl:grid-cols-4")
-                
-                if not div:
-                    print("No product grid found")
-                    break
-                
-                products = div.find_all("div", class_="block")
-                print(f"Found {len(products)} products")
-                
-                if not products:
-                    print("No products in grid")
-                    break
-                
-                new_links = 0
-                for p in products:
-                    link_tag = p.find("a")
-                    if link_tag and link_tag.get("href"):
-                        product_url = base_url + link_tag.get("href")
-                        if product_url not in links:
-                            links.append(product_url)
-                            new_links += 1
-                
-                print(f"New links added: {new_links}")
-                
-                if new_links == 0:
-                    print("No new links, ending")
-                    break
-                
-                self.ui['metrics']['pages'].metric("Pages Scraped", page)
-                page += 1
-                time.sleep(0.5)
-                
+                driver = self.page_driver()
+                driver.get(lot['product_url'])
+                if wait_until_ready(driver, f"{adapter.name} detail", adapter.detail_ready_selector,
+                                    max_timeout=adapter.detail_ready_timeout):
+                    lot.update(adapter.read_detail(driver) or {})
+                else:
+                    print(f"No {field} on product page")
             except Exception as e:
-                print(f"Error while fetching page {page}: {e}")
-                traceback.print_exc()
-                break
-        
-        print(f"\nTotal product links: {len(links)}")
-        total_products = len(links)
+                print(f"Error loading product page: {e}")
+
+    def crawl_pipelined(self, site_label, produce_events, process_detail):
+        """
+        Run a listing producer and detail consumer at the same time.
+
+        produce_events is a generator function run on a background thread; it
+        yields ('page', n), ('link', url) and ('error', message) events into a
+        bounded queue. The calling thread keeps up to max_connections_per_host
+        detail pages in flight and hands each response to
+        process_detail(link, response, item_index, links_found) in order.
+        """
+        event_queue = queue.Queue(maxsize=LINK_QUEUE_SIZE)
+        stop_event = threading.Event()
+        producer = threading.Thread(
+            target=self._run_link_producer,
+            args=(produce_events, event_queue, stop_event),
+            name=f"{site_label}-listing",
+            daemon=True
+        )
+        producer.start()
+
+        pending = deque()
+        producing = True
+        links_found = 0
         processed = 0
+        current_page = None
+        first_page = None
+        done_page = None
         
-        for link in links:
-            if not self.running:
-                break
-            
-            try:
-                print(f"\nProcessing product {processed+1}/{total_products}")
-                print(f"URL: {link}")
-                
-                req = requests.get(link, headers=self.headers)
-                soup = BeautifulSoup(req.text, "html.parser")
-                
-                title_elem = soup.find("h2")
-                title = title_elem.text.strip() if title_elem else "Unknown Title"
-                
-                sold_price = " "
-                sold_price_elems = soup.find_all("div", class_="flex gap-1 xs:gap-2 items-end text-bidfta-blue-light")
-                for elem in sold_price_elems:
-                    if "CURRENT BID" in elem.text:
-                        price_text = elem.text.replace("\n", "").replace("CURRENT BID", "").strip()
-                        sold_price = re.sub(r"[^\d.]", "", price_text)
-                        if sold_price.startswith("."):
-                            sold_price = sold_price[1:]
-                        if sold_price.endswith("."):
-                            sold_price = sold_price[:-1]
+        try:
+            while self.running and (producing or pending):
+                while producing and len(pending) < self.max_connections_per_host:
+                    try:
+                        kind, value = event_queue.get(timeout=0.2) if not pending else event_queue.get_nowait()
+                    except queue.Empty:
                         break
-                
-                if sold_price != " ":
-                    retail_price = " "
-                    retail_price_elems = soup.find_all("div", class_="flex gap-1 xs:gap-2 items-end")
-                    for elem in retail_price_elems:
-                        if "MSRP" in elem.text:
-                            price_text = elem.text.replace("MSRP", "").replace("\n", "").strip()
-                            retail_price = re.sub(r"[^\d.]", "", price_text)
-                            if retail_price.startswith("."):
-                                retail_price = retail_price[1:]
-                            if retail_price.endswith("."):
-                                retail_price = retail_price[:-1]
-                            break
                     
-                    if retail_price != " ":
-                        self.process_item_no_ai(
-                            title=title,
-                            product_url=link,
-                            sold_price_text=sold_price,
-                            retail_price_text=retail_price,
-                            item_index=processed + 1,
-                            total_items_on_page=total_products
-                        )
-                
-                processed += 1
-                time.sleep(0.1)
-                
-            except Exception as e:
-                print(f"Error processing product {processed+1}: {e}")
-                traceback.print_exc()
+                    if kind == 'link':
+                        links_found += 1
+                        pending.append((value, self.http.submit(value), current_page))
+                    elif kind == 'page':
+                        current_page = value
+                        if first_page is None:
+                            first_page = value
+                        self.ui['status'].info(f"Fetching {site_label} page {value}...")
+                        self.ui['metrics']['pages'].metric("Pages Scraped", value)
+                    elif kind == 'error':
+                        self.crawl_error = True
+                        self.ui['status'].error(value)
+                    elif kind == 'done':
+                        producing = False
+
+                if not pending:
+                    continue
+
+                link, future, _ = pending.popleft()
                 processed += 1
+                try:
+                    response = future.result()
+                except Exception as e:
+                    response = e
+                process_detail(link, response, processed, links_found)
+
+                # Every link of the pages before the oldest one still in flight is done
+                # (pages before this run's first one were never crawled here, so there is nothing to record)
+                oldest_page = pending[0][2] if pending else current_page
+                if (self.running and oldest_page is not None and oldest_page > first_page
+                        and (done_page is None or oldest_page - 1 > done_page)):
+                    done_page = oldest_page - 1
+                    self.checkpoint_page(done_page, link)
+        finally:
+            stop_event.set()
+            for _, future, _ in pending:
+                future.cancel()
+            producer.join(timeout=5)
+
+        print(f"\n{site_label}: {processed} of {links_found} product links processed")
 
-    def scrape_astock(self, url, start_page, end_page):
-        print(f"\nStarting A-Stock scraper (requests-based)")
-        base_url = url.split("?")[0]
-        page = start_page
+    def _run_link_producer(self, produce_events, event_queue, stop_event):
+        def offer(event):
+            while self.running and not stop_event.is_set():
+                try:
+                    event_queue.put(event, timeout=0.5)
+                    return True
+                except queue.Full:
+                    continue
+            return False
         
-        while self.running and (end_page == 0 or page <= end_page):
-            try:
-                print(f"\nFetching A-Stock page {page}...")
-                current_url = f"{base_url}?page={page}"
-                print(f"URL: {current_url}")
-                
-                self.ui['status'].info(f"Fetching A-Stock page {page}...")
-                response = requests.get(current_url, headers=self.headers)
-                
-                if response.status_code != 200:
-                    print(f"Failed: HTTP {response.status_code}")
-                    self.ui['status'].error(f"Failed to fetch page {page}. Status code: {response.status_code}")
-                    break
-                
-                soup = BeautifulSoup(response.text, "html.parser")
-                sections = soup.find_all("section")
-                print(f"Found {len(sections)} sections")
-                
-                if len(sections) == 0:
-                    print("No items found")
-                    self.ui['status'].success("No items found. Scraping complete.")
-                    break
-                
-                self.ui['metrics']['pages'].metric("Pages Scraped", page)
-                
-                for i, section in enumerate(sections, 1):
-                    if not self.running:
-                        break
-                    
-                    try:
-                        title_elem = section.find("h2", class_="title inlinebidding")
-                        if not title_elem:
-                            continue
-                        
-                        linker = section.find("h2", class_="title inlinebidding").find("a")
-                        if linker:
-                            linker = "https://a-stock.bid" + linker.get("href")
-                        else:
-                            linker = "N/A"
-                        
-                        if "-" in title_elem.text:
-                            title = title_elem.text.split("-", 1)[1].lstrip().rstrip()
-                        else:
-                            title = title_elem.text.strip()
-                        
-                        sold_price_elem = section.find("p", class_="bids")
-                        if not sold_price_elem:
-                            continue
-                        
-                        sold_price_text = sold_price_elem.text.strip()
-                        sold_price = re.sub(r"[^\d.]", "", sold_price_text)
-                        
-                        try:
-                            sold_price_float = float(sold_price)
-                        except ValueError:
-                            continue
-                        
-                        retail_price_elem = section.find("div", class_="listing-auction-row-retail-value")
-                        if not retail_price_elem:
-                            continue
-                        
-                        retail_price_text = retail_price_elem.text.strip()
-                        retail_price = re.sub(r"[^\d.]", "", retail_price_text)
-                        
-                        try:
-                            retail_price_float = float(retail_price)
-                        except ValueError:
-                            continue
-                        
-                        self.process_item_no_ai(
-                            title=title,
-                            product_url=linker,
-                            sold_price_text=str(sold_price_float),
-                            retail_price_text=str(retail_price_float),
-                            item_index=i,
-                            total_items_on_page=len(sections)
-                        )
-                        
-                    except Exception as e:
-                        print(f"Error processing item {i}: {e}")
-                        continue
-                
-                page += 1
-                time.sleep(0.5)
-                
-            except Exception as e:
-                print(f"Error fetching page {page}: {e}")
-                traceback.print_exc()
+        try:
+            for event in produce_events():
+                if not offer(event):
+                    return
+        except Exception as e:
+            print(f"Listing producer failed: {e}")
+            traceback.print_exc()
+            offer(('error', f"Error while fetching listing pages: {e}"))
+        finally:
+            offer(('done', None))
+
+
+    def _produce_detail_links(self, adapter, start_page, end_page, seen_links):
+        """Listing producer for detail-page sites; runs on the producer thread and never touches the UI"""
+        listed = set()
+        for page, links in self.iter_listing_pages(adapter, start_page, end_page):
+            if not self.running:
                 break
+            yield ('page', page)
 
+            if isinstance(links, Exception):
+                yield ('error', f"Error on page {page}: {links}")
+                break
 
+            print(f"Found {len(links)} product links")
+            if not links:
+                print("No products found")
+                break
 
-    def scrape_702auctions(self, url, start_page, end_page):
-        print(f"\nStarting 702Auctions scraper (requests-based)")
-        auction_base_url = "https://bid.702auctions.com"
-        
-        base_url = url
-        if "ViewStyle=list" not in url:
-            temp_url = base_url.replace("https://", "")
-            temp_url = temp_url.split("/")
-            del temp_url[-1]
-            temp_url = "/".join(temp_url)
-            base_url = "https://" + temp_url
-        
-        page = start_page - 1 if start_page > 0 else 0
-        
-        while self.running and (end_page == 0 or page < end_page):
-            try:
-                print(f"\nFetching 702Auctions page {page}...")
-                current_url = f"{base_url}/?ViewStyle=list&StatusFilter=completed_only&SortFilterOptions=0&page={page}"
-                print(f"URL: {current_url}")
-                
-                self.ui['status'].info(f"Fetching 702Auctions page {page}...")
-                response = requests.get(current_url, headers=self.headers)
-                
-                if response.status_code != 200:
-                    print(f"Failed: HTTP {response.status_code}")
-                    self.ui['status'].error(f"Failed to fetch page {page}. Status code: {response.status_code}")
-                    break
-                
-                soup = BeautifulSoup(response.text, "html.parser")
-                sections = soup.find_all("section")
-                print(f"Found {len(sections)} sections")
-                
-                if not sections:
-                    print("No sections found")
-                    self.ui['status'].success("No more items found on this page. Ending scrape.")
-                    break
-                
-                self.ui['metrics']['pages'].metric("Pages Scraped", page + 1)
-                
-                for i, section in enumerate(sections, 1):
-                    if not self.running:
-                        break
-                    
-                    try:
-                        title_elem = section.find("h2", class_="title inlinebidding")
-                        if not title_elem:
-                            continue
-                        
-                        linker = section.find("h3", class_="subtitle")
-                        if linker:
-                            linker = linker.find("a")
-                            if linker:
-                                link_href = linker.get("href")
-                                if link_href and not link_href.startswith("http"):
-                                    linker = auction_base_url + link_href
-                                else:
-                                    linker = link_href if link_href else "N/A"
-                            else:
-                                linker = "N/A"
-                        else:
-                            linker = "N/A"
-                        
-                        if "-" in title_elem.text:
-                            title = title_elem.text.split("-", 1)[1].lstrip().rstrip()
-                        else:
-                            title = title_elem.text.strip()
-                        
-                        sold_price_elem = section.find("span", class_="NumberPart")
-                        if not sold_price_elem:
-                            continue
-                        
-                        sold_price_text = sold_price_elem.text.strip()
-                        sold_price_match = re.search(r'\$?([\d,]+\.?\d*)', sold_price_text)
-                        if sold_price_match:
-                            sold_price_str = sold_price_match.group(1).replace(',', '')
-                            sold_price_float = float(sold_price_str)
-                        else:
-                            continue
-
-                        retail_price_elem = section.find("h3", class_="subtitle")
-                        if not retail_price_elem:
-                            continue
-                        
-                        retail_price_text = retail_price_elem.text.strip()
-                        retail_price_match = re.search(r'\$?([\d,]+\.?\d*)', retail_price_text)
-                        if retail_price_match:
-                            retail_price_str = retail_price_match.group(1).replace(',', '')
-                            retail_price_float = float(retail_price_str)
-                        else:
-                            continue
-                        
-                        self.process_item_no_ai(
-                            title=title,
-                            product_url=linker,
-                            sold_price_text=str(sold_price_float),
-                            retail_price_text=str(retail_price_float),
-                            item_index=i,
-                            total_items_on_page=len(sections)
-                        )
-                        
-                    except Exception as e:
-                        continue
-                
-                page += 1
-                time.sleep(0.5)
-                
-            except Exception as e:
-                print(f"Error fetching page {page}: {e}")
-                traceback.print_exc()
+            new_links = [link for link in links if link not in seen_links]
+            seen_links.update(new_links)
+            print(f"New links added: {len(new_links)}")
+            repeats_listed = listed.issuperset(links)
+            listed.update(links)
+            if not new_links and repeats_listed:
+                print("No new links, ending")
                 break
+
+            for link in new_links:
+                yield ('link', link)
+
+    def _process_detail_page(self, adapter, link, response, item_index, links_found):
+        try:
+            print(f"\nProcessing product {item_index}/{links_found}")
+            print(f"URL: {link}")
+
+            if isinstance(response, Exception):
+                raise response
+            # Error and rate-limit pages are not lots (and the HTTP cache only ever stores 200s)
+            if response.status_code != 200:
+                raise RuntimeError(f"HTTP {response.status_code}")
+            lot = adapter.extract_detail(response.text)
+            if lot:
+                self.process_lot(adapter, dict(lot, product_url=link), item_index, links_found)
+
+        except Exception as e:
+            self.detail_failures += 1
+            print(f"Error processing product {item_index}: {e}")
+            traceback.print_exc()
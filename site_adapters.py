@@ -0,0 +1,915 @@
+"""
+Site Adapters Module
+Declarative description of every supported auction site.
+
+An adapter says how to reach a site's listing pages (numbered page URLs,
+a "next" link, or custom browser navigation), what to wait for before a
+browser page counts as loaded, and how to turn a page's HTML into lots.
+It never fetches or touches the UI itself: AuctionScraper.crawl() drives
+every adapter through the same engine, so concurrency, politeness,
+caching and instrumentation apply to all sites at once.
+
+A lot is a dict of AuctionScraper.process_item / process_item_no_ai
+arguments: title, product_url, sold_price_text and either
+retail_price_text (direct price sites) or image_url (AI-priced sites),
+plus an optional category. None stands for an item on the page that
+could not be used.
+
+Single-page-app sites can also read lots from the JSON their pages fetch
+(network capture mode, see network_capture.py): api_url_pattern picks the
+responses and parse_api_record() turns each lot record found in them into
+the same lot dict.
+
+Browser sites read their pages in place (in-page extraction): the adapter's
+extract_script runs inside the page through execute_script and returns
+only the raw text of each lot's fields, which lot_from_fields() turns into
+a lot exactly as the HTML parser does, so the page_source string never
+crosses the WebDriver bridge or gets parsed in Python. IN_PAGE_EXTRACTION=0
+goes back to page_source + extract_lots().
+"""
+
+import os
+import re
+import time
+import base64
+from urllib.parse import urlsplit
+
+from page_parser import (
+    make_soup, parse_html, extract_nellis_listing, extract_nellis_detail,
+    extract_bidfta_listing, extract_bidfta_detail
+)
+from page_ready import DEFAULT_MAX_TIMEOUT, wait_until_ready
+from network_capture import find_records, field
+from resource_blocking import DEFAULT_BLOCKED_RESOURCES
+from http_cache import HOUR, DAY
+
+SITE_ADAPTERS = {}
+
+IN_PAGE_EXTRACTION = os.getenv("IN_PAGE_EXTRACTION", "1") != "0"
+
+
+def register_adapter(cls):
+    SITE_ADAPTERS[cls.name] = cls
+    return cls
+
+
+def get_adapter(site, url):
+    """New adapter instance for one run, or None for an unknown site"""
+    cls = SITE_ADAPTERS.get(site)
+    return cls(url) if cls else None
+
+
+def http_sites():
+    return [name for name, cls in SITE_ADAPTERS.items() if not cls.uses_browser]
+
+
+def with_scheme(url):
+    return url if url.startswith("http") else f"https://{url}"
+
+
+def price_number(text):
+    """'$1,234.50 USD' -> '1234.5' style string accepted by process_item_no_ai, or None"""
+    match = re.search(r'\$?([\d,]+\.?\d*)', text)
+    return str(float(match.group(1).replace(',', ''))) if match else None
+
+
+class SiteAdapter:
+    name = None
+    uses_browser = False
+    # "numbered": page_url(page); "next_link": first_url + extract_page's next URL;
+    # "custom": load_pages() navigates the browser itself
+    pagination = "numbered"
+    # Listing pages may load on several browsers at once (only for numbered browser sites)
+    parallel_pages = False
+    ready_selector = None
+    ready_timeout = DEFAULT_MAX_TIMEOUT
+    # Listing pages only yield product links; each lot comes from extract_detail() on its page
+    detail_pages = False
+    # Listing lots lack this field; it is read from each lot's own page with extract_detail()
+    detail_field = None
+    detail_ready_selector = None
+    detail_ready_timeout = 10
+    # Seconds a page stays fresh when the HTTP cache is on (None = never cached)
+    listing_cache_ttl = None
+    detail_cache_ttl = None
+    # Network capture: JSON responses whose URL matches this regex carry the listing's lots
+    api_url_pattern = None
+    # Keys every lot record in those responses has (records may sit anywhere in the JSON)
+    api_record_keys = ()
+    # In-page extraction: JS returning one object of raw field texts (or null) per lot
+    extract_script = None
+    # Same for a product page: JS returning the detail fields or null
+    detail_script = None
+    in_page = IN_PAGE_EXTRACTION
+    # Browser resources the site's pages never load (resource_blocking categories) and extra URL patterns
+    blocked_resources = DEFAULT_BLOCKED_RESOURCES
+    blocked_urls = ()
+
+    def __init__(self, url):
+        self.url = url
+
+    def is_listing_url(self, url):
+        return True
+
+    def cache_ttl(self, url):
+        return self.listing_cache_ttl if self.is_listing_url(url) else self.detail_cache_ttl
+
+    def page_url(self, page):
+        """URL of numbered page `page` (as typed in the UI), or None past the last page"""
+        raise NotImplementedError
+
+    def first_url(self):
+        return self.url
+
+    def extract_lots(self, html, page):
+        """Lots on a listing page (product URLs when detail_pages is set); empty ends the crawl"""
+        raise NotImplementedError
+
+    def extract_page(self, html, page, current_url):
+        """(lots, next page URL or None) for next_link pagination"""
+        return self.extract_lots(html, page), None
+
+    def extract_detail(self, html):
+        """Lot fields found on a product page, or None"""
+        return None
+
+    def lot_from_fields(self, fields):
+        """Lot dict from the raw field texts of one item (shared by the HTML parser and extract_script)"""
+        raise NotImplementedError
+
+    def read_page(self, driver, page, current_url=None):
+        """
+        (lots, next page URL) of the page the browser shows: extract_script
+        inside the page when in-page extraction is on, else page_source
+        through extract_page(). A script that fails switches this adapter
+        back to page_source for the rest of the run.
+        """
+        if self.in_page and self.extract_script:
+            try:
+                return self.page_from_script(driver.execute_script(self.extract_script), page, current_url)
+            except Exception as e:
+                print(f"{self.name} in-page extraction failed, parsing page_source instead: {e}")
+                self.in_page = False
+        return self.extract_page(driver.page_source, page, current_url)
+
+    def page_from_script(self, result, page, current_url):
+        """(lots, next URL) from extract_script's result: by default a list of field objects"""
+        return [self.lot_from_fields(fields) if fields else None for fields in result or []], None
+
+    def read_detail(self, driver):
+        """Detail fields of the product page the browser shows (detail_script in the page, or page_source)"""
+        if self.in_page and self.detail_script:
+            try:
+                return driver.execute_script(self.detail_script)
+            except Exception as e:
+                print(f"{self.name} in-page detail extraction failed, parsing page_source instead: {e}")
+                self.in_page = False
+        return self.extract_detail(driver.page_source)
+
+    def extract_api_lots(self, responses, page):
+        """Lots in a page's captured (url, JSON body) responses; empty falls back to the page HTML"""
+        lots = []
+        for url, body in responses:
+            for record in find_records(body, self.api_record_keys):
+                try:
+                    lots.append(self.parse_api_record(record))
+                except (TypeError, ValueError):
+                    lots.append(None)
+        return lots
+
+    def parse_api_record(self, record):
+        """Lot dict for one API lot record, or None"""
+        raise NotImplementedError
+
+    def load_pages(self, driver, start_page, last_page, is_running, resume=None):
+        """
+        For custom pagination: drive the browser and yield (page, read_lots) per
+        listing page, where read_lots() returns the page's lots (call it before
+        advancing the generator - the browser moves on to the next page).
+        resume is the checkpoint cursor of an interrupted run (page, last_lot, ...) or None.
+        """
+        raise NotImplementedError
+
+
+# === Browser sites ===
+
+@register_adapter
+class HiBidAdapter(SiteAdapter):
+    name = "HiBid"
+    uses_browser = True
+    parallel_pages = True
+    ready_selector = "h2.lot-title"
+    # Lot tiles come from the site's GraphQL lot search
+    api_url_pattern = r"/graphql"
+    api_record_keys = ('lead', 'lotState')
+    # Tiles without a realized price are left out, the rest give title / href / image / price
+    extract_script = """
+        return Array.from(document.querySelectorAll('app-lot-tile')).flatMap(tile => {
+            const price = tile.querySelector('strong.lot-price-realized');
+            if (!price) return [];
+            const title = tile.querySelector('h2.lot-title');
+            const link = tile.querySelector('a');
+            const img = tile.querySelector('img[class="lot-thumbnail img-fluid"]');
+            if (!(title && link && img)) return [null];
+            return [{title: title.textContent, href: link.getAttribute('href'),
+                     image: img.getAttribute('src'), price: price.textContent}];
+        });
+    """
+
+    def __init__(self, url):
+        super().__init__(url)
+        self.base_url = url.split("/catalog")[0]
+
+    def page_url(self, page):
+        return f"{self.url}{'&' if '?' in self.url else '?'}apage={page}"
+
+    def extract_lots(self, html, page):
+        lots = []
+        for p in make_soup(html, "HiBid").find_all("app-lot-tile"):
+            price_tag = p.find("strong", class_="lot-price-realized")
+            if not price_tag:
+                continue
+            title_tag = p.find("h2", class_="lot-title")
+            link_tag = p.find("a")
+            img_tag = p.find("img", class_="lot-thumbnail img-fluid")
+            if all([title_tag, link_tag, img_tag]):
+                lots.append(self.lot_from_fields({
+                    'title': title_tag.text, 'href': link_tag.get("href"), 'image': img_tag['src'], 'price': price_tag.text
+                }))
+            else:
+                lots.append(None)
+        return lots
+
+    def lot_from_fields(self, fields):
+        return {
+            'title': fields['title'].strip(),
+            'product_url': self.base_url + fields['href'],
+            'image_url': fields['image'],
+            'sold_price_text': fields['price']
+        }
+
+    def parse_api_record(self, record):
+        sold_price = field(record, 'lotState.priceRealized')
+        lot_id = field(record, 'id', 'itemId')
+        image_url = field(record, 'featuredPicture.thumbnailLocation', 'featuredPicture.fullSizeLocation')
+        if not sold_price or not lot_id or not image_url:
+            return None
+        return {
+            'title': str(field(record, 'lead', 'description')).strip(),
+            'product_url': f"{self.base_url}/lot/{lot_id}",
+            'image_url': image_url,
+            'sold_price_text': str(sold_price)
+        }
+
+
+@register_adapter
+class BiddingKingsAdapter(SiteAdapter):
+    name = "BiddingKings"
+    uses_browser = True
+    ready_selector = "div[class*='lot-repeater-index']"
+    detail_field = 'sold_price_text'
+    detail_ready_selector = "span.sold-amount"
+    base_url = "https://auctions.biddingkings.com"
+    extract_script = """
+        return Array.from(document.querySelectorAll("div[class*='lot-repeater-index']")).map(item => {
+            const link = item.querySelector('a');
+            const img = item.querySelector('img');
+            if (!(link && img)) return null;
+            return {title: link.textContent, href: link.getAttribute('href'), image: img.getAttribute('ng-src')};
+        });
+    """
+    detail_script = """
+        const price = document.querySelector('span.sold-amount');
+        return price ? {sold_price_text: price.textContent} : null;
+    """
+
+    def page_url(self, page):
+        return f"{self.url}?page={page}"
+
+    def extract_lots(self, html, page):
+        lots = []
+        for p in make_soup(html, "BiddingKings").find_all("div", class_=re.compile(r'lot-repeater-index')):
+            link_tag = p.find("a")
+            img_tag = p.find("img")
+            if link_tag and img_tag:
+                lots.append(self.lot_from_fields({
+                    'title': link_tag.text, 'href': link_tag.get("href"), 'image': img_tag.get('ng-src')
+                }))
+            else:
+                lots.append(None)
+        return lots
+
+    def lot_from_fields(self, fields):
+        return {
+            'title': fields['title'].strip(),
+            'product_url': self.base_url + fields['href'],
+            'image_url': fields['image']
+        }
+
+    def extract_detail(self, html):
+        price_tag = make_soup(html, "BiddingKings detail").find("span", class_="sold-amount")
+        return {'sold_price_text': price_tag.text} if price_tag else None
+
+
+@register_adapter
+class BidLlamaAdapter(SiteAdapter):
+    name = "BidLlama"
+    uses_browser = True
+    ready_selector = "p.item-lot-number"
+    base_url = "https://bid.bidllama.com"
+    # null when the item grid is missing
+    extract_script = """
+        const grid = document.querySelector('div[class="item-row grid"]');
+        if (!grid) return null;
+        return Array.from(grid.children).filter(item => item.tagName === 'DIV').map(item => {
+            const title = item.querySelector('p.item-title');
+            const imageBox = item.querySelector('p.item-image');
+            const price = item.querySelector('p.item-current-bid');
+            const link = imageBox && imageBox.querySelector('a');
+            const img = imageBox && imageBox.querySelector('img');
+            if (!(title && price && link && img)) return null;
+            return {title: title.textContent, href: link.getAttribute('href'),
+                    image: img.getAttribute('src') || '', price: price.textContent};
+        });
+    """
+    # Pages reachable from the starting URL (the page number lives in a base64 URL fragment)
+    max_pages = 500
+
+    def page_url(self, page):
+        if page > self.max_pages:
+            return None
+        if "#" not in self.url:
+            return self.url if page == 1 else None
+        base_url, encoded_fragment = self.url.split("#", 1)
+        padding = "=" * (4 - len(encoded_fragment) % 4)
+        try:
+            decoded = base64.b64decode(encoded_fragment + padding).decode()
+            current_page = int(re.search(r'page=(\d+)', decoded).group(1))
+        except Exception:
+            return self.url if page == 1 else None
+        new_decoded = re.sub(r'page=\d+', f'page={current_page + page - 1}', decoded)
+        return base_url + "#" + base64.b64encode(new_decoded.encode()).decode().rstrip("=")
+
+    def extract_lots(self, html, page):
+        item_container = make_soup(html, "BidLlama").find("div", class_="item-row grid")
+        if not item_container:
+            print("No item container found")
+            return []
+
+        lots = []
+        for p in item_container.find_all("div", recursive=False):
+            title_tag = p.find("p", class_="item-title")
+            img_container = p.find("p", class_="item-image")
+            price_tag = p.find("p", class_="item-current-bid")
+            link_tag = img_container.find("a") if img_container else None
+            img_tag = img_container.find("img") if img_container else None
+            if title_tag and price_tag and link_tag and img_tag:
+                lots.append(self.lot_from_fields({
+                    'title': title_tag.text, 'href': link_tag.get("href"), 'image': img_tag.get('src', ''), 'price': price_tag.text
+                }))
+            else:
+                lots.append(None)
+        return lots
+
+    def page_from_script(self, result, page, current_url):
+        if result is None:
+            print("No item container found")
+        return super().page_from_script(result, page, current_url)
+
+    def lot_from_fields(self, fields):
+        image_url = fields['image']
+        if not image_url.startswith('http'):
+            image_url = "https:" + image_url
+        return {
+            'title': fields['title'].strip(),
+            'product_url': self.base_url + fields['href'],
+            'image_url': image_url,
+            'sold_price_text': fields['price']
+        }
+
+
+@register_adapter
+class MacBidAdapter(SiteAdapter):
+    name = "MAC.bid"
+    uses_browser = True
+    pagination = "custom"
+    base_url = "https://www.mac.bid"
+    product_class = "d-block w-100 border-bottom"
+    # Called with the number of products already read: returns the product count, whether
+    # more are still loading, and the fields of only the products added since then
+    scroll_script = """
+        const products = document.querySelectorAll('div[class="d-block w-100 border-bottom"]');
+        const lots = Array.from(products).slice(arguments[0]).map(product => {
+            const badge = product.querySelector('p[class="badge badge-success"]');
+            if (!badge) return null;
+            const title = product.querySelector('p');
+            const retail = product.querySelector('p.font-size-sm');
+            const link = product.querySelector('a');
+            return {title: title.textContent, href: link ? link.getAttribute('href') : null,
+                    sold: badge.textContent, retail: retail ? retail.textContent : null};
+        });
+        return {count: products.length, loading: !!document.querySelector('div.spinner-grow'), lots: lots};
+    """
+
+    def load_pages(self, driver, start_page, last_page, is_running, resume=None):
+        """
+        One infinite-scroll page: keep scrolling until the product count stops
+        growing (resumed runs rescroll; saved lots are skipped). With in-page
+        extraction each scroll step reads only the products it added.
+        """
+        current_url = with_scheme(self.url)
+        print(f"Navigating to: {current_url}")
+        driver.get(current_url)
+
+        lots = []
+        prev_product_count = 0
+        print("Scrolling to load all products...")
+        while is_running():
+            if self.in_page:
+                try:
+                    state = driver.execute_script(self.scroll_script, len(lots))
+                except Exception as e:
+                    print(f"MAC.bid in-page extraction failed, parsing page_source instead: {e}")
+                    self.in_page = False
+                    continue
+                lots.extend(self.read_product(n, fields) for n, fields in enumerate(state['lots'], len(lots) + 1))
+                product_count, loading, html = state['count'], state['loading'], None
+            else:
+                html = driver.page_source
+                soup = make_soup(html)
+                product_count = len(soup.find_all("div", class_=self.product_class))
+                loading = soup.find("div", class_="spinner-grow") is not None
+            print(f"Current product count: {product_count}")
+
+            if product_count != prev_product_count:
+                prev_product_count = product_count
+                driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+                time.sleep(1)
+            elif not loading:
+                print(f"All products loaded: {product_count}")
+                if html is None:
+                    yield start_page, lambda: lots
+                else:
+                    yield start_page, lambda: self.extract_lots(html, start_page)
+                return
+            else:
+                print("Still loading...")
+                time.sleep(2)
+
+    def extract_lots(self, html, page):
+        lots = []
+        for n, product in enumerate(make_soup(html).find_all("div", class_=self.product_class), 1):
+            badge = product.find("p", class_="badge badge-success")
+            if badge is None:
+                lots.append(None)
+                continue
+            title_tag = product.find("p")
+            retail_tag = product.find("p", class_="font-size-sm")
+            link_tag = product.find("a")
+            lots.append(self.read_product(n, {
+                'title': title_tag.text, 'href': link_tag.get("href") if link_tag else None,
+                'sold': badge.text, 'retail': retail_tag.text if retail_tag else None
+            }))
+        return lots
+
+    def read_product(self, n, fields):
+        if not fields:
+            return None
+        try:
+            return self.lot_from_fields(fields)
+        except Exception as e:
+            print(f"Error processing product {n}: {e}")
+            return None
+
+    def lot_from_fields(self, fields):
+        return {
+            'title': fields['title'].strip(),
+            'product_url': self.base_url + fields['href'] if fields['href'] else "",
+            'sold_price_text': fields['sold'].replace("Won for $", "").strip(),
+            'retail_price_text': fields['retail'].replace("Retails for $", "").strip()
+        }
+
+
+@register_adapter
+class VistaAdapter(SiteAdapter):
+    name = "Vista"
+    uses_browser = True
+    parallel_pages = True
+    ready_selector = "section"
+    ready_timeout = 15
+    vista_base_url = "https://vistaauction.com"
+    extract_script = """
+        const text = element => element ? element.textContent : null;
+        return Array.from(document.querySelectorAll('section')).map(section => {
+            const subtitle = section.querySelector('h3.subtitle');
+            const link = subtitle && subtitle.querySelector('a');
+            return {title: text(section.querySelector('h2[class="title inlinebidding"]')), subtitle: text(subtitle),
+                    href: link ? link.getAttribute('href') : null, sold: text(section.querySelector('span.NumberPart'))};
+        });
+    """
+
+    def page_url(self, page):
+        # Vista numbers pages from 0
+        return f"{self.url.split('?')[0]}?page={page - 1}"
+
+    def extract_lots(self, html, page):
+        sections = make_soup(html, "Vista").find_all("section")
+        print(f"Found {len(sections)} sections")
+        lots = []
+        for section in sections:
+            try:
+                lots.append(self.parse_section(section))
+            except Exception:
+                lots.append(None)
+        return lots
+
+    def parse_section(self, section):
+        title_elem = section.find("h2", class_="title inlinebidding")
+        subtitle = section.find("h3", class_="subtitle")
+        link_tag = subtitle.find("a") if subtitle else None
+        sold_price_elem = section.find("span", class_="NumberPart")
+        return self.lot_from_fields({
+            'title': title_elem.text if title_elem else None,
+            'subtitle': subtitle.text if subtitle else None,
+            'href': link_tag.get("href") if link_tag else None,
+            'sold': sold_price_elem.text if sold_price_elem else None
+        })
+
+    def page_from_script(self, result, page, current_url):
+        print(f"Found {len(result)} sections")
+        lots = []
+        for fields in result:
+            try:
+                lots.append(self.lot_from_fields(fields))
+            except Exception:
+                lots.append(None)
+        return lots, None
+
+    def lot_from_fields(self, fields):
+        if fields['title'] is None or fields['subtitle'] is None or fields['sold'] is None:
+            return None
+        title = re.sub(r'^Lot \d+\s*-\s*', '', fields['title'].strip()).strip()
+
+        link_href = fields['href']
+        if link_href and not link_href.startswith("http"):
+            linker = self.vista_base_url + link_href
+        else:
+            linker = link_href if link_href else "N/A"
+
+        sold_price = price_number(fields['sold'].strip())
+        retail_price = price_number(fields['subtitle'].strip())
+        if sold_price is None or retail_price is None:
+            return None
+
+        return {
+            'title': title,
+            'product_url': linker,
+            'sold_price_text': sold_price,
+            'retail_price_text': retail_price
+        }
+
+
+@register_adapter
+class BidSofloAdapter(SiteAdapter):
+    name = "BidSoflo"
+    uses_browser = True
+    pagination = "next_link"
+    ready_selector = "div.row.mr-1"
+    ready_timeout = 15
+    base_url = "https://bid.bidsoflo.us"
+    # next is the data-url of the "next" pagination link (false when the link is missing)
+    extract_script = """
+        let next = null;
+        for (const item of document.querySelectorAll('li.page-item')) {
+            if (item.textContent.toLowerCase().includes('next')) {
+                const link = item.querySelector('a.page-link');
+                next = link ? link.getAttribute('data-url') : false;
+            }
+        }
+        const lots = Array.from(document.querySelectorAll('div[class="row mr-1"]')).map(product => {
+            const tool = product.querySelector('div.tooltip-demos');
+            const finalBid = product.querySelector('div[class="font-bold text-body"]');
+            const link = product.querySelector('a');
+            return {fields: tool ? Array.from(tool.children).filter(el => el.tagName === 'DIV').map(el => el.textContent) : null,
+                    final_bid: finalBid ? finalBid.textContent : null, href: link ? link.getAttribute('href') : null};
+        });
+        return {next: next, lots: lots};
+    """
+
+    def extract_page(self, html, page, current_url):
+        soup = make_soup(html)
+
+        next_data_url = None
+        for pa in soup.find_all("li", class_="page-item"):
+            if "next" in pa.text.lower():
+                link = pa.find("a", class_="page-link")
+                next_data_url = link["data-url"] if link is not None else None
+
+        lots = [self.parse_product(p) for p in soup.find_all("div", class_="row mr-1")]
+        return lots, self.next_url(next_data_url, current_url)
+
+    def page_from_script(self, result, page, current_url):
+        lots = [self.lot_from_fields(fields) for fields in result['lots']]
+        return lots, self.next_url(result['next'] or None, current_url)
+
+    def next_url(self, next_data_url, current_url):
+        if not next_data_url:
+            return None
+        next_page = next_data_url.split("page=")[-1]
+        next_url = current_url.replace(current_url.split("=")[-1], next_page)
+        print(f"Next page found: {next_url}")
+        return next_url
+
+    def parse_product(self, p):
+        tool = p.find("div", class_="tooltip-demos")
+        final_bid = p.find("div", class_="font-bold text-body")
+        link_tag = p.find("a")
+        return self.lot_from_fields({
+            'fields': [xi.text for xi in tool.find_all("div", recursive=False)] if tool is not None else None,
+            'final_bid': final_bid.text if final_bid is not None else None,
+            'href': link_tag.get("href") if link_tag else None
+        })
+
+    def lot_from_fields(self, fields):
+        try:
+            if fields['fields'] is None:
+                return None
+            title = next((text.replace("Item Description", "").strip()
+                          for text in fields['fields'] if "Item Description" in text), None)
+            retail_price = next((text.replace("Retail Cost:", "").replace("$", "").strip()
+                                 for text in fields['fields'] if "Retail Cost:" in text), None)
+            final_bid = fields['final_bid']
+            if not title or not retail_price or final_bid is None or "Final Bid :" not in final_bid:
+                return None
+            sold_price = final_bid.replace("Final Bid :", "").replace("$", "").strip()
+
+            sold_price_float = float(sold_price.replace(",", ""))
+            retail_price_float = float(retail_price.replace(",", ""))
+            return {
+                'title': title,
+                'product_url': self.base_url + fields['href'] if fields['href'] else "N/A",
+                'sold_price_text': str(sold_price_float),
+                'retail_price_text': str(retail_price_float)
+            }
+        except Exception as e:
+            print(f"Error processing item: {e}")
+            return None
+
+
+@register_adapter
+class BidAuctionDepotAdapter(SiteAdapter):
+    name = "BidAuctionDepot"
+    uses_browser = True
+    pagination = "custom"
+    ready_selector = 'div[class*="card grid-card a gallery auction"]'
+    ready_timeout = 25
+    base_url = "https://bidauctiondepot.com/productView/"
+    extract_script = """
+        const text = element => element ? element.textContent : null;
+        return Array.from(document.querySelectorAll('div[class*="card grid-card a gallery auction"]')).map(card => ({
+            title: text(card.querySelector('h5')), retail: text(card.querySelector('h6.galleryPrice.rtlrPrice')),
+            sold: text(card.querySelector('span.curBidAmtt')), id: card.getAttribute('id')
+        }));
+    """
+
+    def load_pages(self, driver, start_page, last_page, is_running, resume=None):
+        """
+        Click-driven pagination: the next page replaces the cards in place.
+        There are no page URLs, so a resumed run clicks through the pages it
+        already has, stopping early if the last saved lot shows up sooner.
+        """
+        from selenium.webdriver.common.by import By
+        from selenium.common.exceptions import NoSuchElementException
+
+        print(f"Navigating to: {self.url}")
+        driver.get(self.url)
+        previous_card = None
+        page = start_page
+        skip_through = None
+        last_lot_id = None
+        if resume and resume.get('page') is not None:
+            page = resume['start_page']
+            skip_through = resume['page']
+            if resume.get('last_lot'):
+                last_lot_id = "lot-" + resume['last_lot'].replace(self.base_url, "")
+            print(f"Resuming: clicking through to page {skip_through + 1}")
+
+        while is_running():
+            print("Waiting for product cards...")
+            if not wait_until_ready(driver, self.name, self.ready_selector,
+                                    max_timeout=self.ready_timeout, stale_element=previous_card):
+                print("Timeout waiting for products")
+            if skip_through is not None and page <= skip_through:
+                if last_lot_id and driver.execute_script("return !!document.getElementById(arguments[0]);", last_lot_id):
+                    # Lots shifted since the checkpoint: the next page is the first unsaved one
+                    skip_through = page
+                print(f"Skipping page {page} (already saved)")
+            else:
+                yield page, lambda: self.read_page(driver, page)[0]
+
+            if last_page and page >= last_page:
+                return
+            try:
+                print("Looking for next page button...")
+                next_button = driver.find_element(By.CSS_SELECTOR, "a[aria-label='Go to next page']")
+            except NoSuchElementException:
+                print("Next button not found")
+                return
+            print("Clicking next page")
+            previous_card = driver.find_element(By.CSS_SELECTOR, self.ready_selector)
+            next_button.click()
+            page += 1
+
+    def extract_lots(self, html, page):
+        products = make_soup(html).find_all('div', class_=lambda c: c and "card grid-card a gallery auction" in c)
+        return [self.parse_card(p) for p in products]
+
+    def parse_card(self, p):
+        title_elem = p.find("h5")
+        retail_price_elem = p.select_one("h6.galleryPrice.rtlrPrice")
+        sold_price_elem = p.find("span", class_="curBidAmtt")
+        return self.lot_from_fields({
+            'title': title_elem.text if title_elem else None,
+            'retail': retail_price_elem.text if retail_price_elem else None,
+            'sold': sold_price_elem.text if sold_price_elem else None,
+            'id': p.get("id")
+        })
+
+    def lot_from_fields(self, fields):
+        if not (fields['title'] is not None and fields['retail'] is not None and fields['sold'] is not None and fields['id']):
+            return None
+        try:
+            retail_price_float = float(fields['retail'].replace("Retail Price:", "").replace("$", "").replace(",", "").strip())
+            sold_price_float = float(fields['sold'].replace("Current Bid:", "").replace("$", "").replace(",", "").strip())
+        except ValueError:
+            return None
+        return {
+            'title': fields['title'].strip(),
+            'product_url': self.base_url + fields['id'].replace("lot-", ""),
+            'sold_price_text': str(sold_price_float),
+            'retail_price_text': str(retail_price_float)
+        }
+
+
+# === HTTP sites ===
+
+@register_adapter
+class NellisAdapter(SiteAdapter):
+    name = "Nellis"
+    pagination = "next_link"
+    detail_pages = True
+    base_url = "https://www.nellisauction.com"
+    listing_cache_ttl = HOUR
+    # Closed lots do not change
+    detail_cache_ttl = 7 * DAY
+
+    def is_listing_url(self, url):
+        return "/p/" not in urlsplit(url).path
+
+    def first_url(self):
+        return with_scheme(self.url)
+
+    def extract_page(self, html, page, current_url):
+        hrefs, next_page = extract_nellis_listing(parse_html(html, self.name, "Nellis listing"), page)
+        if not next_page:
+            print("No next page link found")
+        return [self.base_url + href for href in hrefs], (self.base_url + next_page if next_page else None)
+
+    def extract_detail(self, html):
+        return extract_nellis_detail(parse_html(html, self.name))
+
+
+@register_adapter
+class BidFTAAdapter(SiteAdapter):
+    name = "BidFTA"
+    detail_pages = True
+    base_url = "https://www.bidfta.com"
+    listing_cache_ttl = HOUR
+    detail_cache_ttl = DAY
+
+    def __init__(self, url):
+        super().__init__(url)
+        parts = with_scheme(url).split("/")
+        if parts and parts[-1].isdigit():
+            del parts[-1]
+        self.listing_url = "/".join(parts)
+
+    def is_listing_url(self, url):
+        return url.startswith(self.listing_url + "/") and url.rsplit("/", 1)[-1].isdigit()
+
+    def page_url(self, page):
+        return f"{self.listing_url}/{page}"
+
+    def extract_lots(self, html, page):
+        hrefs = extract_bidfta_listing(parse_html(html, self.name))
+        if hrefs is None:
+            print("No product grid found")
+            return []
+        return [self.base_url + href for href in hrefs]
+
+    def extract_detail(self, html):
+        return extract_bidfta_detail(parse_html(html, self.name))
+
+
+@register_adapter
+class AStockAdapter(SiteAdapter):
+    name = "A-Stock"
+    listing_cache_ttl = HOUR
+
+    def page_url(self, page):
+        return f"{self.url.split('?')[0]}?page={page}"
+
+    def extract_lots(self, html, page):
+        sections = make_soup(html, self.name).find_all("section")
+        print(f"Found {len(sections)} sections")
+        return [self.parse_section(section) for section in sections]
+
+    def parse_section(self, section):
+        try:
+            title_elem = section.find("h2", class_="title inlinebidding")
+            if not title_elem:
+                return None
+            link_tag = title_elem.find("a")
+            linker = "https://a-stock.bid" + link_tag.get("href") if link_tag else "N/A"
+            if "-" in title_elem.text:
+                title = title_elem.text.split("-", 1)[1].strip()
+            else:
+                title = title_elem.text.strip()
+
+            sold_price_elem = section.find("p", class_="bids")
+            retail_price_elem = section.find("div", class_="listing-auction-row-retail-value")
+            if not sold_price_elem or not retail_price_elem:
+                return None
+            sold_price_float = float(re.sub(r"[^\d.]", "", sold_price_elem.text.strip()))
+            retail_price_float = float(re.sub(r"[^\d.]", "", retail_price_elem.text.strip()))
+            return {
+                'title': title,
+                'product_url': linker,
+                'sold_price_text': str(sold_price_float),
+                'retail_price_text': str(retail_price_float)
+            }
+        except Exception as e:
+            print(f"Error processing item: {e}")
+            return None
+
+
+@register_adapter
+class Auctions702Adapter(SiteAdapter):
+    name = "702Auctions"
+    auction_base_url = "https://bid.702auctions.com"
+    # Listing is filtered to completed auctions, which never change
+    listing_cache_ttl = 7 * DAY
+
+    def __init__(self, url):
+        super().__init__(url)
+        self.base_url = url
+        if "ViewStyle=list" not in url:
+            parts = url.replace("https://", "").split("/")
+            del parts[-1]
+            self.base_url = "https://" + "/".join(parts)
+
+    def page_url(self, page):
+        # 702Auctions numbers pages from 0
+        return f"{self.base_url}/?ViewStyle=list&StatusFilter=completed_only&SortFilterOptions=0&page={page - 1}"
+
+    def extract_lots(self, html, page):
+        sections = make_soup(html, self.name).find_all("section")
+        print(f"Found {len(sections)} sections")
+        return [self.parse_section(section) for section in sections]
+
+    def parse_section(self, section):
+        try:
+            title_elem = section.find("h2", class_="title inlinebidding")
+            if not title_elem:
+                return None
+
+            subtitle = section.find("h3", class_="subtitle")
+            linker = "N/A"
+            link_tag = subtitle.find("a") if subtitle else None
+            if link_tag:
+                link_href = link_tag.get("href")
+                if link_href and not link_href.startswith("http"):
+                    linker = self.auction_base_url + link_href
+                else:
+                    linker = link_href if link_href else "N/A"
+
+            if "-" in title_elem.text:
+                title = title_elem.text.split("-", 1)[1].strip()
+            else:
+                title = title_elem.text.strip()
+
+            sold_price_elem = section.find("span", class_="NumberPart")
+            if not sold_price_elem or not subtitle:
+                return None
+            sold_price = price_number(sold_price_elem.text.strip())
+            retail_price = price_number(subtitle.text.strip())
+            if sold_price is None or retail_price is None:
+                return None
+            return {
+                'title': title,
+                'product_url': linker,
+                'sold_price_text': sold_price,
+                'retail_price_text': retail_price
+            }
+        except Exception:
+            return None